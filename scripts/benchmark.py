@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+
+# benchmark.py - microbenchmarks of performance sensitive functions
+#
+# Copyright (C) 2026 Arthur de Jong
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301 USA
+
+"""This script runs microbenchmarks of performance sensitive functions of
+the stdnum package against the straightforward implementations that they
+replaced. The names of the benchmarks to run can be passed on the command
+line (all benchmarks are run by default)."""
+
+import random
+import re
+import subprocess
+import sys
+import timeit
+
+from stdnum import detect, ean, iban, isbn, isin, luhn, util
+from stdnum.br import cpf
+from stdnum.eu import vat
+from stdnum.exceptions import InvalidFormat, ValidationError
+from stdnum.iso7064 import mod_37_2, mod_37_36, mod_97_10
+
+
+def measure(function, *args):
+    """Return the time in microseconds of a single call of the function."""
+    timer = timeit.Timer(lambda: function(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def compare(description, reference, function, *args):
+    """Print the times of calls to the reference and new function."""
+    assert reference(*args) == function(*args)
+    before = measure(reference, *args)
+    after = measure(function, *args)
+    print('%-44s %8.2f us %8.2f us %6.1fx' % (
+        description, before, after, before / after))
+
+
+def clean_reference(number, deletechars=''):
+    """Remove the characters like util.clean() did before."""
+    try:
+        number = ''.join(x for x in number)
+    except Exception:  # noqa: B902
+        raise InvalidFormat()
+    number = ''.join(util._char_map.get(x, x) for x in number)
+    return ''.join(x for x in number if x not in deletechars)
+
+
+def benchmark_clean():
+    """Benchmark util.clean()."""
+    for number, deletechars in (
+            ('123456789', ' -'),
+            ('123-456-789', ' -'),
+            ('NL 1234.56.789.B01', ' -.'),
+            ('DE 136,695 976', ' -./,'),
+            ('123–456—789', ' -'),
+            ('１２３ ４５６', ' ')):
+        compare(
+            'clean(%r, %r)' % (number, deletechars),
+            clean_reference, util.clean, number, deletechars)
+
+
+def luhn_reference(number, alphabet='0123456789'):
+    """Calculate the Luhn checksum like luhn.checksum() did before."""
+    n = len(alphabet)
+    number = tuple(alphabet.index(i)
+                   for i in reversed(str(number)))
+    return (sum(number[::2]) +
+            sum(sum(divmod(i * 2, n))
+                for i in number[1::2])) % n
+
+
+def benchmark_luhn():
+    """Benchmark luhn.checksum()."""
+    for number, alphabet in (
+            ('4111111111111111', '0123456789'),
+            ('490154203237518', '0123456789'),
+            ('3984382462386423786', '0123456789'),
+            ('A0000000123456', '0123456789ABCDEF'),
+            ('SOMEBASE36NUMBERZ', '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ')):
+        compare(
+            'luhn.checksum(%r)' % number if alphabet == '0123456789' else
+            'luhn.checksum(%r, <%d>)' % (number, len(alphabet)),
+            luhn_reference, luhn.checksum, number, alphabet)
+
+
+def mod_37_2_reference(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ*'):
+    """Calculate the checksum like mod_37_2.checksum() did before."""
+    modulus = len(alphabet)
+    check = 0
+    for n in (alphabet.index(n) for n in number):
+        check = (2 * check + n) % modulus
+    return check
+
+
+def mod_37_36_reference(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
+    """Calculate the checksum like mod_37_36.checksum() did before."""
+    modulus = len(alphabet)
+    check = modulus // 2
+    for n in (alphabet.index(n) for n in number):
+        check = (((check or modulus) * 2) % (modulus + 1) + n) % modulus
+    return check
+
+
+def benchmark_mod_37():
+    """Benchmark mod_37_2.checksum() and mod_37_36.checksum()."""
+    compare(
+        'mod_37_2.checksum(%r)' % '000000012095650X',
+        mod_37_2_reference, mod_37_2.checksum, '000000012095650X')
+    compare(
+        'mod_37_2.checksum(%r, <11>)' % '0000000121032683',
+        mod_37_2_reference, mod_37_2.checksum, '0000000121032683', '0123456789X')
+    compare(
+        'mod_37_36.checksum(%r)' % 'A12425GABC1234002M',
+        mod_37_36_reference, mod_37_36.checksum, 'A12425GABC1234002M')
+    compare(
+        'mod_37_36.checksum(%r)' % '00000000189470000000',
+        mod_37_36_reference, mod_37_36.checksum, '00000000189470000000')
+
+
+def mod_97_10_reference(number):
+    """Calculate the checksum like mod_97_10.checksum() did before."""
+    return int(''.join(str(int(x, 36)) for x in number)) % 97
+
+
+def benchmark_mod_97_10():
+    """Benchmark mod_97_10.checksum()."""
+    for number in (
+            'WEST12345698765432GB82',
+            '5493001KJTIIGC8Y1R12',
+            '539007547034RF18',
+            '2085206612345678901201'):
+        compare(
+            'mod_97_10.checksum(%r)' % number,
+            mod_97_10_reference, mod_97_10.checksum, number)
+
+
+def ean_reference(number):
+    """Calculate the check digit like ean.calc_check_digit() did before."""
+    return str((10 - sum((3, 1)[i % 2] * int(n)
+                         for i, n in enumerate(reversed(number)))) % 10)
+
+
+def cpf_reference(number):
+    """Calculate the check digits like cpf._calc_check_digits() did before."""
+    d1 = sum((10 - i) * int(number[i]) for i in range(9))
+    d1 = (11 - d1) % 11 % 10
+    d2 = sum((11 - i) * int(number[i]) for i in range(9)) + 2 * d1
+    d2 = (11 - d2) % 11 % 10
+    return '%d%d' % (d1, d2)
+
+
+def benchmark_weighted():
+    """Benchmark check digit functions that use util.weighted_checksum()."""
+    compare(
+        'ean.calc_check_digit(%r)' % '400638133393',
+        ean_reference, ean.calc_check_digit, '400638133393')
+    compare(
+        'cpf._calc_check_digits(%r)' % '390533447',
+        cpf_reference, cpf._calc_check_digits, '390533447')
+
+
+def isin_reference(number):
+    """Calculate the check digit like isin.calc_check_digit() did before."""
+    number = ''.join(str(isin._alphabet.index(n)) for n in number)
+    number = ''.join(
+        str((2, 1)[i % 2] * int(n)) for i, n in enumerate(reversed(number)))
+    return str((10 - sum(int(n) for n in number)) % 10)
+
+
+def security_master(count):
+    """Generate a list of ISINs like they would appear in a security master
+    file (mostly CUSIP-based US numbers, Eurobonds and SEDOL or WKN-based
+    numbers)."""
+    rnd = random.Random(6166)
+    alphanumeric = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    numbers = []
+    for _ in range(count):
+        kind = rnd.random()
+        if kind < 0.6:
+            number = 'US' + ''.join(rnd.choice(alphanumeric) for _ in range(8)) + str(rnd.randrange(10))
+        elif kind < 0.8:
+            number = 'XS' + '%09d' % rnd.randrange(10 ** 9)
+        elif kind < 0.9:
+            number = 'GB00B' + ''.join(rnd.choice('0123456789BCDFGHJKLMNPQRSTVWXYZ') for _ in range(6))
+        else:
+            number = 'DE000' + ''.join(rnd.choice(alphanumeric) for _ in range(6))
+        numbers.append(number + isin.calc_check_digit(number))
+    return numbers
+
+
+def benchmark_isin():
+    """Benchmark isin.calc_check_digit() and isin.calc_check_digit_many()."""
+    for number in ('US037833100', 'XS013035412', 'GB00BYXJL75'):
+        compare(
+            'isin.calc_check_digit(%r)' % number,
+            isin_reference, isin.calc_check_digit, number)
+    numbers = [number[:-1] for number in security_master(10000)]
+    compare(
+        'isin.calc_check_digit_many(<%d ISINs>)' % len(numbers),
+        lambda numbers: [isin_reference(number) for number in numbers],
+        isin.calc_check_digit_many, numbers)
+    try:
+        import numpy
+    except ImportError:  # NumPy is optional
+        return
+    array = numpy.array(numbers)
+    compare(
+        'isin.calc_check_digit_many(<%d ISINs array>)' % len(numbers),
+        lambda numbers: [isin_reference(number) for number in numbers],
+        lambda numbers: list(isin.calc_check_digit_many(array)), numbers)
+
+
+def is_valid_reference(module, number):
+    """Check the number like the is_valid() functions did before."""
+    try:
+        return bool(module.validate(number))
+    except ValidationError:
+        return False
+
+
+def benchmark_check():
+    """Benchmark is_valid() functions that use check() instead of catching
+    exceptions."""
+    for module, number in (
+            (luhn, '4111111111111112'),
+            (ean, '4006381333932'),
+            (isbn, '978-9024538271'),
+            (isin, 'US0378331004'),
+            (iban, 'GR1601101050000010547023794'),
+            (luhn, '4111111111111111'),
+            (isin, 'US0378331005')):
+        compare(
+            '%s.is_valid(%r)' % (module.__name__[7:], number),
+            is_valid_reference, lambda module, number: module.is_valid(number),
+            module, number)
+
+
+def benchmark_many():
+    """Benchmark util.is_valid_many() for modules with a check_many()
+    function against calling is_valid() for each number."""
+    rnd = random.Random(4242)
+    cards = []
+    for _ in range(10000):
+        number = '4' + ''.join(rnd.choice('0123456789') for _ in range(14))
+        cards.append(number + luhn.calc_check_digit(number))
+    eans = [number[:12] + ean.calc_check_digit(number[:12]) for number in cards]
+    isbns = [
+        '978' + number[3:12] + ean.calc_check_digit('978' + number[3:12]) if i % 2 else
+        number[:9] + isbn._calc_isbn10_check_digit(number[:9])
+        for i, number in enumerate(cards)]
+    ibans = [
+        cc + iban.calc_check_digits(cc + '00' + bban) + bban
+        for cc, bban in (
+            rnd.choice((
+                ('NL', 'ABNA%010d' % rnd.randrange(10 ** 10)),
+                ('GB', 'WEST%014d' % rnd.randrange(10 ** 14)),
+                ('FR', '%023d' % rnd.randrange(10 ** 23))))
+            for _ in range(10000))]
+    for module, numbers in ((luhn, cards), (ean, eans), (isbn, isbns), (iban, ibans)):
+        compare(
+            'is_valid_many(%s, <%d numbers>)' % (module.__name__[7:], len(numbers)),
+            lambda module, numbers: [module.is_valid(number) for number in numbers],
+            util.is_valid_many, module, numbers)
+
+
+def import_time(module):
+    """Return the time in milliseconds of importing the module (and the
+    stdnum package) in a fresh Python interpreter."""
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import %s' % module],
+        stderr=subprocess.PIPE, check=True, universal_newlines=True).stderr
+    # sum the cumulative times of the top-level stdnum imports
+    return sum(
+        int(match.group(1))
+        for match in re.finditer(r'^import time:\s+\d+ \|\s+(\d+) \| (stdnum\S*)$', output, re.MULTILINE)
+    ) / 1000
+
+
+def benchmark_importtime():
+    """Measure the import time of the top-level number modules. The before
+    column is the time of importing the stdnum package (which all modules
+    need) and the after column the time of importing the module."""
+    base = min(import_time('stdnum') for _ in range(5))
+    for entry in util.get_module_registry():
+        if not entry.countries:
+            after = min(import_time(entry.name) for _ in range(5))
+            print('%-44s %8.2f ms %8.2f ms %6.1fx' % (
+                'import %s' % entry.name, base, after, after / base))
+
+
+def detect_reference(number):
+    """Find the modules that accept the number by checking all modules."""
+    return sorted(
+        module.__name__ for module in util.get_number_modules()
+        if module.is_valid(number))
+
+
+def benchmark_detect():
+    """Benchmark stdnum.detect() that only checks the modules that could
+    accept the number."""
+    list(util.get_number_modules())  # import all modules first
+    for number in (
+            'NL91 ABNA 0417 1643 00',
+            '978-9024538270',
+            '4111111111111111',
+            'DE 136,695 976',
+            '123456789',
+            'US0378331005',
+            '5493001KJTIIGC8Y1R12',
+            'hello world'):
+        compare(
+            'detect(%r)' % number,
+            detect_reference,
+            lambda number: sorted(module.__name__ for module in detect(number)),
+            number)
+
+
+def guess_country_reference(number):
+    """Guess the country like eu.vat.guess_country() did before."""
+    return [cc for cc in vat.MEMBER_STATES if vat._get_cc_module(cc).is_valid(number)]
+
+
+def supplier_records(count):
+    """Generate a list of VAT numbers without country code like they would
+    appear in supplier records (mostly numbers with 8 to 12 digits)."""
+    rnd = random.Random(2024)
+    numbers = []
+    for _ in range(count):
+        kind = rnd.random()
+        number = '%0*d' % (rnd.choice((8, 9, 9, 10, 11, 12)), rnd.randrange(10 ** 12))
+        if kind < 0.1:
+            number = number[:9] + 'B' + number[-2:]
+        elif kind < 0.2:
+            number = 'U' + number[:8]
+        elif kind < 0.3:
+            number = '%s %s %s' % (number[:3], number[3:6], number[6:])
+        numbers.append(number)
+    return numbers
+
+
+def benchmark_vat():
+    """Benchmark eu.vat.guess_country() and eu.vat.guess_country_many()."""
+    for number in ('00449544B01', '802070800', 'U 142 43 102', '12345'):
+        compare(
+            'vat.guess_country(%r)' % number,
+            guess_country_reference, vat.guess_country, number)
+    numbers = supplier_records(10000)
+    compare(
+        'vat.guess_country_many(<%d numbers>)' % len(numbers),
+        lambda numbers: [guess_country_reference(number) for number in numbers],
+        vat.guess_country_many, numbers)
+
+
+benchmarks = {
+    'check': benchmark_check,
+    'clean': benchmark_clean,
+    'detect': benchmark_detect,
+    'importtime': benchmark_importtime,
+    'isin': benchmark_isin,
+    'luhn': benchmark_luhn,
+    'many': benchmark_many,
+    'mod_37': benchmark_mod_37,
+    'mod_97_10': benchmark_mod_97_10,
+    'vat': benchmark_vat,
+    'weighted': benchmark_weighted,
+}
+
+
+if __name__ == '__main__':
+    print('%-44s %11s %11s' % ('', 'before', 'after'))
+    for name in sys.argv[1:] or benchmarks:
+        benchmarks[name]()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+# compile_numdb.py - compile the numdb text databases to the binary format
+#
+# Copyright (C) 2026 Arthur de Jong
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301 USA
+
+"""This script compiles the .dat files of the stdnum package (or the files
+passed on the command line) to .ndb files that numdb.get() will memory-map
+instead of parsing the text files. The text files remain the source: a
+compiled file is ignored once it no longer matches its text file."""
+
+import glob
+import os
+import sys
+
+from stdnum import numdb
+
+
+if __name__ == '__main__':
+    sources = sys.argv[1:] or sorted(glob.glob(
+        os.path.join(os.path.dirname(numdb.__file__), '**', '*.dat'), recursive=True))
+    for source in sources:
+        target = os.path.splitext(source)[0] + '.ndb'
+        print('%s -> %s' % (source, target))
+        numdb.compile_file(source, target)
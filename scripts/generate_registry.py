@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+
+# generate_registry.py - generate the registry of number modules
+#
+# Copyright (C) 2026 Arthur de Jong
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301 USA
+
+"""This script imports all number modules of the stdnum package and writes
+stdnum/_registry.py which lists the modules with their short description,
+countries and functions. This allows util.get_module_registry() and
+util.get_number_modules() to find the number modules without walking and
+importing the whole package. The file also lists the formats of the compact
+numbers that the modules accept (the lengths, prefixes and parts with only
+digits) that util.detect() uses. These are determined by looking at the
+source of the compact() and validate() functions of the modules. The script
+should be run whenever modules are added or changed and when the version
+number changes."""
+
+import ast
+import copy
+import inspect
+import os
+import re
+import sys
+import textwrap
+
+import stdnum
+from stdnum import util
+
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python 3.10 and older
+    import sre_parse
+
+
+header = '''# _registry.py - registry of number modules
+# coding: utf-8
+#
+# Copyright (C) 2026 Arthur de Jong
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301 USA
+
+"""Registry of the number modules of the stdnum package.
+
+This file is generated by scripts/generate_registry.py and should not be
+edited manually. See util.get_module_registry() for the format.
+"""
+
+# the stdnum version that the registry was generated for
+version = %r
+
+# the number modules: (name, description, countries, capabilities)
+modules = (
+'''
+
+formats_header = '''
+# the formats of the compact numbers that modules accept: (name, deletechars,
+# methods, strip_prefixes, lengths, prefixes, digits)
+formats = (
+'''
+
+
+def is_name(node, name):
+    """Check whether the syntax tree node is a reference to the name."""
+    return isinstance(node, ast.Name) and node.id == name
+
+
+def is_call(node, name, *args):
+    """Check whether the syntax tree node is a call of the named function
+    with the named arguments."""
+    return (
+        isinstance(node, ast.Call) and is_name(node.func, name) and
+        not node.keywords and len(node.args) == len(args) and
+        all(is_name(node, arg) for node, arg in zip(node.args, args)))
+
+
+def get_literal(node):
+    """Return the value of the literal in the syntax tree node or None."""
+    if type(node).__name__ == 'Index':  # Python 3.8 and older
+        node = node.value
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return None
+
+
+def parse_module(module):
+    """Return the syntax tree of the source of the module or None."""
+    try:
+        return ast.parse(inspect.getsource(module))
+    except (OSError, TypeError, SyntaxError):
+        return None
+
+
+def get_clean_format(expr):
+    """Return the deletechars and methods if the expression calls clean() on
+    the number and then the strip() and upper() methods or None otherwise."""
+    methods = set()
+    while (isinstance(expr, ast.Call) and isinstance(expr.func, ast.Attribute) and
+           expr.func.attr in ('strip', 'upper') and not expr.args and not expr.keywords):
+        methods.add(expr.func.attr)
+        expr = expr.func.value
+    if (isinstance(expr, ast.Call) and is_name(expr.func, 'clean') and not expr.keywords and
+            1 <= len(expr.args) <= 2 and is_name(expr.args[0], 'number')):
+        deletechars = get_literal(expr.args[1]) if len(expr.args) == 2 else ''
+        if isinstance(deletechars, str):
+            # the order of strip() and upper() does not change the result
+            return deletechars, tuple(sorted(methods))
+
+
+def get_compact_format(module, tree):
+    """Return the deletechars, methods and strip_prefixes that describe the
+    compact() function of the module or None if it does something else."""
+    compact = [
+        node for node in tree.body
+        if isinstance(node, ast.FunctionDef) and node.name == 'compact']
+    if not compact and inspect.isfunction(getattr(module, 'compact', None)):
+        # the compact() function is imported from another module
+        other = sys.modules.get(module.compact.__module__)
+        if other is not None and other is not module and parse_module(other):
+            return get_compact_format(other, parse_module(other))
+    if len(compact) != 1:
+        return None
+    body = compact[0].body[1:] if ast.get_docstring(compact[0]) else compact[0].body
+    if len(body) == 1 and isinstance(body[0], ast.Return) and isinstance(body[0].value, ast.Call):
+        expr = body[0].value
+        if isinstance(expr.func, ast.Name) and is_call(expr, expr.func.id, 'number'):
+            # return _normalise(number) with _normalise = normaliser(...)
+            for node in tree.body:
+                if (isinstance(node, ast.Assign) and len(node.targets) == 1 and
+                        is_name(node.targets[0], expr.func.id) and
+                        isinstance(node.value, ast.Call) and is_name(node.value.func, 'normaliser')):
+                    args = dict(zip(('deletechars', 'upper', 'prefix'), map(get_literal, node.value.args)))
+                    args.update((keyword.arg, get_literal(keyword.value)) for keyword in node.value.keywords)
+                    prefix = args.get('prefix')
+                    return (
+                        args.get('deletechars') or '',
+                        ('strip', 'upper') if args.get('upper') else ('strip',),
+                        (prefix,) if isinstance(prefix, str) else tuple(prefix or ()))
+        elif (isinstance(expr.func, ast.Attribute) and expr.func.attr == 'compact' and
+                isinstance(expr.func.value, ast.Name) and not expr.keywords and
+                len(expr.args) == 1 and is_name(expr.args[0], 'number')):
+            # return other.compact(number) with other another number module
+            other = getattr(module, expr.func.value.id, None)
+            if inspect.ismodule(other) and parse_module(other):
+                return get_compact_format(other, parse_module(other))
+        elif get_clean_format(expr):
+            # return clean(number, '...').upper().strip()
+            return get_clean_format(expr) + ((),)
+    elif (2 <= len(body) <= 3 and isinstance(body[0], ast.Assign) and len(body[0].targets) == 1 and
+            is_name(body[0].targets[0], 'number') and get_clean_format(body[0].value) and
+            isinstance(body[-1], ast.Return) and is_name(body[-1].value, 'number')):
+        # number = clean(number, '...').upper().strip()
+        # if number.startswith('...'):
+        #     number = number[2:]
+        # return number
+        if len(body) == 2:
+            return get_clean_format(body[0].value) + ((),)
+        # the number with the prefix removed is either assigned or returned
+        node = body[1]
+        if not (isinstance(node, ast.If) and not node.orelse and len(node.body) == 1 and
+                (isinstance(node.body[0], ast.Assign) and len(node.body[0].targets) == 1 and
+                 is_name(node.body[0].targets[0], 'number') or isinstance(node.body[0], ast.Return)) and
+                isinstance(node.body[0].value, ast.Subscript) and is_name(node.body[0].value.value, 'number') and
+                isinstance(node.body[0].value.slice, ast.Slice)):
+            return None
+        index = node.body[0].value.slice
+        test = node.test
+        tests = test.values if isinstance(test, ast.BoolOp) and isinstance(test.op, ast.Or) else [test]
+        prefixes = tuple(
+            get_literal(test.args[0]) for test in tests
+            if isinstance(test, ast.Call) and isinstance(test.func, ast.Attribute) and
+            test.func.attr == 'startswith' and is_name(test.func.value, 'number') and
+            len(test.args) == 1 and not test.keywords)
+        if (index.upper is None and index.step is None and len(prefixes) == len(tests) and
+                all(isinstance(prefix, str) and len(prefix) == get_literal(index.lower) for prefix in prefixes)):
+            return get_clean_format(body[0].value) + (prefixes,)
+
+
+def get_length_test(test):
+    """Return the lengths of the number for which the test is true if the
+    test only depends on the length of the number or None otherwise."""
+    # all references to the number must be as len(number)
+    nodes = list(ast.walk(test))
+    calls = [node for node in nodes if isinstance(node, ast.Call)]
+    names = [node for node in nodes if isinstance(node, ast.Name)]
+    if not calls or not all(is_call(node, 'len', 'number') for node in calls):
+        return None
+    if len(names) != 2 * len(calls) or not all(node.id in ('len', 'number') for node in names):
+        return None
+    test = ast.fix_missing_locations(ast.Expression(copy.deepcopy(test)))
+    code = compile(test, '<test>', 'eval')
+    try:
+        return frozenset(
+            length for length in range(util._max_format_length + 1)
+            if eval(code, {'__builtins__': {}}, {'len': lambda number, length=length: length, 'number': None}))
+    except Exception:  # noqa: B902 (we cannot use the test)
+        return None
+
+
+def get_prefix_test(test):
+    """Return the prefixes that the number must start with for the test to
+    be false or None if the test is something else."""
+    if isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not):
+        # not number.startswith('...')
+        test = test.operand
+        if (isinstance(test, ast.Call) and isinstance(test.func, ast.Attribute) and
+                test.func.attr == 'startswith' and is_name(test.func.value, 'number') and
+                len(test.args) == 1 and not test.keywords):
+            prefixes = get_literal(test.args[0])
+            prefixes = (prefixes,) if isinstance(prefixes, str) else prefixes
+        else:
+            return None
+    elif (isinstance(test, ast.Compare) and len(test.ops) == 1 and
+            isinstance(test.ops[0], (ast.NotEq, ast.NotIn)) and
+            isinstance(test.left, ast.Subscript) and is_name(test.left.value, 'number')):
+        # number[:2] not in ('...', '...') or number[0] != '...' (if the
+        # test is false number[:2] is one of the values)
+        prefixes = get_literal(test.comparators[0])
+        if isinstance(test.ops[0], ast.NotEq):
+            prefixes = (prefixes,)
+        index = test.left.slice
+        if isinstance(index, ast.Slice):
+            if index.lower is not None or index.step is not None or \
+                    not isinstance(get_literal(index.upper), int) or get_literal(index.upper) <= 0 or \
+                    isinstance(prefixes, str):
+                return None
+        elif get_literal(index) != 0:
+            return None
+    else:
+        return None
+    if isinstance(prefixes, (tuple, list, set, frozenset, str)) and \
+            all(isinstance(prefix, str) for prefix in prefixes):
+        return tuple(sorted(prefixes))
+
+
+def get_digits_test(test):
+    """Return the start and end of the part of the number that must only
+    have digits for the test to be false or None if the test is something
+    else."""
+    if not (isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not) and
+            isinstance(test.operand, ast.Call) and is_name(test.operand.func, 'isdigits') and
+            len(test.operand.args) == 1 and not test.operand.keywords):
+        return None
+    # not isdigits(number) or not isdigits(number[1:-1])
+    number = test.operand.args[0]
+    if is_name(number, 'number'):
+        return ((None, None),)
+    if isinstance(number, ast.Subscript) and is_name(number.value, 'number') and \
+            isinstance(number.slice, ast.Slice) and number.slice.step is None:
+        bounds = tuple(
+            None if bound is None else get_literal(bound)
+            for bound in (number.slice.lower, number.slice.upper))
+        if all(bound is None or isinstance(bound, int) for bound in bounds):
+            return (bounds,)
+
+
+def get_regex_test(module, test):
+    """Return the lengths of the number for which the test is true if the
+    test checks that the number matches a regular expression that is
+    anchored at the start and the end or None otherwise."""
+    if not (isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not) and
+            isinstance(test.operand, ast.Call) and isinstance(test.operand.func, ast.Attribute) and
+            test.operand.func.attr in ('match', 'search', 'fullmatch') and
+            isinstance(test.operand.func.value, ast.Name) and
+            len(test.operand.args) == 1 and is_name(test.operand.args[0], 'number') and
+            not test.operand.keywords):
+        return None
+    # not _number_re.match(number)
+    regex = getattr(module, test.operand.func.value.id, None)
+    if not isinstance(regex, type(re.compile(''))) or not isinstance(regex.pattern, str) or \
+            regex.flags & re.MULTILINE:
+        return None
+    pattern = sre_parse.parse(regex.pattern, regex.flags)
+    if not len(pattern):
+        return None
+    start, end = pattern[0], pattern[-1]
+    if test.operand.func.attr != 'fullmatch':
+        # a $ also matches before a newline at the end
+        if end[0] != sre_parse.AT or end[1] not in (sre_parse.AT_END, sre_parse.AT_END_STRING):
+            return None
+        if test.operand.func.attr == 'search' and (
+                start[0] != sre_parse.AT or start[1] not in (sre_parse.AT_BEGINNING, sre_parse.AT_BEGINNING_STRING)):
+            return None
+    minimum, maximum = pattern.getwidth()
+    return frozenset(
+        length for length in range(util._max_format_length + 1)
+        if length < minimum or length > maximum + 1)
+
+
+def is_error(body):
+    """Check whether the statements raise or return a validation error."""
+    return len(body) == 1 and (
+        isinstance(body[0], ast.Raise) or
+        isinstance(body[0], ast.Return) and isinstance(body[0].value, ast.Name) and
+        body[0].value.id in ('InvalidFormat', 'InvalidLength', 'InvalidChecksum',
+                             'InvalidComponent', 'ValidationError'))
+
+
+def get_validation_tests(module, function):
+    """Return the tests at the start of the validation function that must
+    be false for the compact number to be valid. If the compact number must
+    make one of a list of tests true, the list is returned instead. If the
+    function starts by validating the number with another module, that
+    module is also returned."""
+    body = function.body[1:] if ast.get_docstring(function) else function.body
+    body = [node for node in body if not isinstance(node, (ast.Import, ast.ImportFrom))]
+    if not body:
+        return None, []
+    # the number is validated by another module first
+    other = None
+    if (isinstance(body[0], (ast.Assign, ast.Return)) and isinstance(body[0].value, ast.Call) and
+            isinstance(body[0].value.func, ast.Attribute) and body[0].value.func.attr == 'validate' and
+            isinstance(body[0].value.func.value, ast.Name) and not body[0].value.keywords and
+            len(body[0].value.args) == 1 and is_name(body[0].value.args[0], 'number')):
+        other = getattr(module, body[0].value.func.value.id, None)
+        other = other if inspect.ismodule(other) else None
+    elif not is_call(getattr(body[0], 'value', None), 'compact', 'number'):
+        return None, []
+    if not isinstance(body[0], ast.Assign) or len(body[0].targets) != 1 or \
+            not isinstance(body[0].targets[0], ast.Name):
+        return other, []
+
+    name = body[0].targets[0].id
+    tests = []
+    matches = {}
+    for node in (copy.deepcopy(node) for node in body[1:]):
+        # rename the variable with the compact number to number
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and child.id in (name, 'number'):
+                child.id = 'number' if child.id == name else '_number'
+        if isinstance(node, (ast.Assign, ast.Expr)) and not any(
+                is_name(target, 'number') for target in ast.walk(node)
+                if isinstance(target, ast.Name) and isinstance(target.ctx, ast.Store)):
+            # statements that do not change the number or return
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and \
+                    isinstance(node.targets[0], ast.Name):
+                # match = _number_re.match(number)
+                matches[node.targets[0].id] = node.value
+            continue
+        if not isinstance(node, ast.If):
+            break
+        if not node.orelse and is_error(node.body):
+            # if ...: raise InvalidFormat()
+            tests.extend(split_test(node.test, matches))
+            continue
+        alternatives = get_alternatives(node)
+        if alternatives:
+            tests.append(alternatives)
+        break
+    return other, tests
+
+
+def split_test(test, matches):
+    """Split the test that is true for invalid numbers into a list of tests.
+    References to the results of regular expression matches are replaced by
+    the match itself."""
+    tests = test.values if isinstance(test, ast.BoolOp) and isinstance(test.op, ast.Or) else [test]
+    for test in tests:
+        if isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not) and \
+                isinstance(test.operand, ast.Name) and test.operand.id in matches:
+            test.operand = matches[test.operand.id]
+    return tests
+
+
+def get_alternatives(node):
+    """Return the tests of which one must be true for valid numbers if the
+    if statement ends in an else or elif branch that raises an error."""
+    # if ...: ... elif ...: ... else: raise InvalidLength()
+    alternatives = []
+    while isinstance(node, ast.If) and node.orelse:
+        alternatives.append(node.test)
+        node = node.orelse[0] if len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If) else node.orelse
+    if isinstance(node, ast.If) and not node.orelse and is_error(node.body):
+        # ... elif ...: raise InvalidLength()
+        return alternatives + [ast.UnaryOp(ast.Not(), node.test)]
+    if isinstance(node, list) and is_error(node):
+        return alternatives
+
+
+def get_module_format(module):
+    """Return the ModuleFormat of the number module by looking at the source
+    of the compact() and validate() (or check()) functions. This only looks
+    at the format checks at the start of validate() and returns None if the
+    module does not have a supported compact() function."""
+    tree = parse_module(module)
+    compact = get_compact_format(module, tree) if tree else None
+    if compact is None:
+        return None
+    functions = dict(
+        (node.name, node) for node in tree.body if isinstance(node, ast.FunctionDef))
+    if 'validate' not in functions or 'is_valid' not in functions:
+        return None
+    function = functions['validate']
+    if 'check' in functions and any(is_call(node, 'check', 'number') for node in ast.walk(function)):
+        function = functions['check']
+    lengths = frozenset(range(util._max_format_length + 1))
+    prefixes = None
+    digits = ()
+    other, tests = get_validation_tests(module, function)
+    other = get_module_format(other) if other else None
+    if other and other[1:4] == compact:
+        # the number has the format that the other module accepts
+        lengths = frozenset(other.lengths) if other.lengths is not None else lengths
+        prefixes = other.prefixes
+        digits = other.digits
+    for test in tests:
+        if isinstance(test, list):
+            alternatives = [get_length_test(alternative) for alternative in test]
+            if None not in alternatives:
+                lengths &= frozenset().union(*alternatives)
+        elif get_length_test(test) is not None:
+            lengths -= get_length_test(test)
+        elif get_regex_test(module, test) is not None:
+            lengths -= get_regex_test(module, test)
+        elif get_digits_test(test):
+            digits = tuple(sorted(set(digits + get_digits_test(test)), key=repr))
+        elif prefixes is None:
+            prefixes = get_prefix_test(test)
+    return util.ModuleFormat(
+        module.__name__, *compact,
+        lengths=None if util._max_format_length in lengths else tuple(sorted(lengths)),
+        prefixes=prefixes, digits=digits)
+
+
+def build_module_formats():
+    """Determine the formats of the number modules by looking at their
+    source."""
+    formats = (get_module_format(module) for module in util._walk_number_modules('stdnum'))
+    return tuple(module_format for module_format in formats if module_format is not None)
+
+
+if __name__ == '__main__':
+    target = os.path.join(os.path.dirname(stdnum.__file__), '_registry.py')
+    registry = util._build_module_registry()
+    formats = build_module_formats()
+    with open(target, 'wt', encoding='utf-8') as f:
+        f.write(header % stdnum.__version__)
+        for entry in registry:
+            f.write('    (%r, %r,\n     %r,\n' % (
+                entry.name, entry.description, entry.countries))
+            f.write(textwrap.fill(
+                repr(entry.capabilities) + '),', width=100,
+                initial_indent='     ', subsequent_indent='      ',
+                break_long_words=False, break_on_hyphens=False) + '\n')
+        f.write(')\n')
+        f.write(formats_header)
+        for entry in formats:
+            f.write(textwrap.fill(
+                repr(tuple(entry)) + ',', width=100,
+                initial_indent='    ', subsequent_indent='     ',
+                break_long_words=False, break_on_hyphens=False) + '\n')
+        f.write(')\n')
+    print('wrote %s' % target)
@@ -25,6 +25,7 @@ import os
 import sys
 
 from setuptools import find_packages, setup
+from setuptools.command.build_py import build_py
 
 import stdnum
 
@@ -36,6 +37,21 @@ if 'sdist' in sys.argv:
 
 base_dir = os.path.dirname(__file__)
 
+
+class BuildPy(build_py):
+    """Also compile the numdb text databases to the binary format."""
+
+    def run(self):
+        """Build the package and compile the .dat files in the build."""
+        super().run()
+        from stdnum import numdb
+        for dirpath, _dirnames, filenames in os.walk(os.path.join(self.build_lib, 'stdnum')):
+            for filename in sorted(filenames):
+                if filename.endswith('.dat'):
+                    source = os.path.join(dirpath, filename)
+                    numdb.compile_file(source, source[:-4] + '.ndb')
+
+
 with open(os.path.join(base_dir, 'README.md'), 'rb') as fp:
     long_description = fp.read().decode('utf-8')
 
@@ -77,12 +93,16 @@ setup(
         'Topic :: Text Processing :: General',
     ],
     packages=find_packages(),
+    cmdclass={'build_py': BuildPy},
     install_requires=[],
-    package_data={'': ['*.dat', '*.crt']},
+    package_data={'': ['*.dat', '*.ndb', '*.crt']},
     extras_require={
         # The SOAP feature is only required for a number of online tests
         # of numbers such as the EU VAT VIES lookup, the Dominican Republic
         # DGII services or the Turkish T.C. Kimlik validation.
         'SOAP': ['zeep'],
+        # NumPy is used for vectorised calculation of checksums of arrays
+        # of numbers in functions such as luhn.checksum_many().
+        'NumPy': ['numpy'],
     },
 )
@@ -35,12 +35,18 @@ InvalidChecksum: ...
 
 Apart from the validate() function, many modules provide extra
 parsing, validation, formatting or conversion functions.
+
+The modules that accept a number can be found with detect():
+
+>>> from stdnum import detect
+>>> [module.__name__ for module in detect('NL91 ABNA 0417 1643 00')]
+['stdnum.iban']
 """
 
-from stdnum.util import get_cc_module
+from stdnum.util import detect, get_cc_module
 
 
-__all__ = ('get_cc_module', '__version__')
+__all__ = ('detect', 'get_cc_module', '__version__')
 
 # the version number of the library
 __version__ = '1.20'
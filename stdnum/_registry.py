@@ -0,0 +1,1143 @@
+# _registry.py - registry of number modules
+# coding: utf-8
+#
+# Copyright (C) 2026 Arthur de Jong
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA
+# 02110-1301 USA
+
+"""Registry of the number modules of the stdnum package.
+
+This file is generated by scripts/generate_registry.py and should not be
+edited manually. See util.get_module_registry() for the format.
+"""
+
+# the stdnum version that the registry was generated for
+version = '1.20'
+
+# the number modules: (name, description, countries, capabilities)
+modules = (
+    ('stdnum.ad.nrt', 'NRT (Número de Registre Tributari, Andorra tax number)',
+     ('ad',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ae.eid', 'Emirates ID (Emirates Identity Card Number)',
+     ('ae',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.ae.trn', 'TRN (Tax Registration Number)',
+     ('ae',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.al.nipt', 'NIPT, NUIS (Numri i Identifikimit për Personin e Tatueshëm, Albanian tax number)',
+     ('al',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.ar.cbu', 'CBU (Clave Bancaria Uniforme, Argentine bank account number)',
+     ('ar',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ar.cuit', 'CUIT (Código Único de Identificación Tributaria, Argentinian tax number)',
+     ('ar',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ar.dni', 'DNI (Documento Nacional de Identidad, Argentinian national identity nr.)',
+     ('ar',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.at.businessid', 'Austrian Company Register Numbers',
+     ('at',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.at.postleitzahl', 'Postleitzahl (Austrian postal code)',
+     ('at',),
+     ('compact', 'info', 'is_valid', 'validate')),
+    ('stdnum.at.tin', 'Abgabenkontonummer (Austrian tax identification number)',
+     ('at',),
+     ('calc_check_digit', 'compact', 'format', 'info', 'is_valid', 'validate')),
+    ('stdnum.at.uid', 'UID (Umsatzsteuer-Identifikationsnummer, Austrian VAT number)',
+     ('at',),
+     ('calc_check_digit', 'check', 'compact', 'is_valid', 'validate')),
+    ('stdnum.at.vnr', 'VNR, SVNR, VSNR (Versicherungsnummer, Austrian social security number)',
+     ('at',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.au.abn', 'ABN (Australian Business Number)',
+     ('au',),
+     ('calc_check_digits', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.au.acn', 'ACN (Australian Company Number)',
+     ('au',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'to_abn', 'validate')),
+    ('stdnum.au.tfn', 'TFN (Australian Tax File Number)',
+     ('au',),
+     ('checksum', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.be.bis', 'BIS (Belgian BIS number)',
+     ('be',),
+     ('compact', 'format', 'get_birth_date', 'get_birth_month', 'get_birth_year', 'get_gender',
+      'is_valid', 'validate')),
+    ('stdnum.be.eid', 'eID Number (Belgian electronic Identity Card Number)',
+     ('be',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.be.iban', 'Belgian IBAN (International Bank Account Number)',
+     ('be',),
+     ('compact', 'format', 'info', 'is_valid', 'to_bic', 'validate')),
+    ('stdnum.be.nn', 'NN, NISS, RRN (Belgian national number)',
+     ('be',),
+     ('compact', 'format', 'get_birth_date', 'get_birth_month', 'get_birth_year', 'get_gender',
+      'is_valid', 'validate')),
+    ('stdnum.be.ssn', 'SSN, INSZ, NISS (Belgian social security number)',
+     ('be',),
+     ('compact', 'format', 'get_birth_date', 'get_birth_month', 'get_birth_year', 'get_gender',
+      'guess_type', 'is_valid', 'validate')),
+    ('stdnum.be.vat', 'BTW, TVA, NWSt, ondernemingsnummer (Belgian enterprise number)',
+     ('be',),
+     ('checksum', 'compact', 'is_valid', 'validate')),
+    ('stdnum.bg.egn', 'EGN (ЕГН, Единен граждански номер, Bulgarian personal identity codes)',
+     ('bg',),
+     ('calc_check_digit', 'compact', 'get_birth_date', 'is_valid', 'validate')),
+    ('stdnum.bg.pnf', 'PNF (ЛНЧ, Личен номер на чужденец, Bulgarian number of a foreigner)',
+     ('bg',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.bg.vat', 'VAT (Идентификационен номер по ДДС, Bulgarian VAT number)',
+     ('bg',),
+     ('calc_check_digit_legal', 'calc_check_digit_other', 'compact', 'is_valid', 'validate')),
+    ('stdnum.bh.crn', 'CRN (Bahrain Commercial Registration Number)',
+     ('bh',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.bh.nid', 'BH NID (Bahrain National ID number)',
+     ('bh',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.bh.vat', 'VAT (Bahrain Value Added Tax number)',
+     ('bh',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.bic', 'BIC (ISO 9362 Business identifier codes)',
+     (),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.bitcoin', 'Bitcoin address',
+     (),
+     ('b32decode', 'b58decode', 'bech32_checksum', 'check', 'compact', 'is_valid', 'validate')),
+    ('stdnum.br.cnpj', 'CNPJ (Cadastro Nacional da Pessoa Jurídica, Brazilian company identifier)',
+     ('br',),
+     ('calc_check_digits', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.br.cpf', 'CPF (Cadastro de Pessoas Físicas, Brazilian national identifier)',
+     ('br',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.by.unp', 'УНП, UNP (Учетный номер плательщика, the Belarus VAT number)',
+     ('by',),
+     ('calc_check_digit', 'check_nalog', 'compact', 'is_valid', 'validate')),
+    ('stdnum.ca.bc_phn', 'BC PHN (British Columbia Personal Health Number)',
+     ('ca',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ca.bn', 'BN (Canadian Business Number)',
+     ('ca',),
+     ('check', 'compact', 'is_valid', 'validate')),
+    ('stdnum.ca.sin', 'SIN (Canadian Social Insurance Number)',
+     ('ca',),
+     ('check', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.casrn', 'CAS RN (Chemical Abstracts Service Registry Number)',
+     (),
+     ('calc_check_digit', 'check', 'compact', 'is_valid', 'validate')),
+    ('stdnum.cfi', 'CFI (ISO 10962 Classification of Financial Instruments)',
+     (),
+     ('compact', 'info', 'is_valid', 'validate')),
+    ('stdnum.ch.esr', 'ESR, ISR, QR-reference (reference number on Swiss payment slips)',
+     ('ch',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ch.ssn', 'Swiss social security number ("Sozialversicherungsnummer")',
+     ('ch',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ch.uid', 'UID (Unternehmens-Identifikationsnummer, Swiss business identifier)',
+     ('ch',),
+     ('calc_check_digit', 'check_uid', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ch.vat', 'VAT, MWST, TVA, IVA, TPV (Mehrwertsteuernummer, the Swiss VAT number)',
+     ('ch',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.cl.rut', 'RUT (Rol Único Tributario, Chilean national tax number)',
+     ('cl',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.cn.ric', 'RIC No. (Chinese Resident Identity Card Number)',
+     ('cn',),
+     ('calc_check_digit', 'compact', 'format', 'get_birth_date', 'get_birth_place', 'is_valid',
+      'validate')),
+    ('stdnum.cn.uscc', 'USCC (Unified Social Credit Code, 统一社会信用代码, China tax number)',
+     ('cn',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.co.nit', 'NIT (Número De Identificación Tributaria, Colombian identity code)',
+     ('co',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.cr.cpf', 'CPF (Cédula de Persona Física, Costa Rica physical person ID number)',
+     ('cr',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.cr.cpj', 'CPJ (Cédula de Persona Jurídica, Costa Rica tax number)',
+     ('cr',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.cr.cr', 'CR (Cédula de Residencia, Costa Rica foreigners ID number)',
+     ('cr',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.cu.ni', 'NI (Número de identidad, Cuban identity card numbers)',
+     ('cu',),
+     ('compact', 'get_birth_date', 'get_gender', 'is_valid', 'validate')),
+    ('stdnum.cusip', 'CUSIP number (financial security identification number)',
+     (),
+     ('calc_check_digit', 'check', 'compact', 'is_valid', 'to_isin', 'validate')),
+    ('stdnum.cy.personal_tin', '',
+     ('cy',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.cy.vat', 'Αριθμός Εγγραφής Φ.Π.Α. (Cypriot VAT number)',
+     ('cy',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.cz.bankaccount', 'Czech bank account number',
+     ('cz',),
+     ('compact', 'format', 'info', 'is_valid', 'to_bic', 'validate')),
+    ('stdnum.cz.dic', 'DIČ (Daňové identifikační číslo, Czech VAT number)',
+     ('cz',),
+     ('calc_check_digit_legal', 'calc_check_digit_special', 'compact', 'is_valid', 'validate')),
+    ('stdnum.cz.rc', 'RČ (Rodné číslo, the Czech birth number)',
+     ('cz',),
+     ('compact', 'format', 'get_birth_date', 'is_valid', 'validate')),
+    ('stdnum.damm', 'The Damm algorithm',
+     (),
+     ('calc_check_digit', 'check', 'checksum', 'checksum_many', 'is_valid', 'validate')),
+    ('stdnum.de.handelsregisternummer', 'Handelsregisternummer (German company register number)',
+     ('de',),
+     ('check_offeneregister', 'compact', 'is_valid', 'validate')),
+    ('stdnum.de.idnr', 'IdNr (Steuerliche Identifikationsnummer, German personal tax number)',
+     ('de',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.de.stnr', 'St.-Nr. (Steuernummer, German tax number)',
+     ('de',),
+     ('compact', 'format', 'guess_regions', 'is_valid', 'to_country_number', 'to_regional_number',
+      'validate')),
+    ('stdnum.de.vat', 'Ust ID Nr. (Umsatzsteur Identifikationnummer, German VAT number)',
+     ('de',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.de.wkn', 'Wertpapierkennnummer (German securities identification code)',
+     ('de',),
+     ('compact', 'is_valid', 'to_isin', 'validate')),
+    ('stdnum.dk.cpr', 'CPR (personnummer, the Danish citizen number)',
+     ('dk',),
+     ('checksum', 'compact', 'format', 'get_birth_date', 'is_valid', 'validate')),
+    ('stdnum.dk.cvr', 'CVR (Momsregistreringsnummer, Danish VAT number)',
+     ('dk',),
+     ('checksum', 'compact', 'is_valid', 'validate')),
+    ('stdnum.do.cedula', 'Cedula (Dominican Republic national identification number)',
+     ('do',),
+     ('check', 'check_dgii', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.do.ncf', 'NCF (Números de Comprobante Fiscal, Dominican Republic receipt number)',
+     ('do',),
+     ('check_dgii', 'compact', 'is_valid', 'validate')),
+    ('stdnum.do.rnc', 'RNC (Registro Nacional del Contribuyente, Dominican Republic tax number)',
+     ('do',),
+     ('calc_check_digit', 'check_dgii', 'compact', 'format', 'is_valid', 'search_dgii',
+      'validate')),
+    ('stdnum.dz.nif', "NIF, sometimes N.I.F. (Numéro d'Identification Fiscale, Algeria tax number)",
+     ('dz',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ean', 'EAN (International Article Number)',
+     (),
+     ('calc_check_digit', 'check', 'check_many', 'compact', 'is_valid', 'validate')),
+    ('stdnum.ec.ci', 'CI (Cédula de identidad, Ecuadorian personal identity code)',
+     ('ec',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.ec.ruc', 'RUC (Registro Único de Contribuyentes, Ecuadorian company tax number)',
+     ('ec',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.ee.ik', 'Isikukood (Estonian Personal ID number)',
+     ('ee',),
+     ('calc_check_digit', 'compact', 'get_birth_date', 'get_gender', 'is_valid', 'validate')),
+    ('stdnum.ee.kmkr', 'KMKR (Käibemaksukohuslase, Estonian VAT number)',
+     ('ee',),
+     ('checksum', 'compact', 'is_valid', 'validate')),
+    ('stdnum.ee.registrikood', 'Registrikood (Estonian organisation registration code)',
+     ('ee',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.eg.tn', 'Tax Registration Number (الرقم الضريبي, Egypt tax number)',
+     ('eg',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.es.cae', 'CAE (Código de Actividad y Establecimiento, Spanish activity establishment code)',
+     ('es',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.es.ccc', 'CCC (Código Cuenta Corriente, Spanish Bank Account Code)',
+     ('es',),
+     ('calc_check_digits', 'compact', 'format', 'is_valid', 'to_iban', 'validate')),
+    ('stdnum.es.cif', 'CIF (Código de Identificación Fiscal, Spanish company tax number)',
+     ('es',),
+     ('calc_check_digits', 'check', 'compact', 'is_valid', 'split', 'validate')),
+    ('stdnum.es.cups', 'CUPS (Código Unificado de Punto de Suministro, Spanish meter point number)',
+     ('es',),
+     ('calc_check_digits', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.es.dni', 'DNI (Documento Nacional de Identidad, Spanish personal identity codes)',
+     ('es',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.es.iban', 'Spanish IBAN (International Bank Account Number)',
+     ('es',),
+     ('compact', 'format', 'is_valid', 'to_ccc', 'validate')),
+    ('stdnum.es.nie', 'NIE (Número de Identificación de Extranjero, Spanish foreigner number)',
+     ('es',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.es.nif', 'NIF (Número de Identificación Fiscal, Spanish VAT number)',
+     ('es',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.es.personal_tin', 'Peronal TIN ',
+     ('es',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.es.postal_code', 'Postcode (the Spanish postal code)',
+     ('es',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.es.referenciacatastral', 'Referencia Catastral (Spanish real estate property id)',
+     ('es',),
+     ('calc_check_digits', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.eu.at_02', 'SEPA Identifier of the Creditor (AT-02)',
+     ('eu',),
+     ('calc_check_digits', 'check', 'compact', 'is_valid', 'validate')),
+    ('stdnum.eu.banknote', 'Euro banknote serial numbers',
+     ('eu',),
+     ('check', 'checksum', 'compact', 'is_valid', 'validate')),
+    ('stdnum.eu.ecnumber', 'EC Number (European Community number)',
+     ('eu',),
+     ('calc_check_digit', 'check', 'compact', 'is_valid', 'validate')),
+    ('stdnum.eu.eic', 'EIC (European Energy Identification Code)',
+     ('eu',),
+     ('calc_check_digit', 'check', 'compact', 'is_valid', 'validate')),
+    ('stdnum.eu.nace', 'NACE (classification for businesses in the European Union)',
+     ('eu',),
+     ('compact', 'format', 'get_label', 'info', 'is_valid', 'label', 'validate')),
+    ('stdnum.eu.oss', 'OSS (European VAT on e-Commerce - One Stop Shop)',
+     ('eu',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.eu.vat', 'VAT (European Union VAT number)',
+     ('eu',),
+     ('check_vies', 'check_vies_approx', 'compact', 'guess_country', 'guess_country_many',
+      'is_valid', 'validate')),
+    ('stdnum.fi.alv', 'ALV nro (Arvonlisäveronumero, Finnish VAT number)',
+     ('fi',),
+     ('checksum', 'compact', 'is_valid', 'validate')),
+    ('stdnum.fi.associationid', 'Finnish Association Identifier',
+     ('fi',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.fi.hetu', 'HETU (Henkilötunnus, Finnish personal identity code)',
+     ('fi',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.fi.veronumero', 'Veronumero (Finnish individual tax number)',
+     ('fi',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.fi.ytunnus', 'Y-tunnus (Finnish business identifier)',
+     ('fi',),
+     ('checksum', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.figi', 'FIGI (Financial Instrument Global Identifier)',
+     (),
+     ('calc_check_digit', 'check', 'compact', 'is_valid', 'validate')),
+    ('stdnum.fo.vn', 'V-number (Vinnutal, Faroe Islands tax number)',
+     ('fo',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.fr.nif', "NIF (Numéro d'Immatriculation Fiscale, French tax identification number)",
+     ('fr',),
+     ('calc_check_digits', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.fr.nir', 'NIR (French personal identification number)',
+     ('fr',),
+     ('calc_check_digits', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.fr.siren', 'SIREN (a French company identification number)',
+     ('fr',),
+     ('check', 'compact', 'is_valid', 'to_tva', 'validate')),
+    ('stdnum.fr.siret', 'SIRET (a French company establishment identification number)',
+     ('fr',),
+     ('check', 'compact', 'format', 'is_valid', 'to_siren', 'to_tva', 'validate')),
+    ('stdnum.fr.tva', 'n° TVA (taxe sur la valeur ajoutée, French VAT number)',
+     ('fr',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.gb.nhs', 'NHS (United Kingdom National Health Service patient identifier)',
+     ('gb',),
+     ('checksum', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.gb.nin', 'NIN (United Kingdom National Insurance Number)',
+     ('gb',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.gb.sedol', 'SEDOL number (Stock Exchange Daily Official List number)',
+     ('gb',),
+     ('calc_check_digit', 'compact', 'is_valid', 'to_isin', 'validate')),
+    ('stdnum.gb.upn', 'UPN (English Unique Pupil Number)',
+     ('gb',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.gb.utr', 'UTR (United Kingdom Unique Taxpayer Reference)',
+     ('gb',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.gb.vat', 'VAT (United Kingdom (and Isle of Man) VAT registration number)',
+     ('gb',),
+     ('checksum', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.gh.tin', 'TIN (Taxpayer Identification Number, Ghana tax number)',
+     ('gh',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.gn.nifp', "NIFp (Numéro d'Identification Fiscale Permanent, Guinea tax number)",
+     ('gn',),
+     ('check', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.gr.amka', 'AMKA (Αριθμός Μητρώου Κοινωνικής Ασφάλισης, Greek social security number)',
+     ('gr',),
+     ('check', 'compact', 'get_birth_date', 'get_gender', 'is_valid', 'validate')),
+    ('stdnum.gr.personal_tin', '',
+     ('gr',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.gr.vat', 'FPA, ΦΠΑ, ΑΦΜ (Αριθμός Φορολογικού Μητρώου, the Greek VAT number)',
+     ('gr',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.grid', 'GRid (Global Release Identifier)',
+     (),
+     ('check', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.gs1_128', 'GS1-128 (Standard to encode product information in Code 128 barcodes)',
+     (),
+     ('compact', 'encode', 'info', 'is_valid', 'validate')),
+    ('stdnum.gt.nit', 'NIT (Número de Identificación Tributaria, Guatemala tax number)',
+     ('gt',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.hk.br', '',
+     ('hk',),
+     ('is_valid', 'validate')),
+    ('stdnum.hk.hkid', '',
+     ('hk',),
+     ('is_valid', 'is_valid_checksum', 'validate')),
+    ('stdnum.hr.oib', 'OIB (Osobni identifikacijski broj, Croatian identification number)',
+     ('hr',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.hu.anum', 'ANUM (Közösségi adószám, Hungarian VAT number)',
+     ('hu',),
+     ('checksum', 'compact', 'is_valid', 'validate')),
+    ('stdnum.hu.business_tin', 'TODO',
+     ('hu',),
+     ('anum_is_valid', 'compact', 'is_valid', 'validate')),
+    ('stdnum.hu.personal_tin', '',
+     ('hu',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.iban', 'IBAN (International Bank Account Number)',
+     (),
+     ('calc_check_digits', 'check', 'check_many', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.id.nik', 'NIK (Nomor Induk Kependudukan, Indonesian identity number)',
+     ('id',),
+     ('compact', 'get_birth_date', 'is_valid', 'validate')),
+    ('stdnum.id.npwp', 'NPWP (Nomor Pokok Wajib Pajak, Indonesian VAT Number)',
+     ('id',),
+     ('check', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ie.pps', 'PPS No (Personal Public Service Number, Irish personal number)',
+     ('ie',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.ie.vat', 'VAT (Irish tax reference number)',
+     ('ie',),
+     ('calc_check_digit', 'compact', 'convert', 'is_valid', 'validate')),
+    ('stdnum.il.hp', 'Company Number (מספר חברה, or short ח.פ. Israeli company number)',
+     ('il',),
+     ('check', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.il.idnr', 'Identity Number (Mispar Zehut, מספר זהות, Israeli identity number)',
+     ('il',),
+     ('check', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.imei', 'IMEI (International Mobile Equipment Identity)',
+     (),
+     ('check', 'compact', 'format', 'imei_type', 'is_valid', 'split', 'validate')),
+    ('stdnum.imo', 'IMO number (International Maritime Organization number)',
+     (),
+     ('calc_check_digit', 'check', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.imsi', 'IMSI (International Mobile Subscriber Identity)',
+     (),
+     ('compact', 'info', 'is_valid', 'split', 'validate')),
+    ('stdnum.in_.aadhaar', 'Aadhaar (Indian personal identity number)',
+     ('in',),
+     ('compact', 'format', 'is_valid', 'mask', 'validate')),
+    ('stdnum.in_.epic', 'EPIC (Electoral Photo Identity Card, Indian Voter ID)',
+     ('in',),
+     ('check', 'compact', 'is_valid', 'validate')),
+    ('stdnum.in_.gstin', 'GSTIN (Goods and Services Tax identification number, Indian VAT number)',
+     ('in',),
+     ('check', 'compact', 'info', 'is_valid', 'to_pan', 'validate')),
+    ('stdnum.in_.pan', 'PAN (Permanent Account Number, Indian income tax identifier)',
+     ('in',),
+     ('compact', 'info', 'is_valid', 'mask', 'validate')),
+    ('stdnum.in_.vid', 'VID (Indian personal virtual identity number)',
+     ('in',),
+     ('compact', 'format', 'is_valid', 'mask', 'validate')),
+    ('stdnum.is_.business_tin', '',
+     ('is',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.is_.kennitala', 'Kennitala (Icelandic personal and organisation identity code)',
+     ('is',),
+     ('checksum', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.is_.personal_tin', '',
+     ('is',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.is_.vsk', 'VSK number (Virðisaukaskattsnúmer, Icelandic VAT number)',
+     ('is',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.isan', 'ISAN (International Standard Audiovisual Number)',
+     (),
+     ('check', 'compact', 'format', 'is_valid', 'split', 'to_binary', 'to_urn', 'to_xml',
+      'validate')),
+    ('stdnum.isbn', 'ISBN (International Standard Book Number)',
+     (),
+     ('check', 'check_many', 'compact', 'format', 'is_valid', 'isbn_type', 'split', 'to_isbn10',
+      'to_isbn13', 'validate')),
+    ('stdnum.isil', 'ISIL (International Standard Identifier for Libraries)',
+     (),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.isin', 'ISIN (International Securities Identification Number)',
+     (),
+     ('calc_check_digit', 'calc_check_digit_many', 'check', 'compact', 'from_natid', 'is_valid',
+      'validate')),
+    ('stdnum.ismn', 'ISMN (International Standard Music Number)',
+     (),
+     ('check', 'compact', 'format', 'is_valid', 'ismn_type', 'split', 'to_ismn13', 'validate')),
+    ('stdnum.isni', 'ISNI (International Standard Name Identifier)',
+     (),
+     ('check', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.iso11649', 'ISO 11649 (Structured Creditor Reference)',
+     (),
+     ('check', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.iso6346', 'ISO 6346 (International standard for container identification)',
+     (),
+     ('calc_check_digit', 'check', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.iso7064.mod_11_10', 'The ISO 7064 Mod 11, 10 algorithm',
+     ('iso7064',),
+     ('calc_check_digit', 'check', 'checksum', 'is_valid', 'validate')),
+    ('stdnum.iso7064.mod_11_2', 'The ISO 7064 Mod 11, 2 algorithm',
+     ('iso7064',),
+     ('calc_check_digit', 'check', 'checksum', 'is_valid', 'validate')),
+    ('stdnum.iso7064.mod_37_2', 'The ISO 7064 Mod 37, 2 algorithm',
+     ('iso7064',),
+     ('calc_check_digit', 'check', 'checksum', 'is_valid', 'validate')),
+    ('stdnum.iso7064.mod_37_36', 'The ISO 7064 Mod 37, 36 algorithm',
+     ('iso7064',),
+     ('calc_check_digit', 'check', 'checksum', 'is_valid', 'validate')),
+    ('stdnum.iso7064.mod_97_10', 'The ISO 7064 Mod 97, 10 algorithm',
+     ('iso7064',),
+     ('calc_check_digits', 'check', 'checksum', 'checksum_many', 'is_valid', 'validate')),
+    ('stdnum.isrc', 'ISRC (International Standard Recording Code)',
+     (),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.issn', 'ISSN (International Standard Serial Number)',
+     (),
+     ('calc_check_digit', 'check', 'compact', 'format', 'is_valid', 'to_ean', 'validate')),
+    ('stdnum.it.aic', 'AIC (Italian code for identification of drugs)',
+     ('it',),
+     ('calc_check_digit', 'compact', 'from_base32', 'is_valid', 'to_base32', 'validate',
+      'validate_base10', 'validate_base32')),
+    ('stdnum.it.codicefiscale', 'Codice Fiscale (Italian tax code for individuals)',
+     ('it',),
+     ('calc_check_digit', 'compact', 'get_birth_date', 'get_gender', 'is_valid', 'validate')),
+    ('stdnum.it.iva', 'Partita IVA (Italian VAT number)',
+     ('it',),
+     ('check', 'compact', 'is_valid', 'validate')),
+    ('stdnum.jp.cn', 'CN (法人番号, hōjin bangō, Japanese Corporate Number)',
+     ('jp',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.jp.my_number', '',
+     ('jp',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.ke.pin', 'PIN (Personal Identification Number, Kenya tax number)',
+     ('ke',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ke.pin_business', 'Business PIN (Personal Identification Number, Kenya tax number)',
+     ('ke',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ke.pin_personal', 'Individual PIN (Personal Identification Number, Kenya tax number)',
+     ('ke',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.kr.brn', 'BRN (사업자 등록 번호, South Korea Business Registration Number)',
+     ('kr',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.kr.rrn', 'RRN (South Korean resident registration number)',
+     ('kr',),
+     ('calc_check_digit', 'compact', 'format', 'get_birth_date', 'is_valid', 'validate')),
+    ('stdnum.kw.business_tin', 'Business TIN (Kuwait Business Tax Identification Number)',
+     ('kw',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.kw.cid', 'CID (Kuwait Civil ID)',
+     ('kw',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.lei', 'LEI (Legal Entity Identifier)',
+     (),
+     ('check', 'compact', 'is_valid', 'validate')),
+    ('stdnum.li.peid', 'PEID (Liechtenstein tax code for individuals and entities)',
+     ('li',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.lk.tin', 'TIN (Sri Lanka Personal Tax Identification Number)',
+     ('lk',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.lt.asmens', 'Asmens kodas (Lithuanian, personal numbers)',
+     ('lt',),
+     ('calc_check_digit', 'compact', 'get_birth_date', 'is_valid', 'validate')),
+    ('stdnum.lt.pvm', 'PVM (Pridėtinės vertės mokestis mokėtojo kodas, Lithuanian VAT number)',
+     ('lt',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.lu.personal_tin', '',
+     ('lu',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.lu.tva', 'TVA (taxe sur la valeur ajoutée, Luxembourgian VAT number)',
+     ('lu',),
+     ('calc_check_digits', 'compact', 'is_valid', 'validate')),
+    ('stdnum.luhn', 'The Luhn and Luhn mod N algorithms',
+     (),
+     ('calc_check_digit', 'check', 'check_many', 'checksum', 'checksum_many', 'is_valid',
+      'validate')),
+    ('stdnum.lv.pvn', 'PVN (Pievienotās vērtības nodokļa, Latvian VAT number)',
+     ('lv',),
+     ('calc_check_digit_pers', 'checksum', 'compact', 'get_birth_date', 'is_valid', 'validate')),
+    ('stdnum.ma.ice', 'ICE (Identifiant Commun de l’Entreprise, التعريف الموحد للمقاولة, Morocco tax number)',
+     ('ma',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ma.nif', "NIF (Numéro d'Identification Fiscale, Morocco personal tax identification number)",
+     ('ma',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.mac', 'MAC address (Media Access Control address)',
+     (),
+     ('compact', 'get_iab', 'get_manufacturer', 'get_oui', 'is_broadcast',
+      'is_locally_administered', 'is_multicast', 'is_unicast', 'is_universally_administered',
+      'is_valid', 'to_eui48', 'validate')),
+    ('stdnum.mc.tva', 'n° TVA (taxe sur la valeur ajoutée, Monacan VAT number)',
+     ('mc',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.md.idno', 'IDNO (Moldavian company identification number)',
+     ('md',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.me.iban', 'Montenegro IBAN (International Bank Account Number)',
+     ('me',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.me.pib', 'PIB (Poreski Identifikacioni Broj, Montenegro tax number)',
+     ('me',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.meid', 'MEID (Mobile Equipment Identifier)',
+     (),
+     ('calc_check_digit', 'check', 'compact', 'format', 'is_valid', 'to_binary', 'to_pseudo_esn',
+      'validate')),
+    ('stdnum.mk.edb', 'ЕДБ (Едниствен Даночен Број, North Macedonia tax number)',
+     ('mk',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.mt.business_tin', '',
+     ('mt',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.mt.personal_tin', 'MT Personal TIN (Maltese Personal Tax Identification Number)',
+     ('mt',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.mt.vat', 'VAT (Maltese VAT number)',
+     ('mt',),
+     ('checksum', 'compact', 'is_valid', 'validate')),
+    ('stdnum.mu.itan', 'Tax Account Number (Mauritian tax account number for individuals)',
+     ('mu',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.mu.nid', 'ID number (Mauritian national identifier)',
+     ('mu',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.mu.tan', 'Tax Account Number (Mauritian tax account number)',
+     ('mu',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.mx.curp', 'CURP (Clave Única de Registro de Población, Mexican personal ID)',
+     ('mx',),
+     ('calc_check_digit', 'compact', 'get_birth_date', 'get_gender', 'is_valid', 'validate')),
+    ('stdnum.mx.rfc', 'RFC (Registro Federal de Contribuyentes, Mexican tax number)',
+     ('mx',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.my.itn', 'ITN (Income Tax Number, Malaysian TIN number)',
+     ('my',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.my.nric', 'NRIC No. (Malaysian National Registration Identity Card Number)',
+     ('my',),
+     ('compact', 'format', 'get_birth_date', 'get_birth_place', 'is_valid', 'validate')),
+    ('stdnum.ng.business_tin', 'Business TIN (Nigerian Business Tax Identification Number)',
+     ('ng',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ng.personal_tin', 'Personal TIN (Nigerian Personal Tax Identification Number)',
+     ('ng',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.nl.brin', 'BRIN number (the Dutch school identification number)',
+     ('nl',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.nl.bsn', 'BSN (Burgerservicenummer, the Dutch citizen identification number)',
+     ('nl',),
+     ('checksum', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.nl.btw', 'Btw-identificatienummer (Omzetbelastingnummer, the Dutch VAT number)',
+     ('nl',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.nl.identiteitskaartnummer', 'Identiteitskaartnummer, Paspoortnummer (the Dutch passport number)',
+     ('nl',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.nl.onderwijsnummer', 'Onderwijsnummer (the Dutch student identification number)',
+     ('nl',),
+     ('checksum', 'compact', 'is_valid', 'validate')),
+    ('stdnum.nl.postcode', 'Postcode (the Dutch postal code)',
+     ('nl',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.no.fodselsnummer', 'Fødselsnummer (Norwegian birth number, the national identity number)',
+     ('no',),
+     ('calc_check_digit1', 'calc_check_digit2', 'compact', 'format', 'get_birth_date', 'get_gender',
+      'is_valid', 'validate')),
+    ('stdnum.no.iban', 'Norwegian IBAN (International Bank Account Number)',
+     ('no',),
+     ('compact', 'format', 'is_valid', 'to_kontonr', 'validate')),
+    ('stdnum.no.kontonr', 'Konto nr. (Norwegian bank account number)',
+     ('no',),
+     ('check', 'compact', 'format', 'is_valid', 'to_iban', 'validate')),
+    ('stdnum.no.mva', 'MVA (Merverdiavgift, Norwegian VAT number)',
+     ('no',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.no.orgnr', 'Orgnr (Organisasjonsnummer, Norwegian organisation number)',
+     ('no',),
+     ('checksum', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.nz.bankaccount', 'New Zealand bank account number',
+     ('nz',),
+     ('compact', 'format', 'info', 'is_valid', 'validate')),
+    ('stdnum.nz.ird', 'IRD number (New Zealand Inland Revenue Department (Te Tari Tāke) number)',
+     ('nz',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.om.cid', 'CID (Omani Civil ID Number)',
+     ('om',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.om.tin', 'TIN (Omani Tax Identification Number)',
+     ('om',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.om.vat', 'VAT (Omani Value Added Tax number) or VATIN',
+     ('om',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.pe.cui', 'CUI (Cédula Única de Identidad, Peruvian identity number)',
+     ('pe',),
+     ('calc_check_digits', 'compact', 'is_valid', 'to_ruc', 'validate')),
+    ('stdnum.pe.ruc', 'RUC (Registro Único de Contribuyentes, Peruvian company tax number)',
+     ('pe',),
+     ('calc_check_digit', 'compact', 'is_valid', 'to_dni', 'validate')),
+    ('stdnum.ph.business_tin', 'Business NCP (Philippines Business Tax Identification Number)',
+     ('ph',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ph.personal_tin', 'Personal NCP (Philippines Personal Tax Identification Number)',
+     ('ph',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.pk.cnic', 'CNIC number (Pakistani Computerised National Identity Card number)',
+     ('pk',),
+     ('compact', 'format', 'get_gender', 'get_province', 'is_valid', 'validate')),
+    ('stdnum.pl.nip', 'NIP (Numer Identyfikacji Podatkowej, Polish VAT number)',
+     ('pl',),
+     ('checksum', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.pl.pesel', 'PESEL (Polish national identification number)',
+     ('pl',),
+     ('calc_check_digit', 'compact', 'get_birth_date', 'get_gender', 'is_valid', 'validate')),
+    ('stdnum.pl.regon', 'REGON (Rejestr Gospodarki Narodowej, Polish register of economic units)',
+     ('pl',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.pt.cc', 'CC (Número de Cartão de Cidadão, Portuguese Identity number)',
+     ('pt',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.pt.nif', 'NIF (Número de identificação fiscal, Portuguese VAT number)',
+     ('pt',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.py.ruc', 'RUC number (Registro Único de Contribuyentes, Paraguay tax number)',
+     ('py',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.qa.qid', 'QID (Qatar ID number)',
+     ('qa',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.qa.trn', 'TRN (Qatar Tax Registration Number)',
+     ('qa',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ro.cf', 'CF (Cod de înregistrare în scopuri de TVA, Romanian VAT number)',
+     ('ro',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.ro.cnp', 'CNP (Cod Numeric Personal, Romanian Numerical Personal Code)',
+     ('ro',),
+     ('calc_check_digit', 'compact', 'get_birth_date', 'get_county', 'is_valid', 'validate')),
+    ('stdnum.ro.cui', 'CUI or CIF (Codul Unic de Înregistrare, Romanian company identifier)',
+     ('ro',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.ro.onrc', 'ONRC (Ordine din Registrul Comerţului, Romanian Trade Register identifier)',
+     ('ro',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.rs.jmbg', 'JMBG (Jedinstveni Matični Broj Građana, Serbian Unique Master Citizen Number)',
+     ('rs',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.rs.pib', 'PIB (Poreski Identifikacioni Broj, Serbian tax identification number)',
+     ('rs',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.ru.inn', 'ИНН (Идентификационный номер налогоплательщика, Russian tax identifier)',
+     ('ru',),
+     ('calc_company_check_digit', 'calc_personal_check_digits', 'compact', 'is_valid', 'validate')),
+    ('stdnum.ru.ogrn', 'ОГРН, OGRN, PSRN, ОГРНИП, OGRNIP (Russian Primary State Registration Number)',
+     ('ru',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.sa.nid', 'National ID (Saudi Arabian National ID or Iqama number)',
+     ('sa',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.sa.tin_number', 'TIN (Saudi Arabian Tax Identification Number)',
+     ('sa',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.sa.vat_number', 'VAT (Kingdom of Saudi Arabia Value Added Tax number)',
+     ('sa',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.se.orgnr', 'Orgnr (Organisationsnummer, Swedish company number)',
+     ('se',),
+     ('check', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.se.personnummer', 'Personnummer (Swedish personal identity number)',
+     ('se',),
+     ('check', 'compact', 'format', 'get_birth_date', 'get_gender', 'is_valid', 'validate')),
+    ('stdnum.se.postnummer', 'Postcode (the Swedish postal code)',
+     ('se',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.se.vat', 'VAT (Moms, Mervärdesskatt, Swedish VAT number)',
+     ('se',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.sg.nric', '',
+     ('sg',),
+     ('calculate_checksum', 'is_valid', 'is_valid_format', 'validate')),
+    ('stdnum.sg.uen', "UEN (Singapore's Unique Entity Number)",
+     ('sg',),
+     ('calc_business_check_digit', 'calc_local_company_check_digit', 'calc_other_check_digit',
+      'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.si.ddv', 'ID za DDV (Davčna številka, Slovenian VAT number)',
+     ('si',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.si.emso', 'Enotna matična številka občana (Unique Master Citizen Number)',
+     ('si',),
+     ('calc_check_digit', 'compact', 'format', 'get_birth_date', 'get_gender', 'get_region',
+      'is_valid', 'validate')),
+    ('stdnum.si.maticna', 'Matična številka poslovnega registra (Corporate Registration Number)',
+     ('si',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.sk.dph', 'IČ DPH (IČ pre daň z pridanej hodnoty, Slovak VAT number)',
+     ('sk',),
+     ('checksum', 'compact', 'is_valid', 'validate')),
+    ('stdnum.sk.rc', 'RČ (Rodné číslo, the Slovak birth number)',
+     ('sk',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.sm.coe', 'COE (Codice operatore economico, San Marino national tax number)',
+     ('sm',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.sv.nit', 'NIT (Número de Identificación Tributaria, El Salvador tax number)',
+     ('sv',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.th.moa', 'MOA (Thailand Memorandum of Association Number)',
+     ('th',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.th.pin', 'PIN (Thailand Personal Identification Number)',
+     ('th',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.th.tin', 'TIN (Thailand Taxpayer Identification Number)',
+     ('th',),
+     ('compact', 'format', 'is_valid', 'tin_type', 'validate')),
+    ('stdnum.tn.mf', 'MF (Matricule Fiscal, Tunisia tax number)',
+     ('tn',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.tr.tckimlik', 'T.C. Kimlik No. (Turkish personal identification number)',
+     ('tr',),
+     ('calc_check_digits', 'check_kps', 'compact', 'is_valid', 'validate')),
+    ('stdnum.tr.vkn', 'VKN (Vergi Kimlik Numarası, Turkish tax identification number)',
+     ('tr',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.tw.nidcn', 'National ID Card Number',
+     ('tw',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.tw.personal_tin', 'Personal TIN',
+     ('tw',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.tw.ubn', 'UBN (Unified Business Number, 統一編號, Taiwanese tax number)',
+     ('tw',),
+     ('calc_checksum', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.tw.uin', 'UI Number (Unified Identification number)',
+     ('tw',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.ua.edrpou', 'ЄДРПОУ, EDRPOU (Identifier for enterprises and organizations in Ukraine)',
+     ('ua',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.ua.rntrc', 'РНОКПП, RNTRC (Individual taxpayer registration number in Ukraine)',
+     ('ua',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.us.atin', 'ATIN (U.S. Adoption Taxpayer Identification Number)',
+     ('us',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.us.ein', 'EIN (U.S. Employer Identification Number)',
+     ('us',),
+     ('compact', 'format', 'get_campus', 'is_valid', 'validate')),
+    ('stdnum.us.itin', 'ITIN (U.S. Individual Taxpayer Identification Number)',
+     ('us',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.us.personal_tin', 'TIN (U.S. Taxpayer Identification Number)',
+     ('us',),
+     ('compact', 'format', 'guess_type', 'is_valid', 'validate')),
+    ('stdnum.us.ptin', 'PTIN (U.S. Preparer Tax Identification Number)',
+     ('us',),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.us.rtn', 'RTN (Routing transport number)',
+     ('us',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.us.ssn', 'SSN (U.S. Social Security Number)',
+     ('us',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.us.tin', 'TIN (U.S. Taxpayer Identification Number)',
+     ('us',),
+     ('compact', 'format', 'guess_type', 'is_valid', 'validate')),
+    ('stdnum.uy.rut', 'RUT (Registro Único Tributario, Uruguay tax number)',
+     ('uy',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.vatin', 'VATIN (International value added tax identification number)',
+     (),
+     ('compact', 'is_valid', 'validate')),
+    ('stdnum.ve.rif', 'RIF (Registro de Identificación Fiscal, Venezuelan VAT number)',
+     ('ve',),
+     ('calc_check_digit', 'compact', 'is_valid', 'validate')),
+    ('stdnum.verhoeff', 'The Verhoeff algorithm',
+     (),
+     ('calc_check_digit', 'check', 'checksum', 'checksum_many', 'is_valid', 'validate')),
+    ('stdnum.vn.mst', 'MST (Mã số thuế, Vietnam tax number)',
+     ('vn',),
+     ('calc_check_digit', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.za.business_tin', 'Business TIN (South African Business Registration Number)',
+     ('za',),
+     ('compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.za.idnr', 'ID number (South African Identity Document number)',
+     ('za',),
+     ('check', 'compact', 'format', 'get_birth_date', 'get_citizenship', 'get_gender', 'is_valid',
+      'validate')),
+    ('stdnum.za.tin', 'TIN (South African Tax Identification Number)',
+     ('za',),
+     ('check', 'compact', 'format', 'is_valid', 'validate')),
+    ('stdnum.za.vat', 'VAT (South African Value Added Tax number)',
+     ('za',),
+     ('compact', 'format', 'is_valid', 'validate')),
+)
+
+# the formats of the compact numbers that modules accept: (name, deletechars,
+# methods, strip_prefixes, lengths, prefixes, digits)
+formats = (
+    ('stdnum.ad.nrt', ' -.', ('strip', 'upper'), (), (8,), ('A', 'C', 'D', 'E', 'F', 'G', 'L', 'O',
+     'P', 'U'), ((1, -1),)),
+    ('stdnum.ae.eid', ' -', ('strip',), (), (15,), None, ()),
+    ('stdnum.ae.trn', ' -', ('strip',), (), (15,), None, ()),
+    ('stdnum.ar.cbu', ' -', ('strip',), (), (22,), None, ((None, None),)),
+    ('stdnum.ar.cuit', ' -', ('strip',), (), (11,), None, ((None, None),)),
+    ('stdnum.ar.dni', ' .', ('strip',), (), (7, 8), None, ((None, None),)),
+    ('stdnum.at.postleitzahl', '', ('strip',), (), (4,), None, ((None, None),)),
+    ('stdnum.at.tin', ' -./,', ('strip',), (), (9,), None, ((None, None),)),
+    ('stdnum.at.uid', ' -./', ('strip', 'upper'), ('AT',), (9,), ('U',), ((1, None),)),
+    ('stdnum.at.vnr', ' ', (), (), (10,), None, ((None, None),)),
+    ('stdnum.au.abn', ' ', ('strip',), (), (11,), None, ((None, None),)),
+    ('stdnum.au.acn', ' ', ('strip',), (), (9,), None, ((None, None),)),
+    ('stdnum.au.tfn', ' ', ('strip',), (), (8, 9), None, ((None, None),)),
+    ('stdnum.be.bis', ' -.', ('strip',), (), (11,), None, ((None, None),)),
+    ('stdnum.be.eid', ' -./', ('strip', 'upper'), (), (12,), None, ((None, None),)),
+    ('stdnum.be.iban', ' -.', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.be.nn', ' -.', ('strip',), (), (11,), None, ((None, None),)),
+    ('stdnum.be.ssn', ' -.', ('strip',), (), None, None, ()),
+    ('stdnum.bg.egn', ' -.', ('strip', 'upper'), (), (10,), None, ((None, None),)),
+    ('stdnum.bg.pnf', ' -.', ('strip', 'upper'), (), (10,), None, ((None, None),)),
+    ('stdnum.bg.vat', ' -.', ('strip', 'upper'), ('BG',), (9, 10), None, ((None, None),)),
+    ('stdnum.bh.crn', '-', ('strip',), (), (6, 7), None, ((None, None),)),
+    ('stdnum.bh.nid', '', ('strip',), (), (9,), None, ((None, None),)),
+    ('stdnum.bh.vat', '', ('strip',), (), (15,), None, ((None, None),)),
+    ('stdnum.bic', ' -', ('strip', 'upper'), (), (8, 11), None, ()),
+    ('stdnum.br.cnpj', ' -./', ('strip',), (), (14,), None, ((None, None),)),
+    ('stdnum.br.cpf', ' -.', ('strip',), (), (11,), None, ((None, None),)),
+    ('stdnum.ca.bc_phn', '- ', ('strip',), (), (10,), ('9',), ((None, None),)),
+    ('stdnum.ca.bn', '- ', ('strip',), (), (9, 15), None, ((None, 9),)),
+    ('stdnum.ca.sin', '- ', ('strip',), (), (9,), None, ((None, None),)),
+    ('stdnum.cfi', ' -', ('strip', 'upper'), (), (6,), None, ()),
+    ('stdnum.ch.ssn', ' .', ('strip',), (), (13,), ('756',), ()),
+    ('stdnum.cl.rut', ' -.', ('strip', 'upper'), ('CL',), (8, 9), None, ((None, -1),)),
+    ('stdnum.cn.ric', '', ('strip', 'upper'), (), (18,), None, ((None, -1),)),
+    ('stdnum.cn.uscc', ' -', ('strip', 'upper'), (), (18,), None, ((None, 8),)),
+    ('stdnum.co.nit', '.,- ', ('strip', 'upper'), (), (8, 9, 10, 11, 12, 13, 14, 15, 16), None,
+     ((None, None),)),
+    ('stdnum.cr.cpj', ' -', ('strip', 'upper'), (), (10,), ('2', '3', '4', '5'), ((None, None),)),
+    ('stdnum.cr.cr', ' -', ('strip', 'upper'), (), (11, 12), ('1',), ((None, None),)),
+    ('stdnum.cu.ni', ' ', ('strip',), (), (11,), None, ((None, None),)),
+    ('stdnum.cusip', ' ', ('strip', 'upper'), (), (9,), None, ()),
+    ('stdnum.cy.personal_tin', ' -', ('strip', 'upper'), ('CY',), (9,), None, ((None, -1),)),
+    ('stdnum.cy.vat', ' -', ('strip', 'upper'), ('CY',), (9,), None, ((None, -1),)),
+    ('stdnum.cz.dic', ' /', ('strip', 'upper'), ('CZ',), None, None, ((None, None),)),
+    ('stdnum.cz.rc', ' /', ('strip', 'upper'), (), (9, 10), None, ((None, None),)),
+    ('stdnum.de.idnr', '', ('strip',), (), (11,), None, ((None, None),)),
+    ('stdnum.de.stnr', ' -./,', ('strip',), (), (10, 11, 13), None, ((None, None),)),
+    ('stdnum.de.vat', ' -./,', ('strip', 'upper'), ('DE',), (9,), None, ((None, None),)),
+    ('stdnum.de.wkn', ' ', ('strip', 'upper'), (), (6,), None, ()),
+    ('stdnum.dk.cpr', ' -', ('strip',), (), (10,), None, ((None, None),)),
+    ('stdnum.dk.cvr', ' -.,/:', ('strip', 'upper'), ('DK',), (8,), None, ((None, None),)),
+    ('stdnum.do.cedula', ' -', ('strip',), (), None, None, ((None, None),)),
+    ('stdnum.do.ncf', ' ', ('strip', 'upper'), (), (11, 13, 19), None, ()),
+    ('stdnum.do.rnc', ' -', ('strip',), (), None, None, ((None, None),)),
+    ('stdnum.dz.nif', ' ', (), (), (15, 20), None, ((None, None),)),
+    ('stdnum.ean', ' -', ('strip',), (), (8, 12, 13, 14), None, ((None, None),)),
+    ('stdnum.ec.ci', ' -', ('strip', 'upper'), (), (10,), None, ((None, None),)),
+    ('stdnum.ec.ruc', ' -', ('strip', 'upper'), (), (13,), None, ((None, None),)),
+    ('stdnum.ee.ik', ' ', ('strip',), (), (11,), None, ((None, None),)),
+    ('stdnum.ee.kmkr', ' ', ('strip', 'upper'), ('EE',), (9,), None, ((None, None),)),
+    ('stdnum.ee.registrikood', ' ', ('strip',), (), (8,), ('1', '7', '8', '9'), ((None, None),)),
+    ('stdnum.es.cae', '', ('strip', 'upper'), (), (13,), ('ES',), ((9, 12),)),
+    ('stdnum.es.ccc', ' -', ('strip', 'upper'), (), (20,), None, ((None, None),)),
+    ('stdnum.es.cups', ' -', ('strip', 'upper'), (), (20, 22), ('ES',), ((2, 18),)),
+    ('stdnum.es.dni', ' -', ('strip', 'upper'), (), (9,), None, ((None, -1),)),
+    ('stdnum.es.iban', ' -.', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.es.nif', ' -', ('strip', 'upper'), ('ES',), (9,), None, ((1, -1),)),
+    ('stdnum.es.personal_tin', ' -', ('strip', 'upper'), ('ES',), (9,), None, ((1, -1),)),
+    ('stdnum.es.postal_code', ' ', ('strip',), (), (5,), None, ((None, None),)),
+    ('stdnum.es.referenciacatastral', ' -', ('strip', 'upper'), (), (20,), None, ()),
+    ('stdnum.eu.at_02', ' -/?:().m\'+"', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.eu.banknote', ' ', ('strip', 'upper'), (), (12,), ('B', 'C', 'D', 'E', 'F', 'G', 'H',
+     'J', 'L', 'M', 'N', 'P', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z'), ((2, None),)),
+    ('stdnum.eu.eic', ' ', ('strip',), (), (16,), None, ()),
+    ('stdnum.eu.nace', '.', ('strip',), (), None, None, ()),
+    ('stdnum.eu.oss', ' -', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.fi.alv', ' -', ('strip', 'upper'), ('FI',), (8,), None, ((None, None),)),
+    ('stdnum.fi.associationid', ' -._+', ('strip',), (), (1, 2, 3, 4, 5, 6), None, ((None, None),)),
+    ('stdnum.fi.hetu', '', ('strip', 'upper'), (), (11, 12), None, ()),
+    ('stdnum.fi.veronumero', ' ', ('strip',), (), (12,), None, ((None, None),)),
+    ('stdnum.fi.ytunnus', ' -', ('strip', 'upper'), ('FI',), (8,), None, ((None, None),)),
+    ('stdnum.figi', ' ', ('strip', 'upper'), (), (12,), None, ()),
+    ('stdnum.fo.vn', ' -.', ('strip', 'upper'), ('FO',), (6,), None, ((None, None),)),
+    ('stdnum.fr.nif', ' ', ('strip',), (), (13,), ('0', '1', '2', '3'), ((None, None),)),
+    ('stdnum.fr.nir', ' .', ('strip', 'upper'), (), (15,), None, ((7, None), (None, 5))),
+    ('stdnum.fr.siren', ' .', ('strip',), (), (9,), None, ((None, None),)),
+    ('stdnum.fr.siret', ' .', ('strip',), (), (14,), None, ((None, None),)),
+    ('stdnum.fr.tva', ' -.', ('strip', 'upper'), ('FR',), (11,), None, ((2, None),)),
+    ('stdnum.gb.nhs', ' -', ('strip',), (), (10,), None, ((None, None),)),
+    ('stdnum.gb.nin', ' -', ('strip', 'upper'), (), (9,), None, ((2, 8),)),
+    ('stdnum.gb.sedol', ' ', ('strip', 'upper'), (), (7,), None, ()),
+    ('stdnum.gb.upn', ' ', ('strip', 'upper'), (), (13,), None, ((1, -1),)),
+    ('stdnum.gb.vat', ' -.', ('strip', 'upper'), ('GB', 'XI'), None, None, ()),
+    ('stdnum.gh.tin', ' ', ('upper',), (), (11,), None, ()),
+    ('stdnum.gn.nifp', ' -', ('strip',), (), (9,), None, ((None, None),)),
+    ('stdnum.gr.amka', ' -', ('strip',), (), (11,), None, ((None, None),)),
+    ('stdnum.gr.personal_tin', ' :-/,', (), (), (9,), None, ((None, None),)),
+    ('stdnum.grid', ' -', ('strip', 'upper'), ('GRID:',), (18,), None, ()),
+    ('stdnum.gs1_128', '()', ('strip',), (), None, None, ()),
+    ('stdnum.hr.oib', ' -', ('strip', 'upper'), ('HR',), (11,), None, ((None, None),)),
+    ('stdnum.hu.anum', ' -', ('strip', 'upper'), ('HU',), (8,), None, ((None, None),)),
+    ('stdnum.hu.business_tin', ' -', ('strip', 'upper'), ('HU',), (8, 11), None, ((None, None),)),
+    ('stdnum.hu.personal_tin', ' -/,', ('strip', 'upper'), (), (10,), None, ((None, None),)),
+    ('stdnum.iban', ' -.', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.id.nik', '', ('strip',), (), (16,), None, ((None, None),)),
+    ('stdnum.id.npwp', '', ('strip',), (), None, None, ((None, None),)),
+    ('stdnum.ie.pps', ' -', ('strip', 'upper'), (), (8, 9, 10), None, ()),
+    ('stdnum.ie.vat', ' -', ('strip', 'upper'), ('IE',), (8, 9), None, ((2, 7), (None, 1))),
+    ('stdnum.il.hp', ' -', ('strip', 'upper'), ('IL',), (9,), ('5',), ((None, None),)),
+    ('stdnum.imei', ' -', ('strip', 'upper'), (), (14, 15, 16), None, ((None, None),)),
+    ('stdnum.imo', ' ', ('strip', 'upper'), ('IMO',), (7,), None, ((None, None),)),
+    ('stdnum.imsi', ' -', ('strip', 'upper'), (), (14, 15), None, ((None, None),)),
+    ('stdnum.in_.aadhaar', ' -', ('strip',), (), (12,), None, ()),
+    ('stdnum.in_.epic', ' -', ('strip', 'upper'), (), (10,), None, ()),
+    ('stdnum.in_.gstin', ' -', ('strip', 'upper'), (), (15,), None, ()),
+    ('stdnum.in_.pan', ' -', ('strip', 'upper'), (), (10,), None, ()),
+    ('stdnum.in_.vid', ' -', ('strip',), (), (16,), None, ()),
+    ('stdnum.is_.business_tin', '-', ('strip', 'upper'), (), (10, 11), None, ()),
+    ('stdnum.is_.kennitala', '-', ('strip', 'upper'), (), (10, 11), None, ()),
+    ('stdnum.is_.personal_tin', '-', ('strip', 'upper'), (), (10, 11), None, ()),
+    ('stdnum.is_.vsk', ' ', ('strip', 'upper'), ('IS',), (5, 6), None, ((None, None),)),
+    ('stdnum.isil', '', ('strip',), (), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15),
+     None, ()),
+    ('stdnum.isin', ' ', ('strip', 'upper'), (), (12,), None, ()),
+    ('stdnum.ismn', ' -.', ('strip', 'upper'), (), (10, 13), None, ()),
+    ('stdnum.isni', ' -', ('strip', 'upper'), (), (16,), None, ((None, -1),)),
+    ('stdnum.iso11649', ' -.,/:', ('strip', 'upper'), (), (5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15,
+     16, 17, 18, 19, 20, 21, 22, 23, 24, 25), ('RF',), ()),
+    ('stdnum.iso6346', ' ', ('strip', 'upper'), (), (11,), None, ()),
+    ('stdnum.isrc', ' -', ('strip', 'upper'), (), (12,), None, ()),
+    ('stdnum.issn', ' -', ('strip', 'upper'), (), (8,), None, ((None, -1),)),
+    ('stdnum.it.aic', ' ', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.it.codicefiscale', ' -:', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.it.iva', ' -:', ('strip', 'upper'), ('IT',), (11,), None, ((None, None),)),
+    ('stdnum.jp.cn', '- ', ('strip',), (), (13,), None, ((None, None),)),
+    ('stdnum.jp.my_number', '- ', ('strip',), (), (12,), None, ()),
+    ('stdnum.ke.pin', '', ('strip', 'upper'), (), (11,), None, ()),
+    ('stdnum.ke.pin_business', '', ('strip', 'upper'), (), (11,), ('P',), ()),
+    ('stdnum.ke.pin_personal', '', ('strip', 'upper'), (), (11,), ('A',), ()),
+    ('stdnum.kr.brn', ' -', ('strip',), (), (10,), None, ((None, None),)),
+    ('stdnum.kr.rrn', '-', ('strip',), (), (13,), None, ((None, None),)),
+    ('stdnum.kw.business_tin', '', ('strip',), (), (6,), None, ((None, None),)),
+    ('stdnum.kw.cid', '', ('strip',), (), (12,), None, ((None, None),)),
+    ('stdnum.lei', ' -', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.lk.tin', '', ('strip',), (), (9,), None, ((None, None),)),
+    ('stdnum.lt.asmens', ' ', ('strip',), (), (11,), None, ((None, None),)),
+    ('stdnum.lt.pvm', ' -', ('strip', 'upper'), ('LT',), (9, 12), None, ((None, None),)),
+    ('stdnum.lu.personal_tin', ' -/', ('strip', 'upper'), (), (13,), None, ((None, None),)),
+    ('stdnum.lu.tva', ' :.-', ('strip', 'upper'), ('LU',), (8,), None, ((None, None),)),
+    ('stdnum.lv.pvn', ' -', ('strip', 'upper'), ('LV',), (11,), None, ((None, None),)),
+    ('stdnum.ma.ice', '', ('strip',), (), (15,), None, ((None, None),)),
+    ('stdnum.ma.nif', '', ('strip',), (), (8,), None, ((None, None),)),
+    ('stdnum.md.idno', ' ', ('strip',), (), (13,), None, ((None, None),)),
+    ('stdnum.me.iban', ' -.', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.me.pib', ' ', (), (), (8,), None, ((None, None),)),
+    ('stdnum.mt.business_tin', ' -,/', ('strip', 'upper'), (), (9,), None, ((None, None),)),
+    ('stdnum.mt.personal_tin', ' -,/', ('strip', 'upper'), (), (8, 9), None, ()),
+    ('stdnum.mt.vat', ' -', ('strip', 'upper'), ('MT',), (8,), None, ((None, None),)),
+    ('stdnum.mu.itan', ' ', ('strip', 'upper'), (), (8,), None, ()),
+    ('stdnum.mu.nid', ' ', ('strip', 'upper'), (), (14,), None, ()),
+    ('stdnum.mu.tan', ' ', ('strip', 'upper'), (), (8,), None, ()),
+    ('stdnum.mx.curp', '-_ ', ('strip', 'upper'), (), (18,), None, ()),
+    ('stdnum.mx.rfc', '-_ ', ('strip', 'upper'), (), (10, 12, 13), None, ()),
+    ('stdnum.my.itn', ' ', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.my.nric', ' -*', ('strip',), (), (12,), None, ((None, None),)),
+    ('stdnum.ng.business_tin', '', ('strip',), (), None, None, ()),
+    ('stdnum.ng.personal_tin', '', ('strip',), (), (10,), None, ((None, None),)),
+    ('stdnum.nl.brin', ' -.', ('strip', 'upper'), (), (4, 6), None, ()),
+    ('stdnum.nl.identiteitskaartnummer', ' ', ('strip', 'upper'), (), (9,), None, ()),
+    ('stdnum.nl.postcode', ' -', ('strip', 'upper'), ('NL',), (6, 7), None, ()),
+    ('stdnum.no.fodselsnummer', ' -:', (), (), (11,), None, ((None, None),)),
+    ('stdnum.no.iban', ' -.', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.no.kontonr', ' .-', ('strip',), ('0000',), (7, 11), None, ((None, None),)),
+    ('stdnum.no.mva', ' ', ('strip', 'upper'), ('NO',), None, None, ()),
+    ('stdnum.no.orgnr', ' ', ('strip',), (), (9,), None, ((None, None),)),
+    ('stdnum.nz.ird', ' -', ('strip', 'upper'), ('NZ',), (8, 9), None, ((None, None),)),
+    ('stdnum.om.cid', ' -', ('strip',), (), (8,), None, ((None, None),)),
+    ('stdnum.om.tin', ' -', ('strip',), (), (0, 1, 2, 3, 4, 5, 6, 7), None, ((None, None),)),
+    ('stdnum.om.vat', ' -', ('strip', 'upper'), ('OM',), (10,), None, ((None, None),)),
+    ('stdnum.pe.cui', ' -', ('strip', 'upper'), (), (8, 9), None, ((None, 8),)),
+    ('stdnum.pe.ruc', ' ', ('strip',), (), (11,), ('10', '15', '17', '20'), ((None, None),)),
+    ('stdnum.ph.business_tin', '', ('strip',), (), (12,), None, ((None, None),)),
+    ('stdnum.ph.personal_tin', '', ('strip',), (), (12,), None, ((None, None),)),
+    ('stdnum.pk.cnic', '-', ('strip',), (), (13,), None, ((None, None),)),
+    ('stdnum.pl.nip', ' -', ('strip', 'upper'), ('PL',), (10,), None, ((None, None),)),
+    ('stdnum.pl.pesel', ' -', ('strip', 'upper'), (), (11,), None, ((None, None),)),
+    ('stdnum.pl.regon', ' -', ('strip', 'upper'), (), (9, 14), None, ((None, None),)),
+    ('stdnum.pt.cc', ' ', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.pt.nif', ' -.', ('strip', 'upper'), ('PT',), (9,), None, ((None, None),)),
+    ('stdnum.py.ruc', ' -', ('strip', 'upper'), (), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), None, ((None,
+     None),)),
+    ('stdnum.qa.qid', '', ('strip',), (), (11,), ('2', '3'), ((None, None),)),
+    ('stdnum.qa.trn', '', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.ro.cf', ' -', ('strip', 'upper'), (), None, None, ()),
+    ('stdnum.ro.cnp', ' -', ('strip',), (), (13,), ('1', '2', '3', '4', '5', '6', '7', '8', '9'),
+     ((None, None),)),
+    ('stdnum.ro.cui', ' -', ('strip', 'upper'), ('RO',), (2, 3, 4, 5, 6, 7, 8, 9, 10), None, ((None,
+     None),)),
+    ('stdnum.rs.jmbg', ' -.', ('strip',), (), (13,), None, ((None, None),)),
+    ('stdnum.rs.pib', ' -.', ('strip',), (), (9,), None, ((None, None),)),
+    ('stdnum.ru.inn', ' ', ('strip',), (), (10, 12), None, ((None, None),)),
+    ('stdnum.ru.ogrn', ' ', (), (), (13, 15), None, ((None, None),)),
+    ('stdnum.sa.nid', ' -/', ('strip',), (), None, None, ()),
+    ('stdnum.sa.tin_number', ' -/', ('strip',), (), (10,), ('3',), ((None, None),)),
+    ('stdnum.sa.vat_number', ' -', ('strip',), (), (15,), ('3',), ((None, None),)),
+    ('stdnum.se.orgnr', ' -.', ('strip',), (), (10,), None, ((None, None),)),
+    ('stdnum.se.postnummer', ' -', ('strip', 'upper'), ('SE',), (5,), None, ((None, None),)),
+    ('stdnum.se.vat', ' -.', ('strip', 'upper'), ('SE',), None, None, ((None, None),)),
+    ('stdnum.sg.uen', '', ('strip', 'upper'), (), (9, 10), None, ()),
+    ('stdnum.si.ddv', ' -', ('strip', 'upper'), ('SI',), (8,), None, ((None, None),)),
+    ('stdnum.si.emso', ' ', ('strip',), (), (13,), None, ((None, None),)),
+    ('stdnum.sk.dph', ' -', ('strip', 'upper'), ('SK',), (10,), None, ((None, None),)),
+    ('stdnum.sv.nit', ' -', ('strip', 'upper'), ('SV',), (14,), ('0', '1', '9'), ((None, None),)),
+    ('stdnum.th.moa', '', ('strip',), (), (13, 15), ('0',), ((None, None),)),
+    ('stdnum.th.pin', '', ('strip',), (), (13, 15), None, ((None, None),)),
+    ('stdnum.th.tin', '', ('strip',), (), None, None, ()),
+    ('stdnum.tr.tckimlik', '', ('strip',), (), (11,), None, ((None, None),)),
+    ('stdnum.tr.vkn', '', ('strip',), (), (10,), None, ((None, None),)),
+    ('stdnum.tw.nidcn', ' -', ('strip', 'upper'), (), (10,), None, ((1, None),)),
+    ('stdnum.tw.personal_tin', ' -', ('strip',), (), (10,), None, ((2, None),)),
+    ('stdnum.tw.ubn', ' -', ('strip',), (), (8,), None, ((None, None),)),
+    ('stdnum.tw.uin', ' -', ('strip', 'upper'), (), (10,), None, ((2, None),)),
+    ('stdnum.ua.edrpou', ' ', ('strip',), (), (8,), None, ((None, None),)),
+    ('stdnum.ua.rntrc', ' ', ('strip',), (), (10,), None, ((None, None),)),
+    ('stdnum.us.atin', '-', ('strip',), (), None, None, ()),
+    ('stdnum.us.ein', '-', ('strip',), (), None, None, ()),
+    ('stdnum.us.itin', '-', ('strip',), (), None, None, ()),
+    ('stdnum.us.personal_tin', '-', ('strip',), (), None, None, ()),
+    ('stdnum.us.ptin', '-', ('strip',), (), None, None, ()),
+    ('stdnum.us.rtn', '', ('strip',), (), (9,), None, ((None, None),)),
+    ('stdnum.us.ssn', '-', ('strip',), (), None, None, ()),
+    ('stdnum.us.tin', '-', ('strip',), (), None, None, ()),
+    ('stdnum.uy.rut', ' -', ('strip', 'upper'), ('UY',), (12,), None, ((None, None),)),
+    ('stdnum.ve.rif', ' -', ('strip', 'upper'), (), (10,), None, ((1, None),)),
+    ('stdnum.vn.mst', '', ('strip',), (), (10, 13), None, ((None, None),)),
+    ('stdnum.za.business_tin', '/', ('strip',), (), (12,), None, ((None, None),)),
+    ('stdnum.za.idnr', ' ', (), (), (13,), None, ((None, None),)),
+    ('stdnum.za.tin', ' -/', ('strip', 'upper'), (), (10,), ('0', '1', '2', '3', '9'), ((None,
+     None),)),
+    ('stdnum.za.vat', '', ('strip',), (), (10,), ('4',), ((None, None),)),
+)
@@ -34,16 +34,16 @@ InvalidChecksum: ...
 
 from stdnum import luhn
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser
+
+
+_normalise = normaliser(' -./', upper=True, prefix='AT')
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' -./').upper().strip()
-    if number.startswith('AT'):
-        number = number[2:]
-    return number
+    return _normalise(number)
 
 
 def calc_check_digit(number):
@@ -52,22 +52,34 @@ def calc_check_digit(number):
     return str((6 - luhn.checksum(number[1:])) % 10)
 
 
-def validate(number):
+def check(number):
     """Check if the number is a valid VAT number. This checks the length,
-    formatting and check digit."""
+    formatting and check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if number[:1] != 'U' or not isdigits(number[1:]):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 9:
-        raise InvalidLength()
+        return InvalidLength
     if calc_check_digit(number[:-1]) != number[-1]:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Check if the number is a valid VAT number. This checks the length,
+    formatting and check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number is a valid VAT number."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
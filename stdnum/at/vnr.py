@@ -38,7 +38,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -47,11 +47,15 @@ def compact(number):
     return clean(number, ' ')
 
 
+_calc_check_digit = weighted_checksum(
+    (3, 7, 9, 0, 5, 8, 4, 2, 1, 6), 11,
+    check_digits=[str(x) for x in range(11)])
+
+
 def calc_check_digit(number):
     """Calculate the check digit. The fourth digit in the number is
     ignored."""
-    weights = (3, 7, 9, 0, 5, 8, 4, 2, 1, 6)
-    return str(sum(w * int(n) for w, n in zip(weights, number)) % 11)
+    return _calc_check_digit(number)
 
 
 def validate(number):
@@ -43,7 +43,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -52,10 +52,12 @@ def compact(number):
     return clean(number, ' ').strip()
 
 
+_checksum = weighted_checksum((1, 4, 3, 7, 5, 8, 6, 9, 10), 11)
+
+
 def checksum(number):
     """Calculate the checksum."""
-    weights = (1, 4, 3, 7, 5, 8, 6, 9, 10)
-    return sum(w * int(n) for w, n in zip(weights, number)) % 11
+    return _checksum(number)
 
 
 def validate(number):
@@ -44,7 +44,7 @@ InvalidComponent: ...
 import datetime
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -53,11 +53,15 @@ def compact(number):
     return clean(number, ' -.').upper().strip()
 
 
+_calc_check_digit = weighted_checksum(
+    (2, 4, 8, 5, 10, 9, 7, 3, 6), 11,
+    check_digits='01234567890')
+
+
 def calc_check_digit(number):
     """Calculate the check digit. The number passed should not have the
     check digit included."""
-    weights = (2, 4, 8, 5, 10, 9, 7, 3, 6)
-    return str(sum(w * int(n) for w, n in zip(weights, number)) % 11 % 10)
+    return _calc_check_digit(number)
 
 
 def get_birth_date(number):
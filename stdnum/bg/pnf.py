@@ -36,7 +36,7 @@ InvalidFormat: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -45,11 +45,15 @@ def compact(number):
     return clean(number, ' -.').upper().strip()
 
 
+_calc_check_digit = weighted_checksum(
+    (21, 19, 17, 13, 11, 9, 7, 3, 1), 10,
+    check_digits='0123456789')
+
+
 def calc_check_digit(number):
     """Calculate the check digit. The number passed should not have the
     check digit included."""
-    weights = (21, 19, 17, 13, 11, 9, 7, 3, 1)
-    return str(sum(w * int(n) for w, n in zip(weights, number)) % 10)
+    return _calc_check_digit(number)
 
 
 def validate(number):
@@ -36,16 +36,16 @@ InvalidChecksum: ...
 
 from stdnum.bg import egn, pnf
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser, weighted_checksum
+
+
+_normalise = normaliser(' -.', upper=True, prefix='BG')
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' -.').upper().strip()
-    if number.startswith('BG'):
-        number = number[2:]
-    return number
+    return _normalise(number)
 
 
 def calc_check_digit_legal(number):
@@ -57,11 +57,15 @@ def calc_check_digit_legal(number):
     return str(check % 10)
 
 
+_calc_check_digit_other = weighted_checksum(
+    (4, 3, 2, 7, 6, 5, 4, 3, 2), 11,
+    check_digits=[str((11 - x) % 11) for x in range(11)])
+
+
 def calc_check_digit_other(number):
     """Calculate the check digit for others. The number passed should not
     have the check digit included."""
-    weights = (4, 3, 2, 7, 6, 5, 4, 3, 2)
-    return str((11 - sum(w * int(n) for w, n in zip(weights, number))) % 11)
+    return _calc_check_digit_other(number)
 
 
 def validate(number):
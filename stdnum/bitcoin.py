@@ -115,45 +115,57 @@ def _expand_hrp(hrp):
     return [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp]
 
 
-def validate(number):
+def check(number):
     """Check if the number provided is valid. This checks the length and
-    check digit."""
+    check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if number.startswith('1') or number.startswith('3'):
         # P2PKH (pay to pubkey hash) or P2SH (pay to script hash) address
         if not all(x in _base58_alphabet for x in number):
-            raise InvalidFormat()
+            return InvalidFormat
         address = b58decode(number)
         if len(address) != 25:
-            raise InvalidLength()
+            return InvalidLength
         if hashlib.sha256(hashlib.sha256(address[:-4]).digest()).digest()[:4] != address[-4:]:
-            raise InvalidChecksum()
+            return InvalidChecksum
     elif number.startswith('bc1'):
         # Bech32 type address
         if not all(x in _bech32_alphabet for x in number[3:]):
-            raise InvalidFormat()
+            return InvalidFormat
         if len(number) < 11 or len(number) > 90:
-            raise InvalidLength()
+            return InvalidLength
         data = [_bech32_alphabet.index(x) for x in number[3:]]
         if bech32_checksum(_expand_hrp('bc') + data) != 1:
-            raise InvalidChecksum()
+            return InvalidChecksum
         witness_version = data[0]
         witness_program = b32decode(data[1:-6])
         if witness_version > 16:
-            raise InvalidComponent()
+            return InvalidComponent
         if len(witness_program) < 2 or len(witness_program) > 40:
-            raise InvalidLength()
+            return InvalidLength
         if witness_version == 0 and len(witness_program) not in (20, 32):
-            raise InvalidLength()
+            return InvalidLength
     else:
-        raise InvalidComponent()
+        return InvalidComponent
     return number
 
 
+def validate(number):
+    """Check if the number provided is valid. This checks the length and
+    check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is valid. This checks the length and
     check digit."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
@@ -39,7 +39,7 @@ InvalidFormat: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -48,14 +48,22 @@ def compact(number):
     return clean(number, ' -./').strip()
 
 
+_calc_check_digit1 = weighted_checksum(
+    (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2), 11,
+    check_digits=[str((11 - x) % 11 % 10) for x in range(11)])
+
+_calc_check_digit2 = weighted_checksum(
+    (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2), 11,
+    check_digits=[str((11 - x) % 11 % 10) for x in range(11)])
+
+
 def calc_check_digits(number):
     """Calculate the check digits for the number."""
-    d1 = (11 - sum(((3 - i) % 8 + 2) * int(n)
-                   for i, n in enumerate(number[:12]))) % 11 % 10
-    d2 = (11 - sum(((4 - i) % 8 + 2) * int(n)
-                   for i, n in enumerate(number[:12])) -
-          2 * d1) % 11 % 10
-    return '%d%d' % (d1, d2)
+    number = number[:12]
+    d1 = _calc_check_digit1(number)
+    # the first check digit has the weight after the first 12 digits
+    d2 = _calc_check_digit2(number.ljust(12, '0') + d1)
+    return d1 + d2
 
 
 def validate(number):
@@ -43,7 +43,7 @@ InvalidFormat: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -52,13 +52,20 @@ def compact(number):
     return clean(number, ' -.').strip()
 
 
+_calc_check_digit1 = weighted_checksum(
+    (10, 9, 8, 7, 6, 5, 4, 3, 2), 11,
+    check_digits=[str((11 - x) % 11 % 10) for x in range(11)])
+
+_calc_check_digit2 = weighted_checksum(
+    (11, 10, 9, 8, 7, 6, 5, 4, 3, 2), 11,
+    check_digits=[str((11 - x) % 11 % 10) for x in range(11)])
+
+
 def _calc_check_digits(number):
     """Calculate the check digits for the number."""
-    d1 = sum((10 - i) * int(number[i]) for i in range(9))
-    d1 = (11 - d1) % 11 % 10
-    d2 = sum((11 - i) * int(number[i]) for i in range(9)) + 2 * d1
-    d2 = (11 - d2) % 11 % 10
-    return '%d%d' % (d1, d2)
+    d1 = _calc_check_digit1(number[:9])
+    d2 = _calc_check_digit2(number[:9] + d1)
+    return d1 + d2
 
 
 def validate(number):
@@ -54,26 +54,40 @@ def compact(number):
     return clean(number, '- ').strip()
 
 
-def validate(number):
+def check(number):
     """Check if the number is a valid BN or BN15. This checks the length,
-    formatting and check digit."""
+    formatting and check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if len(number) not in (9, 15):
-        raise InvalidLength()
+        return InvalidLength
     if not isdigits(number[:9]):
-        raise InvalidFormat()
-    luhn.validate(number[:9])
+        return InvalidFormat
+    result = luhn.check(number[:9])
+    if isinstance(result, type):
+        return result
     if len(number) == 15:
         if number[9:11] not in ('RC', 'RM', 'RP', 'RT'):
-            raise InvalidComponent()
+            return InvalidComponent
         if not isdigits(number[11:]):
-            raise InvalidFormat()
+            return InvalidFormat
     return number
 
 
+def validate(number):
+    """Check if the number is a valid BN or BN15. This checks the length,
+    formatting and check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number is a valid BN or BN15."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
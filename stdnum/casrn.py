@@ -63,21 +63,32 @@ def calc_check_digit(number):
         sum((i + 1) * int(n) for i, n in enumerate(reversed(number))) % 10)
 
 
-def validate(number):
-    """Check if the number provided is a valid CAS RN."""
+def check(number):
+    """Check if the number provided is a valid CAS RN.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not 7 <= len(number) <= 12:
-        raise InvalidLength()
+        return InvalidLength
     if not _cas_re.match(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if number[-1] != calc_check_digit(number[:-1]):
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Check if the number provided is a valid CAS RN."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid CAS RN."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
@@ -49,17 +49,20 @@ InvalidComponent: ...
 
 from stdnum import numdb
 from stdnum.exceptions import *
-from stdnum.util import clean
+from stdnum.util import normaliser
 
 
 # our open copy of the CFI database
-_cfidb = numdb.get('cfi')
+_cfidb = numdb.lazy('cfi')
+
+
+_normalise = normaliser(' -', upper=True)
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    return clean(number, ' -').strip().upper()
+    return _normalise(number)
 
 
 def info(number):
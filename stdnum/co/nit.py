@@ -36,7 +36,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -45,12 +45,15 @@ def compact(number):
     return clean(number, '.,- ').upper().strip()
 
 
+_calc_check_digit = weighted_checksum(
+    (3, 7, 13, 17, 19, 23, 29, 37, 41, 43, 47, 53, 59, 67, 71), 11,
+    check_digits='01987654321', reverse=True)
+
+
 def calc_check_digit(number):
     """Calculate the check digit. The number passed should not have the
     check digit included."""
-    weights = (3, 7, 13, 17, 19, 23, 29, 37, 41, 43, 47, 53, 59, 67, 71)
-    s = sum(w * int(n) for w, n in zip(weights, reversed(number))) % 11
-    return '01987654321'[s]
+    return _calc_check_digit(number)
 
 
 def validate(number):
@@ -60,24 +60,36 @@ def calc_check_digit(number):
     return str((10 - sum(int(n) for n in number)) % 10)
 
 
-def validate(number):
+def check(number):
     """Check if the number provided is valid. This checks the length and
-    check digit."""
+    check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not all(x in _alphabet for x in number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 9:
-        raise InvalidLength()
+        return InvalidLength
     if calc_check_digit(number[:-1]) != number[-1]:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Check if the number provided is valid. This checks the length and
+    check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is valid. This checks the length and
     check digit."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
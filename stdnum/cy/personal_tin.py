@@ -1,14 +1,14 @@
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser
+
+
+_normalise = normaliser(' -', upper=True, prefix='CY')
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' -').upper().strip()
-    if number.startswith('CY'):
-        number = number[2:]
-    return number
+    return _normalise(number)
 
 
 def validate(number):
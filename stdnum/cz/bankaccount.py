@@ -51,7 +51,7 @@ InvalidComponent: ...
 import re
 
 from stdnum.exceptions import *
-from stdnum.util import clean
+from stdnum.util import clean, weighted_checksum
 
 
 _bankaccount_re = re.compile(
@@ -102,9 +102,11 @@ def to_bic(number):
         return str(bic)
 
 
+_checksum = weighted_checksum((6, 3, 7, 9, 10, 5, 8, 4, 2, 1), 11)
+
+
 def _calc_checksum(number):
-    weights = (6, 3, 7, 9, 10, 5, 8, 4, 2, 1)
-    return sum(w * int(n) for w, n in zip(weights, number.zfill(10))) % 11
+    return _checksum(number.zfill(10))
 
 
 def validate(number):
@@ -54,6 +54,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
+from stdnum.util import byte_values, digit_matrix
 
 
 _operation_table = (
@@ -74,30 +75,58 @@ def checksum(number, table=None):
     returned as an integer value and should be 0 when valid."""
     table = table or _operation_table
     i = 0
-    for n in str(number):
-        i = table[i][int(n)]
+    if isinstance(number, (bytes, bytearray, memoryview)):
+        number = byte_values(number)
+    else:
+        number = (int(n) for n in str(number))
+    for n in number:
+        i = table[i][n]
     return i
 
 
-def validate(number, table=None):
-    """Check if the number provided passes the Damm algorithm."""
+def checksum_many(numbers, table=None):
+    """Calculate the Damm checksums of a sequence of numbers. If numbers is
+    a NumPy array of fixed-width strings or a 2-D matrix of digit values the
+    checksums of all numbers are calculated at once and returned as a NumPy
+    array, otherwise a list of checksums is returned."""
+    values = digit_matrix(numbers)
+    if values is None:
+        return [checksum(number, table=table) for number in numbers]
+    import numpy
+    table = numpy.array(table or _operation_table)
+    i = numpy.zeros(len(values), dtype=table.dtype)
+    for column in values.T:
+        i = table[i, column]
+    return i
+
+
+def check(number, table=None):
+    """Check if the number provided passes the Damm algorithm.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     if not bool(number):
-        raise InvalidFormat()
+        return InvalidFormat
     try:
         valid = checksum(number, table=table) == 0
     except Exception:  # noqa: B902
-        raise InvalidFormat()
+        return InvalidFormat
     if not valid:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number, table=None):
+    """Check if the number provided passes the Damm algorithm."""
+    result = check(number, table)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number, table=None):
     """Check if the number provided passes the Damm algorithm."""
-    try:
-        return bool(validate(number, table=table))
-    except ValidationError:
-        return False
+    return not isinstance(check(number, table=table), type)
 
 
 def calc_check_digit(number, table=None):
@@ -59,7 +59,7 @@ datetime.date(1962, 10, 21)
 import datetime
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -68,11 +68,13 @@ def compact(number):
     return clean(number, ' -').strip()
 
 
+_checksum = weighted_checksum((4, 3, 2, 7, 6, 5, 4, 3, 2, 1), 11)
+
+
 def checksum(number):
     """Calculate the checksum. Note that the checksum isn't actually used
     any more. Valid numbers used to have a checksum of 0."""
-    weights = (4, 3, 2, 7, 6, 5, 4, 3, 2, 1)
-    return sum(w * int(n) for w, n in zip(weights, number)) % 11
+    return _checksum(number)
 
 
 def get_birth_date(number):
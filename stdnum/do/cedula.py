@@ -151,22 +151,33 @@ def compact(number):
     return clean(number, ' -').strip()
 
 
-def validate(number):
-    """Check if the number provided is a valid cedula."""
+def check(number):
+    """Check if the number provided is a valid cedula.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if number in whitelist:
         return number
     if len(number) != 11:
-        raise InvalidLength()
-    return luhn.validate(number)
+        return InvalidLength
+    return luhn.check(number)
+
+
+def validate(number):
+    """Check if the number provided is a valid cedula."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
 
 
 def is_valid(number):
     """Check if the number provided is a valid cedula."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
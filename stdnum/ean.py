@@ -31,7 +31,8 @@ module handles numbers EAN-13, EAN-8, UPC (12-digit) and GTIN (EAN-14) format.
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import (
+    byte_values, clean, isdigits, normaliser, weighted_checksum)
 
 
 def compact(number):
@@ -40,32 +41,78 @@ def compact(number):
     return clean(number, ' -').strip()
 
 
+_calc_check_digit = weighted_checksum(
+    (3, 1), 10,
+    check_digits=[str((10 - x) % 10) for x in range(10)],
+    reverse=True, repeat=True)
+
+
 def calc_check_digit(number):
     """Calculate the EAN check digit for 13-digit numbers. The number passed
     should not have the check bit included."""
-    return str((10 - sum((3, 1)[i % 2] * int(n)
-                         for i, n in enumerate(reversed(number)))) % 10)
+    return _calc_check_digit(number)
 
 
-def validate(number):
+def check(number):
     """Check if the number provided is a valid EAN-13. This checks the length
     and the check bit but does not check whether a known GS1 Prefix and
-    company identifier are referenced."""
+    company identifier are referenced.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) not in (14, 13, 12, 8):
-        raise InvalidLength()
+        return InvalidLength
     if calc_check_digit(number[:-1]) != number[-1]:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def check_many(numbers):
+    """Check a sequence of EANs. This returns a list with the result of
+    check() for each number."""
+    normalise = normaliser(' -')
+    results = []
+    for number in numbers:
+        try:
+            number = normalise(number)
+            values = byte_values(number.encode('ascii'))
+        except (AttributeError, ValueError, ValidationError):
+            # handle other types and characters like check()
+            try:
+                results.append(check(number))
+            except ValidationError as e:
+                results.append(type(e))
+            continue
+        if not values:
+            results.append(InvalidFormat)
+        elif len(values) not in (14, 13, 12, 8):
+            results.append(InvalidLength)
+        elif (sum(values[::-2]) + 3 * sum(values[-2::-2])) % 10:
+            # the check digit is included with a weight of 1
+            results.append(InvalidChecksum)
+        else:
+            results.append(number)
+    return results
+
+
+def validate(number):
+    """Check if the number provided is a valid EAN-13. This checks the length
+    and the check bit but does not check whether a known GS1 Prefix and
+    company identifier are referenced."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid EAN-13. This checks the length
     and the check bit but does not check whether a known GS1 Prefix and
     company identifier are referenced."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
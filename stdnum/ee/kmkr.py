@@ -31,22 +31,24 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser, weighted_checksum
+
+
+_normalise = normaliser(' ', upper=True, prefix='EE')
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' ').upper().strip()
-    if number.startswith('EE'):
-        number = number[2:]
-    return number
+    return _normalise(number)
+
+
+_checksum = weighted_checksum((3, 7, 1, 3, 7, 1, 3, 7, 1), 10)
 
 
 def checksum(number):
     """Calculate the checksum."""
-    weights = (3, 7, 1, 3, 7, 1, 3, 7, 1)
-    return sum(w * int(n) for w, n in zip(weights, number)) % 10
+    return _checksum(number)
 
 
 def validate(number):
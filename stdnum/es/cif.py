@@ -77,31 +77,43 @@ def calc_check_digits(number):
     return check + "JABCDEFGHI"[int(check)]
 
 
-def validate(number):
+def check(number):
     """Check if the number provided is a valid DNI number. This checks the
-    length, formatting and check digit."""
+    length, formatting and check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number[1:-1]):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 9:
-        raise InvalidLength()
+        return InvalidLength
     if number[0] in "ABCDEFGHJNPQRSUVW":
         # there seems to be conflicting information on which organisation types
         # should have which type of check digit (alphabetic or numeric) so
         # we support either here
         if number[-1] not in calc_check_digits(number[:-1]):
-            raise InvalidChecksum()
+            return InvalidChecksum
     else:
         # anything else is invalid
-        raise InvalidFormat()
+        return InvalidFormat
     return number
 
 
+def validate(number):
+    """Check if the number provided is a valid DNI number. This checks the
+    length, formatting and check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid DNI number. This checks the
     length, formatting and check digit."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
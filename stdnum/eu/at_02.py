@@ -60,22 +60,35 @@ def _to_base10(number):
     return ''.join(str(_alphabet.index(x)) for x in number[7:] + number[:4])
 
 
-def validate(number):
-    """Check if the number provided is a valid AT-02."""
+def check(number):
+    """Check if the number provided is a valid AT-02.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     try:
         test_number = _to_base10(number)
     except Exception:  # noqa: B902
-        raise InvalidFormat()
+        return InvalidFormat
     # ensure that checksum is valid
-    mod_97_10.validate(test_number)
+    result = mod_97_10.check(test_number)
+    if isinstance(result, type):
+        return result
     return number
 
 
+def validate(number):
+    """Check if the number provided is a valid AT-02."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid AT-02."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -50,23 +50,34 @@ def checksum(number):
     return sum(int(x) if isdigits(x) else ord(x) for x in number) % 9
 
 
-def validate(number):
-    """Check if the number is a valid banknote serial number."""
+def check(number):
+    """Check if the number is a valid banknote serial number.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not number[:2].isalnum() or not isdigits(number[2:]):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 12:
-        raise InvalidLength()
+        return InvalidLength
     if number[0] not in 'BCDEFGHJLMNPRSTUVWXYZ':
-        raise InvalidComponent()
+        return InvalidComponent
     if checksum(number) != 0:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Check if the number is a valid banknote serial number."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number is a valid banknote serial number."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
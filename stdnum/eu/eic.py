@@ -64,25 +64,37 @@ def calc_check_digit(number):
     return _alphabet[36 - ((s - 1) % 37)]
 
 
-def validate(number):
+def check(number):
     """Check if the number is valid. This checks the length, format and check
-    digit."""
+    digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not all(x in _alphabet for x in number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 16:
-        raise InvalidLength()
+        return InvalidLength
     if number[-1] == '-':
-        raise InvalidFormat()
+        return InvalidFormat
     if number[-1] != calc_check_digit(number):
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Check if the number is valid. This checks the length, format and check
+    digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number is valid. This checks the length, format and check
     digit."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
@@ -37,11 +37,14 @@ that country.
 'FR61954506077'
 >>> guess_country('00449544B01')
 ['nl']
+>>> guess_country_many(['00449544B01', '802070800', '12345'])
+[['nl'], ['gr'], []]
 """
 
 from stdnum.eu import oss
 from stdnum.exceptions import *
-from stdnum.util import clean, get_cc_module, get_soap_client
+from stdnum.util import (
+    _get_module_formats, clean, format_filter, get_cc_module, get_soap_client)
 
 
 MEMBER_STATES = set([
@@ -55,6 +58,11 @@ Ireland numbers are prefixed with xi of United Kingdom numbers."""
 
 _country_modules = dict()
 
+# function to get the countries of which the VAT number format could match
+# the number and the translation table to get the shape of a number (see
+# _get_country_filter())
+_country_filter = None
+
 vies_wsdl = 'https://ec.europa.eu/taxation_customs/vies/checkVatService.wsdl'
 """The WSDL URL of the VAT Information Exchange System (VIES)."""
 
@@ -113,16 +121,77 @@ def is_valid(number):
         return False
 
 
+def _get_country_filter():
+    """Return a function that returns the countries of which the compact
+    number length and the leading characters could match the number and the
+    translation table to get the shape of a number by replacing all digits.
+    Numbers with the same shape match the same countries if the formats have
+    no digits in the characters that are removed or in the prefixes. If they
+    do None is returned instead of the translation table."""
+    global _country_filter
+    if _country_filter is None:
+        countries = dict((_get_cc_module(cc).__name__, cc) for cc in MEMBER_STATES)
+        candidates = format_filter(countries.keys())
+
+        def country_filter(number):
+            return [countries[name] for name in candidates(number)]
+
+        characters = ''.join(
+            module_format.deletechars + ''.join(module_format.strip_prefixes + (module_format.prefixes or ()))
+            for module_format in _get_module_formats() if module_format.name in countries)
+        if any(digit in characters for digit in '0123456789'):
+            shape_table = None
+        else:
+            shape_table = str.maketrans('123456789', '000000000')
+        _country_filter = (country_filter, shape_table)
+    return _country_filter
+
+
+def _get_countries(number):
+    """Return the countries of which the compact number length and the
+    leading characters could match the number. The countries are returned in
+    the same order as MEMBER_STATES."""
+    return _get_country_filter()[0](number)
+
+
 def guess_country(number):
     """Guess the country code based on the number. This checks the number
     against each of the validation routines and returns the list of countries
     for which it is valid. This returns lower case codes and returns gr (not
-    el) for Greece."""
+    el) for Greece. Countries of which the number format (length and leading
+    characters) does not match are not checked."""
     return [cc
-            for cc in MEMBER_STATES
+            for cc in _get_countries(number)
             if _get_cc_module(cc).is_valid(number)]
 
 
+def guess_country_many(numbers):
+    """Guess the country codes of a list of numbers. This returns a list of
+    countries for each number like guess_country(). The numbers are grouped
+    by their shape (the positions of digits and other characters) so that
+    the countries that could match are only determined once for each group
+    of numbers."""
+    numbers = list(numbers)
+    shape_table = _get_country_filter()[1]
+    shapes = {}
+    for index, number in enumerate(numbers):
+        if not isinstance(number, str):
+            shape = None
+        elif shape_table is None:
+            shape = number
+        else:
+            shape = number.translate(shape_table)
+        shapes.setdefault(shape, []).append(index)
+    results = [[] for _number in numbers]
+    for indexes in shapes.values():
+        for cc in _get_countries(numbers[indexes[0]]):
+            is_valid = _get_cc_module(cc).is_valid
+            for index in indexes:
+                if is_valid(numbers[index]):
+                    results[index].append(cc)
+    return results
+
+
 def check_vies(number, timeout=30, verify=True):  # pragma: no cover (not part of normal test suite)
     """Use the EU VIES service to validate the provided number.
 
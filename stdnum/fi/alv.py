@@ -31,22 +31,24 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser, weighted_checksum
+
+
+_normalise = normaliser(' -', upper=True, prefix='FI')
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' -').upper().strip()
-    if number.startswith('FI'):
-        number = number[2:]
-    return number
+    return _normalise(number)
+
+
+_checksum = weighted_checksum((7, 9, 10, 5, 8, 4, 2, 1), 11)
 
 
 def checksum(number):
     """Calculate the checksum."""
-    weights = (7, 9, 10, 5, 8, 4, 2, 1)
-    return sum(w * int(n) for w, n in zip(weights, number)) % 11
+    return _checksum(number)
 
 
 def validate(number):
@@ -58,27 +58,38 @@ def calc_check_digit(number):
     return str((10 - sum(int(n) for n in number)) % 10)
 
 
-def validate(number):
-    """Check if the number provided is a valid FIGI."""
+def check(number):
+    """Check if the number provided is a valid FIGI.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not all(x in '0123456789BCDFGHJKLMNPQRSTVWXYZ' for x in number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 12:
-        raise InvalidLength()
+        return InvalidLength
     if isdigits(number[0]) or isdigits(number[1]):
-        raise InvalidFormat()
+        return InvalidFormat
     if number[:2] in ('BS', 'BM', 'GG', 'GB', 'VG'):
-        raise InvalidComponent()
+        return InvalidComponent
     if number[2] != 'G':
-        raise InvalidComponent()
+        return InvalidComponent
     if calc_check_digit(number[:-1]) != number[-1]:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Check if the number provided is a valid FIGI."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid FIGI."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
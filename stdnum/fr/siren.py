@@ -53,22 +53,36 @@ def compact(number):
     return clean(number, ' .').strip()
 
 
-def validate(number):
+def check(number):
     """Check if the number provided is a valid SIREN. This checks the length,
-    formatting and check digit."""
+    formatting and check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 9:
-        raise InvalidLength()
-    luhn.validate(number)
+        return InvalidLength
+    result = luhn.check(number)
+    if isinstance(result, type):
+        return result
     return number
 
 
+def validate(number):
+    """Check if the number provided is a valid SIREN. This checks the length,
+    formatting and check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid SIREN."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
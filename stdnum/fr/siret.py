@@ -59,29 +59,45 @@ def compact(number):
     return clean(number, ' .').strip()
 
 
-def validate(number):
+def check(number):
     """Check if the number is a valid SIRET. This checks the length,
-    formatting and check digit."""
+    formatting and check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 14:
-        raise InvalidLength()
+        return InvalidLength
     # La Poste SIRET (except the head office) do not use the Luhn checksum
     # but the sum of digits must be a multiple of 5
     if number.startswith('356000000') and number != '35600000000048':
         if sum(map(int, number)) % 5 != 0:
-            raise InvalidChecksum()
+            return InvalidChecksum
     else:
-        luhn.validate(number)
-    siren.validate(number[:9])
+        result = luhn.check(number)
+        if isinstance(result, type):
+            return result
+    result = siren.check(number[:9])
+    if isinstance(result, type):
+        return result
     return number
 
 
+def validate(number):
+    """Check if the number is a valid SIRET. This checks the length,
+    formatting and check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number is a valid SIRET."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
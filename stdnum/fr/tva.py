@@ -45,20 +45,20 @@ InvalidFormat: ...
 
 from stdnum.exceptions import *
 from stdnum.fr import siren
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser
 
 
 # the valid characters for the first two digits (O and I are missing)
 _alphabet = '0123456789ABCDEFGHJKLMNPQRSTUVWXYZ'
 
 
+_normalise = normaliser(' -.', upper=True, prefix='FR')
+
+
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' -.').upper().strip()
-    if number.startswith('FR'):
-        number = number[2:]
-    return number
+    return _normalise(number)
 
 
 def validate(number):
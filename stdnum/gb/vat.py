@@ -36,7 +36,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -48,11 +48,13 @@ def compact(number):
     return number
 
 
+_checksum = weighted_checksum((8, 7, 6, 5, 4, 3, 2, 10, 1), 97)
+
+
 def checksum(number):
     """Calculate the checksum. The checksum is only used for the 9 digits
     of the number and the result can either be 0 or 42."""
-    weights = (8, 7, 6, 5, 4, 3, 2, 10, 1)
-    return sum(w * int(n) for w, n in zip(weights, number)) % 97
+    return _checksum(number)
 
 
 def validate(number):
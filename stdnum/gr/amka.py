@@ -80,22 +80,39 @@ def get_gender(number):
         return 'F'
 
 
-def validate(number):
+def check(number):
     """Check if the number is a valid AMKA. This checks the length,
-    formatting and check digit."""
+    formatting and check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 11:
-        raise InvalidLength()
-    luhn.validate(number)
-    get_birth_date(number)
+        return InvalidLength
+    result = luhn.check(number)
+    if isinstance(result, type):
+        return result
+    try:
+        get_birth_date(number)
+    except ValidationError as e:
+        return type(e)
     return number
 
 
+def validate(number):
+    """Check if the number is a valid AMKA. This checks the length,
+    formatting and check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number is a valid AMKA."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
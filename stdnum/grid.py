@@ -50,19 +50,30 @@ def compact(number):
     return number
 
 
-def validate(number):
-    """Check if the number is a valid GRid."""
+def check(number):
+    """Check if the number is a valid GRid.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     from stdnum.iso7064 import mod_37_36
     number = compact(number)
     if len(number) != 18:
-        raise InvalidLength()
-    return mod_37_36.validate(number)
+        return InvalidLength
+    return mod_37_36.check(number)
+
+
+def validate(number):
+    """Check if the number is a valid GRid."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
 
 
 def is_valid(number):
     """Check if the number is a valid GRid."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -57,7 +57,7 @@ from stdnum.util import clean
 
 
 # our open copy of the application identifier database
-_gs1_aidb = numdb.get('gs1_ai')
+_gs1_aidb = numdb.lazy('gs1_ai')
 
 
 # Extra validation modules based on the application identifier
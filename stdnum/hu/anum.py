@@ -32,22 +32,24 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser, weighted_checksum
+
+
+_normalise = normaliser(' -', upper=True, prefix='HU')
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' -').upper().strip()
-    if number.startswith('HU'):
-        number = number[2:]
-    return number
+    return _normalise(number)
+
+
+_checksum = weighted_checksum((9, 7, 3, 1, 9, 7, 3, 1), 10)
 
 
 def checksum(number):
     """Calculate the checksum. Valid numbers should have a checksum of 0."""
-    weights = (9, 7, 3, 1, 9, 7, 3, 1)
-    return sum(w * int(n) for w, n in zip(weights, number)) % 10
+    return _checksum(number)
 
 
 def validate(number):
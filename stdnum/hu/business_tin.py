@@ -6,17 +6,17 @@
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser
 from .anum import is_valid as anum_is_valid
 
 
+_normalise = normaliser(' -', upper=True, prefix='HU')
+
+
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' -').upper().strip()
-    if number.startswith('HU'):
-        number = number[2:]
-    return number
+    return _normalise(number)
 
 
 def validate(number):
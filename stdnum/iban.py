@@ -49,11 +49,11 @@ import re
 from stdnum import numdb
 from stdnum.exceptions import *
 from stdnum.iso7064 import mod_97_10
-from stdnum.util import clean, get_cc_module
+from stdnum.util import get_cc_module, normaliser
 
 
 # our open copy of the IBAN database
-_ibandb = numdb.get('iban')
+_ibandb = numdb.lazy('iban')
 
 # regular expression to check IBAN structure
 _struct_re = re.compile(r'([1-9][0-9]*)!([nac])')
@@ -62,10 +62,13 @@ _struct_re = re.compile(r'([1-9][0-9]*)!([nac])')
 _country_modules = {}
 
 
+_normalise = normaliser(' -.', upper=True)
+
+
 def compact(number):
     """Convert the iban number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    return clean(number, ' -.').strip().upper()
+    return _normalise(number)
 
 
 def calc_check_digits(number):
@@ -96,33 +99,88 @@ def _get_cc_module(cc):
     return _country_modules[cc]
 
 
-def validate(number, check_country=True):
+def check(number, check_country=True):
     """Check if the number provided is a valid IBAN. The country-specific
-    check can be disabled with the check_country argument."""
+    check can be disabled with the check_country argument.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     # ensure that checksum is valid
-    mod_97_10.validate(number[4:] + number[:4])
+    result = mod_97_10.check(number[4:] + number[:4])
+    if isinstance(result, type):
+        return result
     # look up the number
     info = _ibandb.info(number)
     if not info[0][1]:
-        raise InvalidComponent()
+        return InvalidComponent
     # check if the bban part of number has the correct structure
     bban = number[4:]
     if not _struct_to_re(info[0][1].get('bban', '')).match(bban):
-        raise InvalidFormat()
+        return InvalidFormat
     # check the country-specific module if it exists
     if check_country:
         module = _get_cc_module(number[:2])
         if module:
-            module.validate(number)
+            try:
+                module.validate(number)
+            except ValidationError as e:
+                return type(e)
     # return the compact representation
     return number
 
 
+def check_many(numbers, check_country=True):
+    """Check a sequence of IBANs. This returns a list with the result of
+    check() for each number. The structure of the BBAN is only looked up once
+    for each country."""
+    structures = {}
+    results = []
+    for number in numbers:
+        try:
+            number = compact(number)
+        except ValidationError as e:
+            results.append(type(e))
+            continue
+        # ensure that checksum is valid
+        result = mod_97_10.check(number[4:] + number[:4])
+        if isinstance(result, type):
+            results.append(result)
+            continue
+        # look up the structure of the BBAN for the country
+        cc = number[:2]
+        if cc not in structures:
+            info = _ibandb.info(cc)
+            structures[cc] = _struct_to_re(info[0][1].get('bban', '')) if info[0][1] else None
+        if structures[cc] is None:
+            results.append(InvalidComponent)
+        elif not structures[cc].match(number[4:]):
+            results.append(InvalidFormat)
+        else:
+            results.append(number)
+            # check the country-specific module if it exists
+            module = _get_cc_module(cc) if check_country else None
+            if module:
+                try:
+                    module.validate(number)
+                except ValidationError as e:
+                    results[-1] = type(e)
+    return results
+
+
+def validate(number, check_country=True):
+    """Check if the number provided is a valid IBAN. The country-specific
+    check can be disabled with the check_country argument."""
+    result = check(number, check_country=check_country)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number, check_country=True):
     """Check if the number provided is a valid IBAN."""
     try:
-        return bool(validate(number, check_country=check_country))
+        return not isinstance(check(number, check_country=check_country), type)
     except ValidationError:
         return False
 
@@ -67,29 +67,47 @@ def compact(number):
     return clean(number, '').strip() # separators are not allowed
 
 
-def validate(number):
-    """Check if the number is a valid Indonesia NPWP number."""
+def check(number):
+    """Check if the number is a valid Indonesia NPWP number.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) == 15:
         # Old 15 digit format
-        luhn.validate(number[:9])
+        result = luhn.check(number[:9])
+        if isinstance(result, type):
+            return result
         return number
     if len(number) == 16:
         # New format since 2024: either a NIK (for Indonesian citizens) or
         # the old number with a 0 at the beginning
         if not number.startswith('0'):
-            return nik.validate(number)
-        luhn.validate(number[:10])
+            try:
+                return nik.validate(number)
+            except ValidationError as e:
+                return type(e)
+        result = luhn.check(number[:10])
+        if isinstance(result, type):
+            return result
         return number
-    raise InvalidLength()
+    return InvalidLength
+
+
+def validate(number):
+    """Check if the number is a valid Indonesia NPWP number."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
 
 
 def is_valid(number):
     """Check if the number is a valid Indonesia NPWP number."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -50,37 +50,51 @@ InvalidComponent: ...
 
 from stdnum import luhn
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser
+
+
+_normalise = normaliser(' -', upper=True, prefix='IL')
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any separators and removes surrounding whitespace."""
-    number = clean(number, " -").upper().strip()
-    if number.startswith("IL"):
-        number = number[2:]
-    return number
+    return _normalise(number)
 
 
-def validate(number):
+def check(number):
     """Check if the number provided is a valid ID. This checks the length,
-    formatting and check digit."""
+    formatting and check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if len(number) != 9:
-        raise InvalidLength()
+        return InvalidLength
     if not isdigits(number) or int(number) <= 0:
-        raise InvalidFormat()
+        return InvalidFormat
     if number[0] != "5":
-        raise InvalidComponent()
-    luhn.validate(number)
+        return InvalidComponent
+    result = luhn.check(number)
+    if isinstance(result, type):
+        return result
     return number
 
 
+def validate(number):
+    """Check if the number provided is a valid ID. This checks the length,
+    formatting and check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid ID. This checks the length,
     formatting and check digit."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
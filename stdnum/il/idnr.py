@@ -54,23 +54,37 @@ def compact(number):
     return clean(number, ' -').strip().zfill(9)
 
 
-def validate(number):
+def check(number):
     """Check if the number provided is a valid ID. This checks the length,
-    formatting and check digit."""
+    formatting and check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if len(number) > 9:
-        raise InvalidLength()
+        return InvalidLength
     if not isdigits(number) or int(number) <= 0:
-        raise InvalidFormat()
-    luhn.validate(number)
+        return InvalidFormat
+    result = luhn.check(number)
+    if isinstance(result, type):
+        return result
     return number
 
 
+def validate(number):
+    """Check if the number provided is a valid ID. This checks the length,
+    formatting and check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid ID. This checks the length,
     formatting and check digit."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
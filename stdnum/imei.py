@@ -57,20 +57,33 @@ def compact(number):
     return clean(number, ' -').strip().upper()
 
 
-def validate(number):
-    """Check if the number provided is a valid IMEI (or IMEISV) number."""
+def check(number):
+    """Check if the number provided is a valid IMEI (or IMEISV) number.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) == 15:
         # only 15 digit IMEI has check digit
-        luhn.validate(number)
+        result = luhn.check(number)
+        if isinstance(result, type):
+            return result
     elif len(number) not in (14, 16):
         # neither IMEI without check digit or IMEISV (which doesn't have one)
-        raise InvalidLength()
+        return InvalidLength
     return number
 
 
+def validate(number):
+    """Check if the number provided is a valid IMEI (or IMEISV) number."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def imei_type(number):
     """Check the passed number and return 'IMEI', 'IMEISV' or None (for
     invalid) for checking the type of number passed."""
@@ -87,7 +100,7 @@ def imei_type(number):
 def is_valid(number):
     """Check if the number provided is a valid IMEI (or IMEISV) number."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -41,16 +41,16 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser
+
+
+_normalise = normaliser(' ', upper=True, prefix='IMO')
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' ').upper().strip()
-    if number.startswith('IMO'):
-        number = number[3:]
-    return number
+    return _normalise(number)
 
 
 def calc_check_digit(number):
@@ -58,24 +58,36 @@ def calc_check_digit(number):
     return str(sum(int(n) * (7 - i) for i, n in enumerate(number[:6])) % 10)
 
 
-def validate(number):
+def check(number):
     """Check if the number provided is valid. This checks the length and
-    check digit."""
+    check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 7:
-        raise InvalidLength()
+        return InvalidLength
     if calc_check_digit(number[:-1]) != number[-1]:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Check if the number provided is valid. This checks the length and
+    check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is valid. This checks the length and
     check digit."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -68,22 +68,36 @@ def compact(number):
     return clean(number, ' -').upper().strip()
 
 
-def validate(number):
+def check(number):
     """Check if the number provided is a valid EPIC number. This checks the
-    length, formatting and checksum."""
+    length, formatting and checksum.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if len(number) != 10:
-        raise InvalidLength
+        return InvalidLength
     if not _EPIC_RE.match(number):
-        raise InvalidFormat()
-    luhn.validate(number[3:])
+        return InvalidFormat
+    result = luhn.check(number[3:])
+    if isinstance(result, type):
+        return result
     return number
 
 
+def validate(number):
+    """Check if the number provided is a valid EPIC number. This checks the
+    length, formatting and checksum."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid EPIC number. This checks the
     length, formatting and checksum."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
@@ -118,26 +118,43 @@ def compact(number):
     return clean(number, ' -').upper().strip()
 
 
-def validate(number):
+def check(number):
     """Check if the number provided is a valid GSTIN. This checks the length,
-    formatting and check digit."""
+    formatting and check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if len(number) != 15:
-        raise InvalidLength()
+        return InvalidLength
     if not _GSTIN_RE.match(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if number[:2] not in _STATE_CODES or number[12] == '0' or number[13] != 'Z':
-        raise InvalidComponent()
-    pan.validate(number[2:12])
-    luhn.validate(number, _ALPHABET)
+        return InvalidComponent
+    try:
+        pan.validate(number[2:12])
+    except ValidationError as e:
+        return type(e)
+    result = luhn.check(number, _ALPHABET)
+    if isinstance(result, type):
+        return result
     return number
 
 
+def validate(number):
+    """Check if the number provided is a valid GSTIN. This checks the length,
+    formatting and check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid GSTIN. This checks the length,
     formatting and check digit."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
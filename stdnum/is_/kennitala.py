@@ -44,7 +44,7 @@ import datetime
 import re
 
 from stdnum.exceptions import *
-from stdnum.util import clean
+from stdnum.util import clean, weighted_checksum
 
 
 # Icelandic personal and organisation identity codes are composed of
@@ -65,10 +65,12 @@ def compact(number):
     return clean(number, '-').upper().strip()
 
 
+_checksum = weighted_checksum((3, 2, 7, 6, 5, 4, 3, 2, 1, 0), 11)
+
+
 def checksum(number):
     """Calculate the checksum."""
-    weights = (3, 2, 7, 6, 5, 4, 3, 2, 1, 0)
-    return sum(w * int(n) for w, n in zip(weights, number)) % 11
+    return _checksum(number)
 
 
 def validate(number):
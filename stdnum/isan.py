@@ -75,29 +75,36 @@ def compact(number, strip_check_digits=True):
     return ''.join(number)
 
 
-def validate(number, strip_check_digits=False, add_check_digits=False):
+def check(number, strip_check_digits=False, add_check_digits=False):
     """Check if the number provided is a valid ISAN. If check digits are
     present in the number they are validated. If strip_check_digits is True
     any existing check digits will be removed (after checking). If
     add_check_digits is True the check digit will be added if they are not
-    present yet."""
+    present yet.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     (root, episode, check1, version, check2) = split(number)
     # check digits used
     for x in root + episode + version:
         if x not in '0123456789ABCDEF':
-            raise InvalidFormat()
+            return InvalidFormat
     # check length of all components
     if len(root) != 12 or len(episode) != 4 or len(check1) not in (0, 1) or \
        len(version) not in (0, 8) or len(check1) not in (0, 1):
-        raise InvalidLength()
+        return InvalidLength
     # allow removing check digits
     if strip_check_digits:
         check1 = check2 = ''
     # check check digits
     if check1:
-        mod_37_36.validate(root + episode + check1)
+        result = mod_37_36.check(root + episode + check1)
+        if isinstance(result, type):
+            return result
     if check2:
-        mod_37_36.validate(root + episode + version + check2)
+        result = mod_37_36.check(root + episode + version + check2)
+        if isinstance(result, type):
+            return result
     # add check digits
     if add_check_digits and not check1:
         check1 = mod_37_36.calc_check_digit(root + episode)
@@ -106,11 +113,25 @@ def validate(number, strip_check_digits=False, add_check_digits=False):
     return root + episode + check1 + version + check2
 
 
+def validate(number, strip_check_digits=False, add_check_digits=False):
+    """Check if the number provided is a valid ISAN. If check digits are
+    present in the number they are validated. If strip_check_digits is True
+    any existing check digits will be removed (after checking). If
+    add_check_digits is True the check digit will be added if they are not
+    present yet."""
+    result = check(
+        number, strip_check_digits=strip_check_digits,
+        add_check_digits=add_check_digits)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid ISAN. If check digits are
     present in the number they are validated."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
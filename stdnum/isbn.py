@@ -61,9 +61,15 @@ InvalidChecksum: ...
 '1-85798-218-5'
 """
 
+from operator import mul
+
 from stdnum import ean
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import (
+    byte_values, clean, isdigits, normaliser, weighted_checksum)
+
+
+_normalise = normaliser(' -', upper=True)
 
 
 def compact(number, convert=False):
@@ -71,7 +77,7 @@ def compact(number, convert=False):
     of any valid ISBN separators and removes surrounding whitespace. If the
     convert parameter is True the number is also converted to ISBN-13
     format."""
-    number = clean(number, ' -').strip().upper()
+    number = _normalise(number)
     if len(number) == 9:
         number = '0' + number
     if convert:
@@ -79,42 +85,101 @@ def compact(number, convert=False):
     return number
 
 
+# the weights are the positions of the digits, which repeat modulo 11
+_isbn10_check_digit = weighted_checksum(
+    range(1, 12), 11,
+    check_digits='0123456789X', repeat=True)
+
+
 def _calc_isbn10_check_digit(number):
     """Calculate the ISBN check digit for 10-digit numbers. The number passed
     should not have the check digit included."""
-    check = sum((i + 1) * int(n)
-                for i, n in enumerate(number)) % 11
-    return 'X' if check == 10 else str(check)
+    return _isbn10_check_digit(number)
 
 
-def validate(number, convert=False):
+def check(number, convert=False):
     """Check if the number provided is a valid ISBN (either a legacy 10-digit
     one or a 13-digit one). This checks the length and the check digit but does
-    not check if the group and publisher are valid (use split() for that)."""
+    not check if the group and publisher are valid (use split() for that).
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number, convert=False)
     if not isdigits(number[:-1]):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) == 10:
         if _calc_isbn10_check_digit(number[:-1]) != number[-1]:
-            raise InvalidChecksum()
+            return InvalidChecksum
     elif len(number) == 13:
-        ean.validate(number)
+        result = ean.check(number)
+        if isinstance(result, type):
+            return result
         if number[:3] not in ('978', '979'):
-            raise InvalidComponent()
+            return InvalidComponent
     else:
-        raise InvalidLength()
+        return InvalidLength
     if convert:
         number = to_isbn13(number)
     return number
 
 
+def check_many(numbers, convert=False):
+    """Check a sequence of ISBNs. This returns a list with the result of
+    check() for each number."""
+    results = []
+    for number in numbers:
+        try:
+            number = _normalise(number)
+            if len(number) == 9:
+                number = '0' + number
+            values = byte_values(number[:-1].encode('ascii'))
+        except (AttributeError, ValueError, ValidationError):
+            # handle other types and characters like check()
+            try:
+                results.append(check(number, convert=convert))
+            except ValidationError as e:
+                results.append(type(e))
+            continue
+        if not values:
+            results.append(InvalidFormat)
+        elif len(number) == 10:
+            if '0123456789X'[sum(map(mul, range(1, 10), values)) % 11] != number[-1]:
+                results.append(InvalidChecksum)
+            else:
+                results.append(to_isbn13(number) if convert else number)
+        elif len(number) == 13:
+            if not isdigits(number[-1]):
+                results.append(InvalidFormat)
+            elif (sum(values[-2::-2]) + 3 * sum(values[::-2]) + int(number[-1])) % 10:
+                results.append(InvalidChecksum)
+            elif number[:3] not in ('978', '979'):
+                results.append(InvalidComponent)
+            else:
+                results.append(to_isbn13(number) if convert else number)
+        else:
+            results.append(InvalidLength)
+    return results
+
+
+def validate(number, convert=False):
+    """Check if the number provided is a valid ISBN (either a legacy 10-digit
+    one or a 13-digit one). This checks the length and the check digit but does
+    not check if the group and publisher are valid (use split() for that)."""
+    result = check(number, convert=convert)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def isbn_type(number):
     """Check the passed number and return 'ISBN13', 'ISBN10' or None (for
     invalid) for checking the type of number passed."""
     try:
-        number = validate(number, convert=False)
+        number = check(number, convert=False)
     except ValidationError:
         return None
+    if isinstance(number, type):
+        return None
     if len(number) == 10:
         return 'ISBN10'
     else:  # len(number) == 13:
@@ -126,7 +191,7 @@ def is_valid(number):
     one or a 13-digit one). This checks the length and the check digit but does
     not check if the group and publisher are valid (use split() for that)."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -42,7 +42,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean
+from stdnum.util import clean, digit_matrix
 
 
 # all valid ISO 3166-1 alpha-2 country codes
@@ -94,35 +94,87 @@ def compact(number):
     return clean(number, ' ').strip().upper()
 
 
-def calc_check_digit(number):
-    """Calculate the check digits for the number."""
-    # convert to numeric first, then double some, then sum individual digits
-    number = ''.join(str(_alphabet.index(n)) for n in number)
-    number = ''.join(
-        str((2, 1)[i % 2] * int(n)) for i, n in enumerate(reversed(number)))
-    return str((10 - sum(int(n) for n in number)) % 10)
+def _next_state(state, value):
+    """Return the state after processing the character with the specified
+    value. The state combines the remainder of the sum of the digits and
+    whether the next digit should be doubled (remainder * 2 + doubled)."""
+    check, doubled = divmod(state, 2)
+    # characters are converted to one or two digits that are processed from
+    # the right, every second digit (from the right) is doubled
+    for digit in reversed(str(value)):
+        digit = int(digit)
+        check = (check + (sum(divmod(2 * digit, 10)) if doubled else digit)) % 10
+        doubled = 1 - doubled
+    return check * 2 + doubled
 
 
-def validate(number):
+# the next state for every state, indexed by the position in the alphabet
+_value_transitions = tuple(
+    tuple(_next_state(state, value) for state in range(20))
+    for value in range(len(_alphabet)))
+
+_transitions = dict(zip(_alphabet, _value_transitions))
+
+
+def calc_check_digit(number):
+    """Calculate the check digits for the number."""
+    state = 1  # remainder 0 and the last digit is doubled
+    try:
+        for x in reversed(number):
+            state = _transitions[x][state]
+    except KeyError:
+        raise ValueError('invalid character in number')
+    return str((10 - state // 2) % 10)
+
+
+def calc_check_digit_many(numbers):
+    """Calculate the check digits of a sequence of numbers. If numbers is a
+    NumPy array of fixed-width strings the check digits of all numbers are
+    calculated at once and returned as a NumPy array, otherwise a list of
+    check digits is returned."""
+    values = digit_matrix(numbers, _alphabet)
+    if values is None:
+        return [calc_check_digit(number) for number in numbers]
+    import numpy
+    transitions = numpy.array(_value_transitions, dtype=numpy.uint8)
+    state = numpy.ones(len(values), dtype=numpy.uint8)
+    for column in values.T[::-1]:
+        state = transitions[column, state]
+    return numpy.array(list('0987654321'))[state // 2]
+
+
+def check(number):
     """Check if the number provided is valid. This checks the length and
-    check digit."""
+    check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not all(x in _alphabet for x in number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 12:
-        raise InvalidLength()
+        return InvalidLength
     if number[:2] not in _country_codes:
-        raise InvalidComponent()
+        return InvalidComponent
     if calc_check_digit(number[:-1]) != number[-1]:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Check if the number provided is valid. This checks the length and
+    check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is valid. This checks the length and
     check digit."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -53,24 +53,39 @@ def compact(number):
     return clean(number, ' -.').strip().upper()
 
 
-def validate(number):
+def check(number):
     """Check if the number provided is a valid ISMN (either a legacy 10-digit
     one or a 13-digit one). This checks the length and the check bit but does
-    not check if the publisher is known."""
+    not check if the publisher is known.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if len(number) == 10:
         if number[0] != 'M':
-            raise InvalidFormat()
-        ean.validate('9790' + number[1:])
+            return InvalidFormat
+        result = ean.check('9790' + number[1:])
     elif len(number) == 13:
         if not number.startswith('9790'):
-            raise InvalidComponent()
-        ean.validate(number)
+            return InvalidComponent
+        result = ean.check(number)
     else:
-        raise InvalidLength()
+        return InvalidLength
+    if isinstance(result, type):
+        return result
     return number
 
 
+def validate(number):
+    """Check if the number provided is a valid ISMN (either a legacy 10-digit
+    one or a 13-digit one). This checks the length and the check bit but does
+    not check if the publisher is known."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def ismn_type(number):
     """Check the type of ISMN number passed and return 'ISMN13', 'ISMN10'
     or None (for invalid)."""
@@ -89,7 +104,7 @@ def is_valid(number):
     one or a 13-digit one). This checks the length and the check bit but does
     not check if the publisher is known."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
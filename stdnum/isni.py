@@ -55,22 +55,33 @@ def compact(number):
     return clean(number, ' -').strip().upper()
 
 
-def validate(number):
+def check(number):
     """Check if the number is a valid ISNI. This checks the length and
-    whether the check digit is correct."""
+    whether the check digit is correct.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number[:-1]):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 16:
-        raise InvalidLength()
-    mod_11_2.validate(number)
-    return number
+        return InvalidLength
+    return mod_11_2.check(number)
+
+
+def validate(number):
+    """Check if the number is a valid ISNI. This checks the length and
+    whether the check digit is correct."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
 
 
 def is_valid(number):
     """Check if the number provided is a valid ISNI."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -56,23 +56,37 @@ def compact(number):
     return clean(number, ' -.,/:').upper().strip()
 
 
-def validate(number):
+def check(number):
     """Check if the number provided is a valid ISO 11649 structured creditor
-    reference number."""
+    reference number.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if len(number) < 5 or len(number) > 25:
-        raise InvalidLength()
+        return InvalidLength
     if not number.startswith('RF'):
-        raise InvalidFormat()
-    mod_97_10.validate(number[4:] + number[:4])
+        return InvalidFormat
+    result = mod_97_10.check(number[4:] + number[:4])
+    if isinstance(result, type):
+        return result
     return number
 
 
+def validate(number):
+    """Check if the number provided is a valid ISO 11649 structured creditor
+    reference number."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid ISO 11649 structured creditor
     number. This checks the length, formatting and check digits."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -67,23 +67,34 @@ def calc_check_digit(number):
         for i, n in enumerate(number)) % 11 % 10)
 
 
-def validate(number):
-    """Validate the given number (unicode) for conformity to ISO 6346."""
+def check(number):
+    """Validate the given number (unicode) for conformity to ISO 6346.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if len(number) != 11:
-        raise InvalidLength()
+        return InvalidLength
     if not _iso6346_re.match(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if calc_check_digit(number[:-1]) != number[-1]:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Validate the given number (unicode) for conformity to ISO 6346."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check whether the number conforms to the standard ISO6346. Unlike
     the validate function, this will not raise ValidationError(s)."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -36,11 +36,14 @@ For a module that can do generic Mod x+1, x calculations see the
 """
 
 from stdnum.exceptions import *
+from stdnum.util import byte_values
 
 
 def checksum(number):
     """Calculate the checksum. A valid number should have a checksum of 1."""
     check = 5
+    if isinstance(number, (bytes, bytearray, memoryview)):
+        number = byte_values(number)
     for n in number:
         check = (((check or 10) * 2) % 11 + int(n)) % 10
     return check
@@ -52,20 +55,28 @@ def calc_check_digit(number):
     return str((1 - ((checksum(number) or 10) * 2) % 11) % 10)
 
 
-def validate(number):
-    """Check whether the check digit is valid."""
+def check(number):
+    """Check whether the check digit is valid.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     try:
         valid = checksum(number) == 1
     except Exception:  # noqa: B902
-        raise InvalidFormat()
+        return InvalidFormat
     if not valid:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Check whether the check digit is valid."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check whether the check digit is valid."""
-    try:
-        return bool(validate(number))
-    except ValidationError:
-        return False
+    return not isinstance(check(number), type)
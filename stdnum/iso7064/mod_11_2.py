@@ -38,11 +38,14 @@ For a module that can do generic Mod x, 2 calculations see the
 """
 
 from stdnum.exceptions import *
+from stdnum.util import byte_values
 
 
 def checksum(number):
     """Calculate the checksum. A valid number should have a checksum of 1."""
     check = 0
+    if isinstance(number, (bytes, bytearray, memoryview)):
+        number = byte_values(number, '0123456789X')
     for n in number:
         check = (2 * check + int(10 if n == 'X' else n)) % 11
     return check
@@ -55,20 +58,28 @@ def calc_check_digit(number):
     return 'X' if c == 10 else str(c)
 
 
-def validate(number):
-    """Check whether the check digit is valid."""
+def check(number):
+    """Check whether the check digit is valid.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     try:
         valid = checksum(number) == 1
     except Exception:  # noqa: B902
-        raise InvalidFormat()
+        return InvalidFormat
     if not valid:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Check whether the check digit is valid."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check whether the check digit is valid."""
-    try:
-        return bool(validate(number))
-    except ValidationError:
-        return False
+    return not isinstance(check(number), type)
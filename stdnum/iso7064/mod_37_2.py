@@ -41,14 +41,45 @@ algorithm. For example Mod 11, 2:
 """
 
 from stdnum.exceptions import *
+from stdnum.util import byte_values
+
+
+# cache of the tables that are used by checksum() for each alphabet
+_alphabet_tables = {}
+
+
+def _mk_alphabet_tables(alphabet):
+    """Return a dict that maps the characters of the alphabet to a table of
+    the next checksum value for each checksum value and a list of those
+    tables indexed by the position in the alphabet."""
+    modulus = len(alphabet)
+    transitions = [
+        tuple((2 * check + n) % modulus for check in range(modulus))
+        for n in range(modulus)]
+    characters = {}
+    for n, x in enumerate(alphabet):
+        characters.setdefault(x, transitions[n])
+    return characters, transitions
 
 
 def checksum(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ*'):
     """Calculate the checksum. A valid number should have a checksum of 1."""
-    modulus = len(alphabet)
+    try:
+        characters, transitions = _alphabet_tables[alphabet]
+    except KeyError:
+        characters, transitions = _alphabet_tables[alphabet] = _mk_alphabet_tables(alphabet)
+    except TypeError:  # alphabet is not hashable
+        characters, transitions = _mk_alphabet_tables(alphabet)
+    if isinstance(number, (bytes, bytearray, memoryview)):
+        # the positions in the alphabet are the values
+        number = byte_values(number, alphabet)
+        characters = transitions
     check = 0
-    for n in number:
-        check = (2 * check + alphabet.index(n)) % modulus
+    try:
+        for n in number:
+            check = characters[n][check]
+    except KeyError:
+        raise ValueError('invalid character in number')
     return check
 
 
@@ -59,20 +90,28 @@ def calc_check_digit(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ*'):
     return alphabet[(1 - 2 * checksum(number, alphabet)) % modulus]
 
 
-def validate(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ*'):
-    """Check whether the check digit is valid."""
+def check(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ*'):
+    """Check whether the check digit is valid.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     try:
         valid = checksum(number, alphabet) == 1
     except Exception:  # noqa: B902
-        raise InvalidFormat()
+        return InvalidFormat
     if not valid:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ*'):
+    """Check whether the check digit is valid."""
+    result = check(number, alphabet)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ*'):
     """Check whether the check digit is valid."""
-    try:
-        return bool(validate(number, alphabet))
-    except ValidationError:
-        return False
+    return not isinstance(check(number, alphabet), type)
@@ -39,14 +39,46 @@ algorithm. For example Mod 11, 10:
 """
 
 from stdnum.exceptions import *
+from stdnum.util import byte_values
+
+
+# cache of the tables that are used by checksum() for each alphabet
+_alphabet_tables = {}
+
+
+def _mk_alphabet_tables(alphabet):
+    """Return a dict that maps the characters of the alphabet to a table of
+    the next checksum value for each checksum value and a list of those
+    tables indexed by the position in the alphabet."""
+    modulus = len(alphabet)
+    transitions = [
+        tuple((((check or modulus) * 2) % (modulus + 1) + n) % modulus
+              for check in range(modulus))
+        for n in range(modulus)]
+    characters = {}
+    for n, x in enumerate(alphabet):
+        characters.setdefault(x, transitions[n])
+    return characters, transitions
 
 
 def checksum(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
     """Calculate the checksum. A valid number should have a checksum of 1."""
-    modulus = len(alphabet)
-    check = modulus // 2
-    for n in number:
-        check = (((check or modulus) * 2) % (modulus + 1) + alphabet.index(n)) % modulus
+    try:
+        characters, transitions = _alphabet_tables[alphabet]
+    except KeyError:
+        characters, transitions = _alphabet_tables[alphabet] = _mk_alphabet_tables(alphabet)
+    except TypeError:  # alphabet is not hashable
+        characters, transitions = _mk_alphabet_tables(alphabet)
+    if isinstance(number, (bytes, bytearray, memoryview)):
+        # the positions in the alphabet are the values
+        number = byte_values(number, alphabet)
+        characters = transitions
+    check = len(alphabet) // 2
+    try:
+        for n in number:
+            check = characters[n][check]
+    except KeyError:
+        raise ValueError('invalid character in number')
     return check
 
 
@@ -57,20 +89,28 @@ def calc_check_digit(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
     return alphabet[(1 - ((checksum(number, alphabet) or modulus) * 2) % (modulus + 1)) % modulus]
 
 
-def validate(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
-    """Check whether the check digit is valid."""
+def check(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
+    """Check whether the check digit is valid.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     try:
         valid = checksum(number, alphabet) == 1
     except Exception:  # noqa: B902
-        raise InvalidFormat()
+        return InvalidFormat
     if not valid:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
+    """Check whether the check digit is valid."""
+    result = check(number, alphabet)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number, alphabet='0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'):
     """Check whether the check digit is valid."""
-    try:
-        return bool(validate(number, alphabet))
-    except ValidationError:
-        return False
+    return not isinstance(check(number, alphabet), type)
@@ -35,39 +35,91 @@ valid if the number modulo 97 is 1. As such it has two check digits.
 """
 
 from stdnum.exceptions import *
+from stdnum.util import byte_values, digit_matrix
 
 
-def _to_base10(number):
-    """Prepare the number to its base10 representation."""
-    return ''.join(
-        str(int(x, 36)) for x in number)
+_alphabet = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+# The value of each character is appended to the decimal representation of
+# the number so the next remainder only depends on the current remainder and
+# the character. These tables hold the next remainder for every remainder,
+# indexed by the value of the character.
+_value_transitions = tuple(
+    tuple((check * (10 if value < 10 else 100) + value) % 97 for check in range(97))
+    for value in range(len(_alphabet)))
+
+_transitions = dict(zip(_alphabet, _value_transitions))
+_transitions.update(zip(_alphabet.lower(), _value_transitions))
 
 
 def checksum(number):
     """Calculate the checksum. A valid number should have a checksum of 1."""
-    return int(_to_base10(number)) % 97
+    if not number:
+        raise ValueError('empty number')
+    check = 0
+    if isinstance(number, (bytes, bytearray, memoryview)):
+        for x in byte_values(bytes(number).upper(), _alphabet):
+            check = _value_transitions[x][check]
+        return check
+    for x in number:
+        try:
+            check = _transitions[x][check]
+        except KeyError:
+            # handle other characters that int() accepts (e.g. other digits)
+            x = str(int(x, 36))
+            check = (check * 10 ** len(x) + int(x)) % 97
+    return check
+
+
+def checksum_many(numbers):
+    """Calculate the checksums of a sequence of numbers. If numbers is a
+    NumPy array of fixed-width (upper case) strings or a 2-D matrix of
+    character values the checksums of all numbers are calculated at once and
+    returned as a NumPy array, otherwise a list of checksums is returned."""
+    values = digit_matrix(numbers, _alphabet)
+    if values is None:
+        return [checksum(number) for number in numbers]
+    import numpy
+    transitions = numpy.array(_value_transitions, dtype=numpy.uint8)
+    check = numpy.zeros(len(values), dtype=numpy.uint8)
+    for column in values.T:
+        check = transitions[column, check]
+    return check
 
 
 def calc_check_digits(number):
     """Calculate the extra digits that should be appended to the number to
     make it a valid number."""
-    return '%02d' % (98 - checksum(number + '00'))
+    if isinstance(number, (bytes, bytearray, memoryview)):
+        number = bytes(number) + b'00'
+    else:
+        number = number + '00'
+    return '%02d' % (98 - checksum(number))
 
 
-def validate(number):
-    """Check whether the check digit is valid."""
+def check(number):
+    """Check whether the check digit is valid.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     try:
         valid = checksum(number) == 1
     except Exception:  # noqa: B902
-        raise InvalidFormat()
+        return InvalidFormat
     if not valid:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Check whether the check digit is valid."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check whether the check digit is valid."""
-    try:
-        return bool(validate(number))
-    except ValidationError:
-        return False
+    return not isinstance(check(number), type)
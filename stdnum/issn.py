@@ -68,23 +68,35 @@ def calc_check_digit(number):
     return 'X' if check == 10 else str(check)
 
 
-def validate(number):
+def check(number):
     """Check if the number is a valid ISSN. This checks the length and
-    whether the check digit is correct."""
+    whether the check digit is correct.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number[:-1]):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 8:
-        raise InvalidLength()
+        return InvalidLength
     if calc_check_digit(number[:-1]) != number[-1]:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Check if the number is a valid ISSN. This checks the length and
+    whether the check digit is correct."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid ISSN."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
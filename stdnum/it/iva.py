@@ -36,36 +36,50 @@ InvalidChecksum: ...
 
 from stdnum import luhn
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser
+
+
+_normalise = normaliser(' -:', upper=True, prefix='IT')
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' -:').upper().strip()
-    if number.startswith('IT'):
-        number = number[2:]
-    return number
+    return _normalise(number)
 
 
-def validate(number):
+def check(number):
     """Check if the number is a valid VAT number. This checks the length,
-    formatting and check digit."""
+    formatting and check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number) or int(number[0:7]) == 0:
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 11:
-        raise InvalidLength()
+        return InvalidLength
     # check the province of residence
     if not ('001' <= number[7:10] <= '100' or number[7:10] in ('120', '121', '888', '999')):
-        raise InvalidComponent()
-    luhn.validate(number)
+        return InvalidComponent
+    result = luhn.check(number)
+    if isinstance(result, type):
+        return result
     return number
 
 
+def validate(number):
+    """Check if the number is a valid VAT number. This checks the length,
+    formatting and check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number is a valid VAT number."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
@@ -41,7 +41,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -50,12 +50,15 @@ def compact(number):
     return clean(number, '- ').strip()
 
 
+_calc_check_digit = weighted_checksum(
+    (1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2), 9,
+    check_digits=[str(9 - x) for x in range(9)], reverse=True)
+
+
 def calc_check_digit(number):
     """Calculate the check digit. The number passed should not have
     the check digit included."""
-    weights = (1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2)
-    s = sum(w * int(n) for w, n in zip(weights, reversed(number))) % 9
-    return str(9 - s)
+    return _calc_check_digit(number)
 
 
 def validate(number):
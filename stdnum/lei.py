@@ -51,17 +51,27 @@ def compact(number):
     return clean(number, ' -').strip().upper()
 
 
+def check(number):
+    """Check if the number is valid. This checks the length, format and check
+    digits.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
+    return mod_97_10.check(compact(number))
+
+
 def validate(number):
     """Check if the number is valid. This checks the length, format and check
     digits."""
-    number = compact(number)
-    mod_97_10.validate(number)
-    return number
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
 
 
 def is_valid(number):
     """Check if the number is valid."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
@@ -33,16 +33,16 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser
+
+
+_normalise = normaliser(' :.-', upper=True, prefix='LU')
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' :.-').upper().strip()
-    if number.startswith('LU'):
-        number = number[2:]
-    return number
+    return _normalise(number)
 
 
 def calc_check_digits(number):
@@ -45,42 +45,153 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
+from stdnum.util import byte_values, digit_matrix
+
+
+# cache of the tables that are used by checksum() for each alphabet
+_alphabet_tables = {}
+
+
+def _mk_alphabet_tables(alphabet):
+    """Return a dict that maps the characters of the alphabet to their
+    value and a table of the values of the doubled digits."""
+    values = {}
+    for i, x in enumerate(alphabet):
+        values.setdefault(x, i)
+    n = len(alphabet)
+    return values, tuple(sum(divmod(i * 2, n)) for i in range(n))
 
 
 def checksum(number, alphabet='0123456789'):
     """Calculate the Luhn checksum over the provided number. The checksum
     is returned as an int. Valid numbers should have a checksum of 0."""
-    n = len(alphabet)
-    number = tuple(alphabet.index(i)
-                   for i in reversed(str(number)))
-    return (sum(number[::2]) +
-            sum(sum(divmod(i * 2, n))
-                for i in number[1::2])) % n
+    try:
+        values, doubled = _alphabet_tables[alphabet]
+    except KeyError:
+        values, doubled = _alphabet_tables[alphabet] = _mk_alphabet_tables(alphabet)
+    except TypeError:  # alphabet is not hashable
+        values, doubled = _mk_alphabet_tables(alphabet)
+    if isinstance(number, (bytes, bytearray, memoryview)):
+        # the positions in the alphabet are the values
+        number = byte_values(number, alphabet)
+        values = range(len(alphabet))
+    else:
+        number = str(number)
+    # every second digit from the right is doubled
+    check = 0
+    double = False
+    try:
+        for x in reversed(number):
+            x = values[x]
+            check += doubled[x] if double else x
+            double = not double
+    except KeyError:
+        raise ValueError('invalid character in number')
+    return check % len(alphabet)
 
 
-def validate(number, alphabet='0123456789'):
-    """Check if the number provided passes the Luhn checksum."""
+def checksum_many(numbers, alphabet='0123456789'):
+    """Calculate the Luhn checksums of a sequence of numbers. If numbers is
+    a NumPy array of fixed-width strings or a 2-D matrix of digit values the
+    checksums of all numbers are calculated at once and returned as a NumPy
+    array, otherwise a list of checksums is returned."""
+    values = digit_matrix(numbers, alphabet)
+    if values is None:
+        return [checksum(number, alphabet) for number in numbers]
+    import numpy
+    doubled = numpy.array(
+        (_alphabet_tables.get(alphabet) or _mk_alphabet_tables(alphabet))[1])
+    # every second digit from the right is doubled
+    check = values[:, -1::-2].sum(axis=1, dtype=numpy.intp)
+    check += doubled[values[:, -2::-2]].sum(axis=1, dtype=numpy.intp)
+    return check % len(alphabet)
+
+
+def check(number, alphabet='0123456789'):
+    """Check if the number provided passes the Luhn checksum.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     if not bool(number):
-        raise InvalidFormat()
+        return InvalidFormat
     try:
         valid = checksum(number, alphabet) == 0
     except Exception:  # noqa: B902
-        raise InvalidFormat()
+        return InvalidFormat
     if not valid:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def _mk_byte_tables(alphabet):
+    """Return translation tables for bytes.translate() that map ASCII
+    characters of the alphabet to their value and their doubled value and
+    other characters to 255 (or None if the alphabet cannot be mapped)."""
+    values, doubled = _alphabet_tables.get(alphabet) or _mk_alphabet_tables(alphabet)
+    if len(alphabet) >= 255 or any(ord(x) >= 128 for x in values):
+        return None
+    value_table = bytearray(b'\xff' * 256)
+    doubled_table = bytearray(b'\xff' * 256)
+    for x, value in values.items():
+        value_table[ord(x)] = value
+        doubled_table[ord(x)] = doubled[value]
+    return bytes(value_table), bytes(doubled_table)
+
+
+# cache of the tables that are used by check_many() for each alphabet
+_byte_tables = {}
+
+
+def check_many(numbers, alphabet='0123456789'):
+    """Check a sequence of numbers with the Luhn checksum. This returns a
+    list with the result of check() for each number."""
+    try:
+        tables = _byte_tables[alphabet]
+    except KeyError:
+        tables = _byte_tables[alphabet] = _mk_byte_tables(alphabet)
+    except TypeError:  # alphabet is not hashable
+        tables = None
+    if tables is None:
+        return [check(number, alphabet) for number in numbers]
+    value_table, doubled_table = tables
+    n = len(alphabet)
+    results = []
+    for number in numbers:
+        try:
+            values = number.encode('ascii').translate(value_table)
+        except (AttributeError, UnicodeError):
+            # handle other types and non-ASCII characters like check()
+            results.append(check(number, alphabet))
+            continue
+        if not values or 255 in values:
+            results.append(InvalidFormat)
+        elif (sum(values[::-2]) + sum(number[-2::-2].encode('ascii').translate(doubled_table))) % n:
+            # every second character from the right is doubled
+            results.append(InvalidChecksum)
+        else:
+            results.append(number)
+    return results
+
+
+def validate(number, alphabet='0123456789'):
+    """Check if the number provided passes the Luhn checksum."""
+    result = check(number, alphabet)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number, alphabet='0123456789'):
     """Check if the number passes the Luhn checksum."""
-    try:
-        return bool(validate(number, alphabet))
-    except ValidationError:
-        return False
+    return not isinstance(check(number, alphabet), type)
 
 
 def calc_check_digit(number, alphabet='0123456789'):
     """Calculate the extra digit that should be appended to the number to
     make it a valid number."""
-    ck = checksum(str(number) + alphabet[0], alphabet)
+    if isinstance(number, (bytes, bytearray, memoryview)):
+        number = bytes(number) + alphabet[0].encode('ascii')
+    else:
+        number = str(number) + alphabet[0]
+    ck = checksum(number, alphabet)
     return alphabet[-ck]
@@ -42,7 +42,7 @@ InvalidComponent: ...
 import datetime
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser
 
 
 # validation functions are available on-line but it is not allowed
@@ -50,13 +50,13 @@ from stdnum.util import clean, isdigits
 # https://www6.vid.gov.lv/VID_PDB?aspxerrorpath=/vid_pdb/pvn.asp
 
 
+_normalise = normaliser(' -', upper=True, prefix='LV')
+
+
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' -').upper().strip()
-    if number.startswith('LV'):
-        number = number[2:]
-    return number
+    return _normalise(number)
 
 
 def checksum(number):
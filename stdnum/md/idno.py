@@ -38,7 +38,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -47,10 +47,14 @@ def compact(number):
     return clean(number, ' ').strip()
 
 
+_calc_check_digit = weighted_checksum(
+    (7, 3, 1, 7, 3, 1, 7, 3, 1, 7, 3, 1), 10,
+    check_digits='0123456789')
+
+
 def calc_check_digit(number):
     """Calculate the check digit."""
-    weights = (7, 3, 1, 7, 3, 1, 7, 3, 1, 7, 3, 1)
-    return str(sum(w * int(n) for w, n in zip(weights, number)) % 10)
+    return _calc_check_digit(number)
 
 
 def validate(number):
@@ -39,7 +39,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -51,10 +51,14 @@ def compact(number):
     return clean(number, ' ')
 
 
+_calc_check_digit = weighted_checksum(
+    (8, 7, 6, 5, 4, 3, 2), 11,
+    check_digits=[str(-x % 11 % 10) for x in range(11)])
+
+
 def calc_check_digit(number):
     """Calculate the check digit for the number."""
-    weights = (8, 7, 6, 5, 4, 3, 2)
-    return str((-sum(w * int(n) for w, n in zip(weights, number))) % 11 % 10)
+    return _calc_check_digit(number)
 
 
 def validate(number):
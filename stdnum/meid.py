@@ -105,41 +105,63 @@ def compact(number, strip_check_digit=True):
     return number + cd
 
 
-def validate(number, strip_check_digit=True):
+def check(number, strip_check_digit=True):
     """Check if the number is a valid MEID number. This converts the
     representation format of the number (if it is decimal it is not converted
-    to hexadecimal)."""
+    to hexadecimal).
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     # first parse the number
-    number, cd = _parse(number)
+    try:
+        number, cd = _parse(number)
+    except ValidationError as e:
+        return type(e)
     from stdnum import luhn
     if len(number) == 18:
         # decimal format can be easily determined
         if cd:
-            luhn.validate(number + cd)
+            result = luhn.check(number + cd)
+            if isinstance(result, type):
+                return result
         # convert to hex
         manufacturer_code = int(number[0:10])
         serial_num = int(number[10:18])
         if manufacturer_code.bit_length() > 32 or serial_num.bit_length() > 24:
-            raise InvalidComponent()
+            return InvalidComponent
         number = '%08X%06X' % (manufacturer_code, serial_num)
         cd = calc_check_digit(number)
     elif isdigits(number):
         # if the remaining hex format is fully decimal it is an IMEI number
         from stdnum import imei
-        imei.validate(number + cd)
+        result = imei.check(number + cd)
+        if isinstance(result, type):
+            return result
     else:
         # normal hex Luhn validation
         if cd:
-            luhn.validate(number + cd, alphabet=_hex_alphabet)
+            result = luhn.check(number + cd, alphabet=_hex_alphabet)
+            if isinstance(result, type):
+                return result
     if strip_check_digit:
         cd = ''
     return number + cd
 
 
+def validate(number, strip_check_digit=True):
+    """Check if the number is a valid MEID number. This converts the
+    representation format of the number (if it is decimal it is not converted
+    to hexadecimal)."""
+    result = check(number, strip_check_digit=strip_check_digit)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number is a valid MEID number."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -31,22 +31,24 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser, weighted_checksum
+
+
+_normalise = normaliser(' -', upper=True, prefix='MT')
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' -').upper().strip()
-    if number.startswith('MT'):
-        number = number[2:]
-    return number
+    return _normalise(number)
+
+
+_checksum = weighted_checksum((3, 4, 6, 7, 8, 9, 10, 1), 37)
 
 
 def checksum(number):
     """Calculate the checksum."""
-    weights = (3, 4, 6, 7, 8, 9, 10, 1)
-    return sum(w * int(n) for w, n in zip(weights, number)) % 37
+    return _checksum(number)
 
 
 def validate(number):
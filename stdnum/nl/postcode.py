@@ -43,7 +43,7 @@ InvalidComponent: ...
 import re
 
 from stdnum.exceptions import *
-from stdnum.util import clean
+from stdnum.util import normaliser
 
 
 _postcode_re = re.compile(r'^(?P<pt1>[1-9][0-9]{3})(?P<pt2>[A-Z]{2})$')
@@ -52,13 +52,13 @@ _postcode_re = re.compile(r'^(?P<pt1>[1-9][0-9]{3})(?P<pt2>[A-Z]{2})$')
 _postcode_blacklist = ('SA', 'SD', 'SS')
 
 
+_normalise = normaliser(' -', upper=True, prefix='NL')
+
+
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' -').upper().strip()
-    if number.startswith('NL'):
-        number = number[2:]
-    return number
+    return _normalise(number)
 
 
 def validate(number):
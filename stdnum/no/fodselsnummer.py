@@ -45,7 +45,7 @@ InvalidChecksum: ...
 import datetime
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -54,16 +54,24 @@ def compact(number):
     return clean(number, ' -:')
 
 
+_calc_check_digit1 = weighted_checksum(
+    (3, 7, 6, 1, 8, 9, 4, 5, 2), 11,
+    check_digits=[str((11 - x) % 11) for x in range(11)])
+
+
 def calc_check_digit1(number):
     """Calculate the first check digit for the number."""
-    weights = (3, 7, 6, 1, 8, 9, 4, 5, 2)
-    return str((11 - sum(w * int(n) for w, n in zip(weights, number))) % 11)
+    return _calc_check_digit1(number)
+
+
+_calc_check_digit2 = weighted_checksum(
+    (5, 4, 3, 2, 7, 6, 5, 4, 3, 2), 11,
+    check_digits=[str((11 - x) % 11) for x in range(11)])
 
 
 def calc_check_digit2(number):
     """Calculate the second check digit for the number."""
-    weights = (5, 4, 3, 2, 7, 6, 5, 4, 3, 2)
-    return str((11 - sum(w * int(n) for w, n in zip(weights, number))) % 11)
+    return _calc_check_digit2(number)
 
 
 def get_gender(number):
@@ -44,7 +44,7 @@ InvalidChecksum: ...
 
 from stdnum import luhn
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -56,31 +56,48 @@ def compact(number):
     return number
 
 
+_check_digit = weighted_checksum(
+    (6, 7, 8, 9, 4, 5, 6, 7, 8, 9), 11,
+    check_digits=[str(x) for x in range(11)])
+
+
 def _calc_check_digit(number):
     """Calculate the check digit for the 11-digit number."""
-    weights = (6, 7, 8, 9, 4, 5, 6, 7, 8, 9)
-    return str(sum(w * int(n) for w, n in zip(weights, number)) % 11)
+    return _check_digit(number)
 
 
-def validate(number):
-    """Check if the number provided is a valid bank account number."""
+def check(number):
+    """Check if the number provided is a valid bank account number.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) == 7:
-        luhn.validate(number)
+        result = luhn.check(number)
+        if isinstance(result, type):
+            return result
     elif len(number) == 11:
         if _calc_check_digit(number) != number[-1]:
-            raise InvalidChecksum()
+            return InvalidChecksum
     else:
-        raise InvalidLength()
+        return InvalidLength
     return number
 
 
+def validate(number):
+    """Check if the number provided is a valid bank account number."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided is a valid bank account number."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -36,16 +36,16 @@ InvalidChecksum: ...
 
 from stdnum.exceptions import *
 from stdnum.no import orgnr
-from stdnum.util import clean
+from stdnum.util import normaliser
+
+
+_normalise = normaliser(' ', upper=True, prefix='NO')
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' ').upper().strip()
-    if number.startswith('NO'):
-        number = number[2:]
-    return number
+    return _normalise(number)
 
 
 def validate(number):
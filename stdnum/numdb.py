@@ -59,7 +59,15 @@ To split the number and get properties for each part:
 
 """
 
+import bisect
+import collections
+import io
+import itertools
+import os
 import re
+import struct
+import sys
+import threading
 
 
 _line_re = re.compile(
@@ -69,16 +77,388 @@ _line_re = re.compile(
 _prop_re = re.compile(
     r'(?P<prop>[0-9a-zA-Z-_]+)="(?P<value>[^"]*)"')
 
+# the version and generation time of a database are taken from the comments
+# at the top of the file (as written by the scripts in the update directory)
+_version_re = re.compile(r'\b(?:version|serial)\s+(?P<version>\S+)', re.IGNORECASE)
+_iso_timestamp_re = re.compile(
+    r'\b(?P<date>\d{4}-\d{2}-\d{2})[ T](?P<time>\d{2}:\d{2}:\d{2})(?P<fraction>\.\d+)?'
+    r'(?:(?P<sign>[+-])(?P<hours>\d{2}):?(?P<minutes>\d{2}))?')
+_rfc2822_timestamp_re = re.compile(
+    r'\b(?:[A-Z][a-z]{2}, )?\d{1,2} [A-Z][a-z]{2} \d{4} \d{2}:\d{2}:\d{2} (?:GMT|[+-]\d{4})')
+_date_re = re.compile(r'\b(?P<day>\d{2})/(?P<month>\d{2})/(?P<year>\d{4})\b')
+
 # this is a cache of open databases
 _open_databases = {}
 
-# the prefixes attribute of NumDB is structured as follows:
-# prefixes = [
-#   [ length, low, high, props, children ]
-#   ...
-# ]
-# where children is a prefixes structure in its own right
-# (there is no expected ordering within the list)
+# locks that ensure that each database is only loaded once
+_open_databases_lock = threading.Lock()
+_loading_locks = {}
+
+# lock that ensures that the lines of lazily read databases are only parsed
+# by one thread at a time
+_parse_lock = threading.Lock()
+
+# statistics of the result cache of a database
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+# the result of a batch lookup: the parts of each number, for each part an
+# index in the list of distinct properties and that list of properties
+BatchInfo = collections.namedtuple(
+    'BatchInfo', ['parts', 'indices', 'properties'])
+
+# the compiled format consists of a header with the SHA-256 digest, the size
+# and the modification time (in nanoseconds) of the text file it was
+# generated from, the offset of the top level and the offset of the header
+# comments of the text file
+_compiled_magic = b'NUMDB\x00\x04\x00'
+_compiled_header = struct.Struct('<8s32sQQII')  # magic, digest, size, mtime, root, comments
+# each level has a number of entries and a number of tables, followed
+# by the entries (as in the text file) and the tables of the index
+_compiled_level = struct.Struct('<II')
+_compiled_entry = struct.Struct('<IIIII')  # length, low, high, props, children
+_compiled_table = struct.Struct('<III')  # length, number of segments, offset
+_compiled_segment = struct.Struct('<IIII')  # low, high, props, children
+# strings are stored as length-prefixed UTF-8 and properties as a number of
+# key and value string references
+_compiled_count = struct.Struct('<I')
+# reference to mark segments that run up to the next segment
+_compiled_none = 0xFFFFFFFF
+
+# the prefixes attribute of NumDB is a list of _Prefix objects which have
+# length, low, high, props and children attributes where props is a tuple of
+# name and value pairs (that may be shared between prefixes) and children is
+# a prefixes list in its own right (there is no expected ordering within the
+# list)
+
+
+def _parse_timestamp(comment):
+    """Return the date and time that is found in the comment or None."""
+    import datetime
+    match = _iso_timestamp_re.search(comment)
+    if match:
+        timestamp = datetime.datetime.strptime(
+            match.group('date') + ' ' + match.group('time'), '%Y-%m-%d %H:%M:%S')
+        if match.group('fraction'):
+            timestamp = timestamp.replace(
+                microsecond=int(match.group('fraction')[1:7].ljust(6, '0')))
+        if match.group('sign'):
+            offset = datetime.timedelta(
+                hours=int(match.group('hours')), minutes=int(match.group('minutes')))
+            timestamp = timestamp.replace(tzinfo=datetime.timezone(
+                -offset if match.group('sign') == '-' else offset))
+        return timestamp
+    match = _rfc2822_timestamp_re.search(comment)
+    if match:
+        import email.utils
+        return email.utils.parsedate_to_datetime(match.group())
+    match = _date_re.search(comment)
+    if match:
+        return datetime.datetime(
+            int(match.group('year')), int(match.group('month')), int(match.group('day')))
+
+
+class _Prefix():
+    """A range of numbers on one level of the database."""
+
+    __slots__ = ('length', 'low', 'high', 'props', 'children')
+
+    def __init__(self, low, high, props, children=()):
+        """Create a new range without children."""
+        self.length = len(low)
+        self.low = low
+        self.high = high
+        self.props = props
+        self.children = children
+
+
+class _Level():
+    """Index over a prefixes structure for looking up numbers.
+
+    For each prefix length that occurs in the list of prefixes, the ranges
+    are cut into non-overlapping segments that are sorted by their lower
+    bound. Each segment has the merged properties and children of all ranges
+    that cover it so finding a number is a binary search per prefix length.
+    The segments are stored as parallel lists of lower bounds, upper bounds
+    (None if the segment runs up to the next one), properties and children.
+    The indexes of the children are built on first use and are shared
+    between segments with the same children."""
+
+    __slots__ = ('tables', 'levels')
+
+    def __init__(self, prefixes):
+        """Build the index for the list of prefixes."""
+        by_length = {}
+        for prefix in prefixes:
+            by_length.setdefault(prefix.length, []).append(prefix)
+        self.tables = [
+            (length,) + self._segment(by_length[length])
+            for length in sorted(by_length)]
+        self.levels = {}
+
+    @staticmethod
+    def _merge(props1, children1, props2, children2):
+        """Combine the properties and children of two ranges."""
+        props = dict(props1)
+        props.update(props2)
+        return tuple(props.items()), tuple(children1) + tuple(children2)
+
+    @staticmethod
+    def _segment(prefixes):
+        """Cut the ranges into sorted, non-overlapping segments and return
+        the parallel lists that describe the segments."""
+        # first try to combine ranges that are listed more than once (the
+        # sort is stable so they are merged in the order of the file)
+        ordered = []
+        for prefix in sorted(prefixes, key=lambda prefix: (prefix.low, prefix.high)):
+            if ordered and ordered[-1].low == prefix.low and ordered[-1].high == prefix.high:
+                last = ordered[-1]
+                ordered[-1] = _Prefix(last.low, last.high, *_Level._merge(
+                    last.props, last.children, prefix.props, prefix.children))
+            else:
+                ordered.append(prefix)
+        if all(a.high < b.low for a, b in zip(ordered, ordered[1:])):
+            # the ranges do not overlap so they are the segments
+            return (
+                [prefix.low for prefix in ordered],
+                [prefix.high for prefix in ordered],
+                [prefix.props for prefix in ordered],
+                [prefix.children for prefix in ordered])
+        # a range low-high covers all strings from low up to (but not
+        # including) high + '\0', the first string that sorts after high
+        ends = dict((prefix.high + '\0', prefix.high) for prefix in prefixes)
+        bounds = sorted(set(prefix.low for prefix in prefixes) | set(ends))
+        positions = dict((bound, i) for i, bound in enumerate(bounds))
+        props = [None] * len(bounds)
+        children = [()] * len(bounds)
+        merged = {}
+        for prefix in prefixes:
+            for i in range(positions[prefix.low], positions[prefix.high + '\0']):
+                if props[i] is None:
+                    props[i] = prefix.props
+                    children[i] = prefix.children
+                else:
+                    # merge with the ranges that were seen before (segments
+                    # with the same children share the merged children)
+                    props[i], children[i] = _Level._merge(
+                        props[i], children[i], prefix.props, prefix.children)
+                    children[i] = merged.setdefault(tuple(map(id, children[i])), children[i])
+        # only keep the segments that are covered, if the next segment is
+        # not covered the bound is the high value of one of the ranges
+        covered = [i for i, p in enumerate(props) if p is not None]
+        return (
+            [bounds[i] for i in covered],
+            [None if props[i + 1] is not None else ends[bounds[i + 1]] for i in covered],
+            [props[i] for i in covered],
+            [children[i] for i in covered])
+
+    def _level(self, children):
+        """Return the index of the list of children."""
+        level = self.levels.get(id(children))
+        if level is None:
+            level = self.levels[id(children)] = _Level(children) if children else _empty_level
+        return level
+
+    def find(self, number):
+        """Find the shortest matching part of the number. This returns the
+        part, a fresh dict of properties and the index of the next level."""
+        for length, lows, highs, props, children in self.tables:
+            if length > len(number):
+                break
+            part = number[:length]
+            i = bisect.bisect_right(lows, part) - 1
+            if i >= 0 and (highs[i] is None or part <= highs[i]):
+                return part, dict(props[i]), self._level(children[i])
+        return number, {}, _unmatched_level
+
+    def load_all(self, seen=None):
+        """Build the indexes of all the levels below this one."""
+        seen = set() if seen is None else seen
+        for table in self.tables:
+            for children in table[4]:
+                level = self._level(children)
+                if id(level) not in seen:
+                    seen.add(id(level))
+                    level.load_all(seen)
+
+
+_empty_level = _Level([])
+
+# the (also empty) level that find() returns if no part of the number matched
+_unmatched_level = _Level([])
+
+
+class _FlatLevel():
+    """Index of a level without ranges or children, which is the case for
+    databases that are a flat list of numbers. The properties are stored in
+    a dict per length so finding a number is a dict lookup per length."""
+
+    __slots__ = ('tables',)
+
+    def __init__(self, prefixes):
+        """Build the index for the list of prefixes."""
+        by_length = {}
+        for prefix in prefixes:
+            table = by_length.setdefault(prefix.length, {})
+            if prefix.low in table:
+                # merge with the numbers that were seen before
+                table[prefix.low] = _Level._merge(table[prefix.low], (), prefix.props, ())[0]
+            else:
+                table[prefix.low] = prefix.props
+        self.tables = [(length, by_length[length]) for length in sorted(by_length)]
+
+    @staticmethod
+    def is_flat(prefixes):
+        """Check whether the prefixes are single numbers without children
+        (without parsing lazily parsed children)."""
+        return all(
+            prefix.low == prefix.high and
+            not isinstance(prefix.children, _LazyPrefixes) and not prefix.children
+            for prefix in prefixes)
+
+    def find(self, number):
+        """Find the shortest matching part of the number. This returns the
+        part, a fresh dict of properties and the index of the next level."""
+        for length, table in self.tables:
+            if length > len(number):
+                break
+            props = table.get(number[:length])
+            if props is not None:
+                return number[:length], dict(props), _empty_level
+        return number, {}, _unmatched_level
+
+
+def _build_index(prefixes):
+    """Return the index for the top level of the database."""
+    if _FlatLevel.is_flat(prefixes):
+        return _FlatLevel(prefixes)
+    return _Level(prefixes)
+
+
+class _MappedLevel():
+    """Index of a level in a compiled database that is queried in place."""
+
+    def __init__(self, data, offset):
+        """Read the tables of the level at the offset."""
+        self.data = data
+        self.offset = offset
+        n_entries, n_tables = _compiled_level.unpack_from(data, offset)
+        offset += _compiled_level.size + n_entries * _compiled_entry.size
+        self.tables = [
+            _compiled_table.unpack_from(data, offset + i * _compiled_table.size)
+            for i in range(n_tables)]
+
+    def _string(self, offset):
+        """Return the raw bytes of the string at the offset."""
+        length, = _compiled_count.unpack_from(self.data, offset)
+        offset += _compiled_count.size
+        return self.data[offset:offset + length]
+
+    def _props(self, offset):
+        """Return a fresh dict of the properties at the offset."""
+        count, = _compiled_count.unpack_from(self.data, offset)
+        refs = struct.unpack_from('<%dI' % (count * 2), self.data, offset + _compiled_count.size)
+        return dict(
+            (self._string(refs[i]).decode('utf-8'), self._string(refs[i + 1]).decode('utf-8'))
+            for i in range(0, len(refs), 2))
+
+    def find(self, number):
+        """Find the shortest matching part of the number. This returns the
+        part, a fresh dict of properties and the index of the next level."""
+        for length, count, offset in self.tables:
+            if length > len(number):
+                break
+            part = number[:length]
+            key = part.encode('utf-8')
+            # find the last segment with a lower bound that is not after
+            # the key (UTF-8 sorts the same as the Unicode code points)
+            low, high = 0, count
+            while low < high:
+                middle = (low + high) // 2
+                bound, = _compiled_count.unpack_from(self.data, offset + middle * _compiled_segment.size)
+                if key < self._string(bound):
+                    high = middle
+                else:
+                    low = middle + 1
+            if low:
+                bound, upper, props, children = _compiled_segment.unpack_from(
+                    self.data, offset + (low - 1) * _compiled_segment.size)
+                if upper == _compiled_none or key <= self._string(upper):
+                    return part, self._props(props), _MappedLevel(self.data, children)
+        return number, {}, _unmatched_level
+
+    def prefixes(self, levels=None):
+        """Return the entries of the level (and the levels below it) as a
+        list of _Prefix objects."""
+        levels = {} if levels is None else levels
+        if self.offset not in levels:
+            n_entries, _n_tables = _compiled_level.unpack_from(self.data, self.offset)
+            levels[self.offset] = [
+                _Prefix(
+                    self._string(low).decode('utf-8'), self._string(high).decode('utf-8'),
+                    tuple(self._props(props).items()),
+                    _MappedLevel(self.data, children).prefixes(levels))
+                for _length, low, high, props, children in (
+                    _compiled_entry.unpack_from(
+                        self.data, self.offset + _compiled_level.size + i * _compiled_entry.size)
+                    for i in range(n_entries))]
+        return levels[self.offset]
+
+
+class _Ranges():
+    """Index of the entries of a level and the levels below it that is
+    used to enumerate entries. For each length the entries are sorted by
+    lower bound. If the ranges do not overlap the upper bounds are sorted
+    too so the entries that start with a prefix can be found by bisecting."""
+
+    __slots__ = ('tables',)
+
+    def __init__(self, prefixes, levels):
+        """Build the index for the list of prefixes. The levels dict is
+        used to index lists of children that are shared only once."""
+        by_length = {}
+        for prefix in prefixes:
+            by_length.setdefault(prefix.length, []).append(prefix)
+        self.tables = []
+        for length in sorted(by_length):
+            ordered = sorted(by_length[length], key=lambda prefix: (prefix.low, prefix.high))
+            lows = [prefix.low for prefix in ordered]
+            highs = [prefix.high for prefix in ordered]
+            children = []
+            for prefix in ordered:
+                if id(prefix.children) not in levels:
+                    levels[id(prefix.children)] = (_Ranges(prefix.children, levels), prefix.children)
+                children.append(levels[id(prefix.children)][0])
+            overlapping = any(high >= low for high, low in zip(highs, lows[1:]))
+            self.tables.append((length, lows, highs, ordered, children, overlapping))
+
+    def all(self, path=()):
+        """Iterate over the paths to all entries."""
+        for _length, _lows, _highs, ordered, children, _overlapping in self.tables:
+            for prefix, ranges in zip(ordered, children):
+                yield path + (prefix,)
+                yield from ranges.all(path + (prefix,))
+
+    def starting_with(self, number, path=()):
+        """Iterate over the paths to the entries of which the numbers
+        start with the provided number."""
+        for length, lows, highs, ordered, children, overlapping in self.tables:
+            if len(number) <= length:
+                # the entries that cover a number that starts with the number
+                end = bisect.bisect_left(lows, number + '\U0010ffff')
+                start = 0 if overlapping else bisect.bisect_left(highs, number)
+                for i in range(start, end):
+                    if highs[i] >= number:
+                        yield path + (ordered[i],)
+                        yield from children[i].all(path + (ordered[i],))
+            else:
+                # the entries that cover the start of the number
+                part = number[:length]
+                end = bisect.bisect_right(lows, part)
+                start = 0 if overlapping else max(end - 1, 0)
+                for i in range(start, end):
+                    if highs[i] >= part:
+                        yield from children[i].starting_with(number[length:], path + (ordered[i],))
 
 
 class NumDB():
@@ -87,74 +467,419 @@ class NumDB():
     def __init__(self):
         """Construct an empty database."""
         self.prefixes = []
+        self._index = None
+        self._cache = None
+        self._cache_size = 0
+        self._cache_lock = threading.Lock()
+        self._cache_stats = [0, 0, 0]  # hits, misses, evictions
+        self._ranges = None
+        self._by_property = None
+        self._source = None  # digest, size and mtime of the compiled text
+        self.comments = []
+        self.version = None
+        self.timestamp = None
 
-    @staticmethod
-    def _find(number, prefixes):
-        """Lookup the specified number in the list of prefixes, this will
-        return basically what info() should return but works recursively."""
-        if not number:
-            return []
-        part = number
-        properties = {}
-        next_prefixes = []
-        # go over prefixes and find matches
-        for length, low, high, props, children in prefixes:
-            if len(part) >= length and low <= part[:length] <= high:
-                # only use information from the shortest match
-                if length < len(part):
-                    part = part[:length]
-                    properties = {}
-                    next_prefixes = []
-                properties.update(props)
-                next_prefixes.extend(children)
-        # return first part and recursively find next matches
-        return [(part, properties)] + NumDB._find(number[len(part):], next_prefixes)
+    def _set_comments(self, comments):
+        """Set the header comments of the database and the version and
+        generation time that are found in them."""
+        self.comments = comments
+        for comment in comments:
+            match = _version_re.search(comment)
+            if match:
+                self.version = match.group('version')
+                break
+        for comment in comments:
+            self.timestamp = _parse_timestamp(comment)
+            if self.timestamp:
+                break
+
+    def _find(self, number):
+        """Lookup the specified number in the database, returning what
+        info() should return."""
+        if self._index is None:
+            self._index = _build_index(self.prefixes)
+        level = self._index
+        result = []
+        while number:
+            part, properties, level = level.find(number)
+            result.append((part, properties))
+            number = number[len(part):]
+        return result
+
+    def _cached_find(self, number, cache):
+        """Lookup the specified number in the result cache or the database.
+        This returns a tuple of parts and tuples of properties."""
+        with self._cache_lock:
+            result = cache.get(number)
+            if result is not None:
+                cache.move_to_end(number)
+                self._cache_stats[0] += 1
+                return result
+        result = tuple(
+            (part, tuple(properties.items()))
+            for part, properties in self._find(number))
+        with self._cache_lock:
+            self._cache_stats[1] += 1
+            cache[number] = result
+            if len(cache) > self._cache_size:
+                cache.popitem(last=False)
+                self._cache_stats[2] += 1
+        return result
+
+    def set_cache_size(self, maxsize):
+        """Keep the results of the most recent maxsize lookups to speed up
+        repeated lookups of the same numbers. A maxsize of 0 or None disables
+        the cache (the default)."""
+        with self._cache_lock:
+            self._cache_size = maxsize or 0
+            self._cache = collections.OrderedDict() if maxsize else None
+            self._cache_stats = [0, 0, 0]
+
+    def cache_info(self):
+        """Return the statistics of the result cache as a CacheInfo tuple
+        of hits, misses, evictions, maxsize and currsize."""
+        with self._cache_lock:
+            return CacheInfo(
+                *self._cache_stats, maxsize=self._cache_size,
+                currsize=len(self._cache) if self._cache is not None else 0)
 
     def info(self, number):
         """Split the provided number in components and associate properties
         with each component. This returns a tuple of tuples. Each tuple
         consists of a string (a part of the number) and a dict of properties.
         """
-        return NumDB._find(number, self.prefixes)
+        cache = self._cache
+        if cache is None:
+            return self._find(number)
+        return [
+            (part, dict(properties))
+            for part, properties in self._cached_find(number, cache)]
+
+    def info_many(self, numbers):
+        """Split and annotate many numbers at once. This accepts an iterable
+        of strings (or bytes, such as a NumPy array) and returns a BatchInfo
+        tuple. For each number (in input order) the parts element has a tuple
+        of parts and the indices element a tuple of indices into the list of
+        distinct properties dicts."""
+        if self._index is None:
+            self._index = _build_index(self.prefixes)
+        numbers = [
+            number.decode('utf-8') if isinstance(number, bytes) else number
+            for number in numbers]
+        parts = [()] * len(numbers)
+        indices = [()] * len(numbers)
+        properties = []
+        seen = {}
+        # numbers are handled in sorted order so that numbers that follow
+        # each other share the lookups of the start of the path through the
+        # levels, the path contains a lookup key, the length of the part
+        # (None for the remainder), the properties index and next level
+        path = []
+        for position in sorted(range(len(numbers)), key=numbers.__getitem__):
+            number = numbers[position]
+            number_parts = []
+            number_indices = []
+            level = self._index
+            start = depth = 0
+            while start < len(number):
+                # the lookup only depends on the start of the number, up to
+                # the longest prefix in the level
+                maxlen = level.tables[-1][0] if level.tables else 0
+                key = number[:start + maxlen]
+                if depth < len(path) and path[depth][0] == key:
+                    length, index, level = path[depth][1:]
+                else:
+                    part, props, level = level.find(number[start:])
+                    # without a match the rest of the number is a single
+                    # part, whatever the length
+                    length = None if level is _unmatched_level else len(part)
+                    index = seen.setdefault(tuple(props.items()), len(properties))
+                    if index == len(properties):
+                        properties.append(props)
+                    del path[depth:]
+                    path.append((key, length, index, level))
+                end = len(number) if length is None else start + length
+                number_parts.append(number[start:end])
+                number_indices.append(index)
+                start = end
+                depth += 1
+            parts[position] = tuple(number_parts)
+            indices[position] = tuple(number_indices)
+        return BatchInfo(parts, indices, properties)
+
+    def split_many(self, numbers):
+        """Split many numbers at once. This returns a list with a tuple of
+        parts for each number."""
+        return self.info_many(numbers).parts
+
+    def _build_ranges(self):
+        """Build the indexes that are used for enumerating entries."""
+        if self._ranges is None:
+            prefixes = self.prefixes
+            if isinstance(self._index, _MappedLevel):
+                prefixes = self._index.prefixes()
+            ranges = _Ranges(prefixes, {})
+            by_property = {}
+            for path in ranges.all():
+                for item in path[-1].props:
+                    by_property.setdefault(item, []).append(path)
+            self._by_property = by_property
+            self._ranges = ranges
+
+    @staticmethod
+    def _entry(path):
+        """Return the entry as a tuple with a lower and upper bound and a
+        dict of properties for each level."""
+        return tuple(
+            (prefix.low, prefix.high, dict(prefix.props))
+            for prefix in path)
+
+    def find_prefixes(self, name, value):
+        """Return the entries in the database that have a property with the
+        specified value. Each entry is a tuple with a lower and upper bound
+        and a dict of properties for each level, from the top-level down to
+        the entry with the property.
+
+        The index that is used for this is built on first use."""
+        self._build_ranges()
+        return [
+            self._entry(path)
+            for path in self._by_property.get((name, value), ())]
+
+    def iter_prefixes(self, prefix):
+        """Iterate over the entries in the database that cover numbers that
+        start with the prefix. The entries are returned in the same form as
+        with find_prefixes() and entries that only cover the start of the
+        prefix are not returned themselves."""
+        self._build_ranges()
+        for path in self._ranges.starting_with(prefix):
+            yield self._entry(path)
+
+    def load_all(self):
+        """Parse and index the complete database instead of loading parts
+        of it when lookups first need them."""
+        if self._index is None:
+            self._index = _build_index(self.prefixes)
+        if isinstance(self._index, _Level):
+            self._index.load_all()
 
     def split(self, number):
         """Split the provided number in components. This returns a tuple with
         the number of components identified."""
-        return [part for part, props in self.info(number)]
+        cache = self._cache
+        if cache is None:
+            return [part for part, props in self._find(number)]
+        return [part for part, props in self._cached_find(number, cache)]
+
 
+class _Parser():
+    """Parser for the lines of a database file. The properties are returned
+    as a tuple of name and value pairs and the properties, the pairs and the
+    strings in them are shared between all lines that are parsed."""
 
-def _parse(fp):
-    """Read lines of text from the file pointer and generate indent, length,
-    low, high, properties tuples."""
-    for line in fp:
-        # ignore comments
-        if line[0] == '#' or line.strip() == '':
-            continue  # pragma: no cover (optimisation takes it out)
-        # any other line should parse
+    def __init__(self, lazy):
+        """Create a parser that can optionally leave children unparsed."""
+        self.lazy = lazy
+        self.props = {}
+        self.pairs = {}
+
+    def _parse_line(self, line):
+        """Return the ranges on the line."""
         match = _line_re.search(line)
-        indent = len(match.group('indent'))
-        ranges = match.group('ranges')
-        props = dict(_prop_re.findall(match.group('props')))
-        children = []
-        for rnge in ranges.split(','):
-            if '-' in rnge:
-                low, high = rnge.split('-')
+        props = self.props.get(match.group('props'))
+        if props is None:
+            props = self.props[match.group('props')] = tuple(
+                self.pairs.setdefault(pair, (sys.intern(pair[0]), sys.intern(pair[1])))
+                for pair in _prop_re.findall(match.group('props')))
+        return [
+            _Prefix(*rnge.split('-'), props=props) if '-' in rnge else _Prefix(rnge, rnge, props)
+            for rnge in match.group('ranges').split(',')]
+
+    def _set_children(self, prefixes, lines):
+        """Set the children of the ranges to the prefixes on the lines."""
+        if lines:
+            children = _LazyPrefixes(self, lines) if self.lazy else self.parse(lines)
+            for prefix in prefixes:
+                prefix.children = children
+
+    def parse(self, lines):
+        """Return the list of prefixes on the lines. Any lines that are
+        indented further than the first line are children of the line
+        before them."""
+        prefixes = []
+        indent = None
+        last = []
+        nested = []
+        for line in lines:
+            # ignore comments
+            if line[0] == '#' or line.strip() == '':
+                continue  # pragma: no cover (optimisation takes it out)
+            if indent is None:
+                indent = len(line) - len(line.lstrip(' '))
+            if line.startswith(' ', indent):
+                nested.append(line)
             else:
-                low, high = rnge, rnge
-            yield indent, len(low), low, high, props, children
+                self._set_children(last, nested)
+                last = self._parse_line(line)
+                nested = []
+                prefixes.extend(last)
+        self._set_children(last, nested)
+        return prefixes
+
+
+class _LazyPrefixes():
+    """List of prefixes that is parsed from the lines on first use."""
+
+    __slots__ = ('parser', 'lines', 'prefixes')
+
+    def __init__(self, parser, lines):
+        """Store the lines for parsing later on."""
+        self.parser = parser
+        self.lines = lines
+        self.prefixes = None
+
+    def _get(self):
+        """Return the parsed list of prefixes."""
+        prefixes = self.prefixes
+        if prefixes is None:
+            # another thread may be parsing the lines at the same time
+            with _parse_lock:
+                if self.prefixes is None:
+                    self.prefixes = self.parser.parse(self.lines)
+                    self.parser = self.lines = None
+                prefixes = self.prefixes
+        return prefixes
+
+    def __iter__(self):
+        """Iterate over the prefixes."""
+        return iter(self._get())
+
+    def __len__(self):
+        """Return the number of prefixes."""
+        return len(self._get())
+
+
+def read(fp, lazy=False):
+    """Return a new database with the data read from the specified file.
+
+    If lazy is set, the lines below the top-level ranges are only parsed
+    when a lookup first needs them."""
+    db = NumDB()
+    # the comments at the top of the file describe the database
+    lines = iter(fp)
+    comments = []
+    for line in lines:
+        if not line.startswith('#'):
+            lines = itertools.chain([line], lines)
+            break
+        comments.append(line[1:].strip())
+    db._set_comments(comments)
+    db.prefixes = _Parser(lazy).parse(lines)
+    db._index = _build_index(db.prefixes)
+    return db
+
+
+class _CompiledWriter():
+    """Serialise a database into the compiled format."""
+
+    def __init__(self):
+        """Start with an empty output buffer that only has a header."""
+        self.data = bytearray(_compiled_header.size)
+        self.strings = {}
+        self.props = {}
+        self.levels = {}
+
+    def _append(self, data):
+        """Add the data to the output, returning the offset."""
+        offset = len(self.data)
+        self.data += data
+        return offset
+
+    def string(self, value):
+        """Add the string to the output if needed and return the offset."""
+        if value not in self.strings:
+            value_bytes = value.encode('utf-8')
+            self.strings[value] = self._append(
+                _compiled_count.pack(len(value_bytes)) + value_bytes)
+        return self.strings[value]
+
+    def properties(self, props):
+        """Add the properties to the output if needed and return the
+        offset."""
+        key = tuple(props)
+        if key not in self.props:
+            refs = [self.string(x) for item in key for x in item]
+            self.props[key] = self._append(
+                _compiled_count.pack(len(key)) + struct.pack('<%dI' % len(refs), *refs))
+        return self.props[key]
+
+    def level(self, prefixes):
+        """Add the list of prefixes as a level to the output if needed and return
+        the offset."""
+        # levels with the same entries are only written once (the entries
+        # are kept around to ensure that their ids are not reused)
+        key = tuple(id(prefix) for prefix in prefixes)
+        if key not in self.levels:
+            index = _Level(prefixes)
+            # write the entries and segments that are referenced first
+            entries = [
+                _compiled_entry.pack(
+                    prefix.length, self.string(prefix.low), self.string(prefix.high),
+                    self.properties(prefix.props), self.level(prefix.children))
+                for prefix in prefixes]
+            tables = []
+            for length, lows, highs, props, children in index.tables:
+                data = b''.join(
+                    _compiled_segment.pack(
+                        self.string(low),
+                        _compiled_none if high is None else self.string(high),
+                        self.properties(p), self.level(c))
+                    for low, high, p, c in zip(lows, highs, props, children))
+                tables.append(_compiled_table.pack(length, len(lows), self._append(data)))
+            offset = self._append(
+                _compiled_level.pack(len(entries), len(tables)) +
+                b''.join(entries) + b''.join(tables))
+            self.levels[key] = (offset, prefixes, index)
+        return self.levels[key][0]
+
 
+def compile_file(source, target):
+    """Write a compiled version of the text database in the source file to
+    the target file. The compiled file can be loaded with read_compiled()
+    and is used by get() when it is present next to the text file."""
+    import hashlib
+    with open(source, 'rb') as fp:
+        text = fp.read()
+        stat = os.fstat(fp.fileno())
+    db = read(io.StringIO(text.decode('utf-8')))
+    writer = _CompiledWriter()
+    root = writer.level(db.prefixes)
+    comments = writer.string('\n'.join(db.comments))
+    writer.data[:_compiled_header.size] = _compiled_header.pack(
+        _compiled_magic, hashlib.sha256(text).digest(), stat.st_size, stat.st_mtime_ns,
+        root, comments)
+    with open(target, 'wb') as fp:
+        fp.write(writer.data)
 
-def read(fp):
-    """Return a new database with the data read from the specified file."""
-    last_indent = 0
+
+def read_compiled(filename, digest=None):
+    """Return a new database that is backed by the memory-mapped compiled
+    file. If a digest is provided, the file is only used if it was compiled
+    from text with the same SHA-256 digest and ValueError is raised
+    otherwise."""
+    import mmap
+    with open(filename, 'rb') as fp:
+        data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, source_digest, size, mtime, root, comments = _compiled_header.unpack_from(data)
+    if magic != _compiled_magic:
+        raise ValueError('%s is not a compiled database' % filename)
+    if digest is not None and digest != source_digest:
+        raise ValueError('%s is out of date' % filename)
     db = NumDB()
-    stack = {0: db.prefixes}
-    for indent, length, low, high, props, children in _parse(fp):
-        if indent > last_indent:
-            # set our stack location to the last parent entry
-            stack[indent] = stack[last_indent][-1][4]
-        stack[indent].append([length, low, high, props, children])
-        last_indent = indent
+    db._index = _MappedLevel(data, root)
+    db._source = (source_digest, size, mtime)
+    comments = db._index._string(comments).decode('utf-8')
+    db._set_comments(comments.split('\n') if comments else [])
     return db
 
 
@@ -168,11 +893,147 @@ def _get_resource_stream(name):
         return pkg_resources.resource_stream(__name__, name)
 
 
+def _open_file(name, directory=None):
+    """Return a readable file-like object for the file in the directory
+    (by default the stdnum package)."""
+    if directory is None:
+        return _get_resource_stream(name)
+    return open(os.path.join(directory, name), 'rb')
+
+
+def _read_compiled(name, directory=None):
+    """Return the compiled database if it is present and up to date with
+    the text file. The text file is only read to compare the digest if its
+    size or modification time differ from when it was compiled."""
+    filename = os.path.join(directory or os.path.dirname(__file__), name)
+    if os.path.exists(filename + '.ndb'):
+        try:
+            db = read_compiled(filename + '.ndb')
+            stat = os.stat(filename + '.dat')
+            if db._source[1:] != (stat.st_size, stat.st_mtime_ns):
+                # the text file may have been copied or changed
+                import hashlib
+                with open(filename + '.dat', 'rb') as fp:
+                    if hashlib.sha256(fp.read()).digest() != db._source[0]:
+                        return None
+            return db
+        except (OSError, ValueError):
+            pass
+
+
+def _load(name, path=None):
+    """Read the database with the specified name. The path can be a
+    directory with the same layout as the stdnum package or a text or
+    compiled database file (by default the stdnum package is used)."""
+    if path is not None and not os.path.isdir(path):
+        if path.endswith('.ndb'):
+            return read_compiled(path)
+        with open(path, 'r', encoding='utf-8') as fp:
+            return read(fp, lazy=True)
+    db = _read_compiled(name, path)
+    if db is None:
+        with io.TextIOWrapper(_open_file(name + '.dat', path), encoding='utf-8') as fp:
+            db = read(fp, lazy=True)
+    return db
+
+
+def _reset_locks():
+    """Replace the locks (including the result cache locks of the databases
+    that get() returns), for use in a forked child process where the locks
+    may be held by threads that do not exist in the child."""
+    global _open_databases_lock, _parse_lock
+    _open_databases_lock = threading.Lock()
+    _loading_locks.clear()
+    _parse_lock = threading.Lock()
+    for db in list(_open_databases.values()):
+        db._cache_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):  # pragma: no branch (Python 3.7 and newer)
+    os.register_at_fork(after_in_child=_reset_locks)
+
+
+def _loading_lock(name):
+    """Return the lock that protects loading the database."""
+    with _open_databases_lock:
+        return _loading_locks.setdefault(name, threading.Lock())
+
+
 def get(name):
     """Open a database with the specified name to perform queries on."""
-    if name not in _open_databases:
-        import codecs
-        reader = codecs.getreader('utf-8')
-        with reader(_get_resource_stream(name + '.dat')) as fp:
-            _open_databases[name] = read(fp)
+    try:
+        return _open_databases[name]
+    except KeyError:
+        pass
+    # only one thread should load a particular database
+    with _loading_lock(name):
+        if name not in _open_databases:
+            _open_databases[name] = _load(name)
     return _open_databases[name]
+
+
+class _LazyDB():
+    """Proxy for a database that is only loaded when it is first queried.
+    Every query is passed on to the database that get() returns so the
+    proxy also uses databases that are swapped in by reload()."""
+
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        """Store the name of the database for loading it later on."""
+        self.name = name
+
+    def __getattr__(self, attr):
+        """Return the attribute of the loaded database."""
+        return getattr(get(self.name), attr)
+
+    def __repr__(self):
+        """Return a representation of the proxy."""
+        return '<lazy numdb %r>' % self.name
+
+
+def lazy(name):
+    """Return a proxy for the database with the specified name that can be
+    used like the database but only loads it when it is first queried. This
+    can be used for module-level database references to avoid reading the
+    database on import."""
+    return _LazyDB(name)
+
+
+def reload(name, path=None):
+    """Load a (newer) version of the database with the specified name and
+    use it for all queries from now on. The path can be a directory with the
+    same layout as the stdnum package or a text or compiled database file (by
+    default the database in the stdnum package is read again).
+
+    The new database is only swapped in after it has been completely read
+    and lookups that are in progress finish on the old database. The new
+    database is returned and its version and timestamp attributes can be
+    used to check which version is in use."""
+    db = _load(name, path)
+    with _loading_lock(name):
+        old = _open_databases.get(name)
+        if old is not None and old._cache_size:
+            db.set_cache_size(old._cache_size)
+        _open_databases[name] = db
+    return db
+
+
+def _list_databases():
+    """Return the names of all databases that are part of stdnum."""
+    base = os.path.dirname(__file__)
+    return sorted(
+        os.path.relpath(os.path.join(dirpath, filename), base)[:-4].replace(os.sep, '/')
+        for dirpath, _dirnames, filenames in os.walk(base)
+        for filename in filenames
+        if filename.endswith('.dat'))
+
+
+def preload(names=None):
+    """Completely load the databases with the specified names (all
+    databases by default). This can be used in servers that fork worker
+    processes to load the databases once before forking so the memory can
+    be shared between the workers (calling gc.freeze() after this avoids
+    the garbage collector touching the memory)."""
+    for name in (_list_databases() if names is None else names):
+        get(name).load_all()
@@ -41,7 +41,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -50,10 +50,14 @@ def compact(number):
     return clean(number, ' ').strip()
 
 
+_calc_check_digit = weighted_checksum(
+    (5, 4, 3, 2, 7, 6, 5, 4, 3, 2), 11,
+    check_digits=[str((11 - x) % 10) for x in range(11)])
+
+
 def calc_check_digit(number):
     """Calculate the check digit."""
-    weights = (5, 4, 3, 2, 7, 6, 5, 4, 3, 2)
-    return str((11 - sum(w * int(n) for w, n in zip(weights, number)) % 11) % 10)
+    return _calc_check_digit(number)
 
 
 def to_dni(number):
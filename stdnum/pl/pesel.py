@@ -50,7 +50,7 @@ datetime.date(2002, 1, 13)
 import datetime
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -88,12 +88,15 @@ def get_gender(number):
         return 'M'
 
 
+_calc_check_digit = weighted_checksum(
+    (1, 3, 7, 9, 1, 3, 7, 9, 1, 3), 10,
+    check_digits=[str((10 - x) % 10) for x in range(10)])
+
+
 def calc_check_digit(number):
     """Calculate the check digit for organisations. The number passed
     should not have the check digit included."""
-    weights = (1, 3, 7, 9, 1, 3, 7, 9, 1, 3)
-    check = sum(w * int(n) for w, n in zip(weights, number))
-    return str((10 - check) % 10)
+    return _calc_check_digit(number)
 
 
 def validate(number):
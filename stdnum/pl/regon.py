@@ -51,7 +51,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -60,15 +60,21 @@ def compact(number):
     return clean(number, ' -').upper().strip()
 
 
+_calc_check_digit8 = weighted_checksum(
+    (8, 9, 2, 3, 4, 5, 6, 7), 11,
+    check_digits='01234567890')
+
+_calc_check_digit13 = weighted_checksum(
+    (2, 4, 8, 5, 0, 9, 7, 3, 6, 1, 2, 4, 8), 11,
+    check_digits='01234567890')
+
+
 def calc_check_digit(number):
     """Calculate the check digit for organisations. The number passed
     should not have the check digit included."""
     if len(number) == 8:
-        weights = (8, 9, 2, 3, 4, 5, 6, 7)
-    else:
-        weights = (2, 4, 8, 5, 0, 9, 7, 3, 6, 1, 2, 4, 8)
-    check = sum(w * int(n) for w, n in zip(weights, number))
-    return str(check % 11 % 10)
+        return _calc_check_digit8(number)
+    return _calc_check_digit13(number)
 
 
 def validate(number):
@@ -39,7 +39,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
-from stdnum.util import clean, isdigits
+from stdnum.util import clean, isdigits, weighted_checksum
 
 
 def compact(number):
@@ -48,18 +48,29 @@ def compact(number):
     return clean(number, ' ').strip()
 
 
+_calc_company_check_digit = weighted_checksum(
+    (2, 4, 10, 3, 5, 9, 4, 6, 8), 11,
+    check_digits='01234567890')
+
+
 def calc_company_check_digit(number):
     """Calculate the check digit for the 10-digit ИНН for organisations."""
-    weights = (2, 4, 10, 3, 5, 9, 4, 6, 8)
-    return str(sum(w * int(n) for w, n in zip(weights, number)) % 11 % 10)
+    return _calc_company_check_digit(number)
+
+
+_calc_personal_check_digit1 = weighted_checksum(
+    (7, 2, 4, 10, 3, 5, 9, 4, 6, 8), 11,
+    check_digits='01234567890')
+
+_calc_personal_check_digit2 = weighted_checksum(
+    (3, 7, 2, 4, 10, 3, 5, 9, 4, 6, 8), 11,
+    check_digits='01234567890')
 
 
 def calc_personal_check_digits(number):
     """Calculate the check digits for the 12-digit personal ИНН."""
-    weights = (7, 2, 4, 10, 3, 5, 9, 4, 6, 8)
-    d1 = str(sum(w * int(n) for w, n in zip(weights, number)) % 11 % 10)
-    weights = (3, 7, 2, 4, 10, 3, 5, 9, 4, 6, 8)
-    d2 = str(sum(w * int(n) for w, n in zip(weights, number[:10] + d1)) % 11 % 10)
+    d1 = _calc_personal_check_digit1(number)
+    d2 = _calc_personal_check_digit2(number[:10] + d1)
     return d1 + d2
 
 
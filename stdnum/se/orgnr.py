@@ -47,21 +47,33 @@ def compact(number):
     return clean(number, ' -.').strip()
 
 
-def validate(number):
+def check(number):
     """Check if the number is a valid organisation number. This checks
-    the length, formatting and check digit."""
+    the length, formatting and check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if not isdigits(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 10:
-        raise InvalidLength()
-    return luhn.validate(number)
+        return InvalidLength
+    return luhn.check(number)
+
+
+def validate(number):
+    """Check if the number is a valid organisation number. This checks
+    the length, formatting and check digit."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
 
 
 def is_valid(number):
     """Check if the number is a valid organisation number"""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
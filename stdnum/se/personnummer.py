@@ -99,23 +99,39 @@ def get_gender(number):
         return 'F'
 
 
-def validate(number):
-    """Check if the number is a valid identity number."""
+def check(number):
+    """Check if the number is a valid identity number.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     number = compact(number)
     if len(number) not in (11, 13):
-        raise InvalidLength()
+        return InvalidLength
     digits = number[:-5] + number[-4:]
     if number[-5] not in '-+' or not isdigits(digits):
-        raise InvalidFormat()
-    get_birth_date(number)
-    luhn.validate(digits[-10:])
+        return InvalidFormat
+    try:
+        get_birth_date(number)
+    except ValidationError as e:
+        return type(e)
+    result = luhn.check(digits[-10:])
+    if isinstance(result, type):
+        return result
     return number
 
 
+def validate(number):
+    """Check if the number is a valid identity number."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number is a valid identity number."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
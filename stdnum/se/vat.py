@@ -34,16 +34,16 @@ InvalidChecksum: ...
 
 from stdnum.exceptions import *
 from stdnum.se import orgnr
-from stdnum.util import clean, isdigits
+from stdnum.util import isdigits, normaliser
+
+
+_normalise = normaliser(' -.', upper=True, prefix='SE')
 
 
 def compact(number):
     """Convert the number to the minimal representation. This strips the
     number of any valid separators and removes surrounding whitespace."""
-    number = clean(number, ' -.').upper().strip()
-    if number.startswith('SE'):
-        number = number[2:]
-    return number
+    return _normalise(number)
 
 
 def validate(number):
@@ -25,13 +25,14 @@ guaranteed to remain stable and as such not part of the public API of
 stdnum.
 """
 
-import pkgutil
-import pydoc
+import importlib
+import itertools
 import re
-import ssl
 import sys
 import unicodedata
 import warnings
+from collections import namedtuple
+from operator import mul
 
 from stdnum.exceptions import *
 
@@ -151,9 +152,64 @@ _char_map = dict(_mk_char_map({
 }))
 
 
-def _clean_chars(number):
-    """Replace various Unicode characters with their ASCII counterpart."""
-    return ''.join(_char_map.get(x, x) for x in number)
+# cache of the functions that are used by clean() for each deletechars value
+_cleaners = {}
+
+# str.isascii() is only available in Python 3.7 and newer
+_isascii = getattr(str, 'isascii', lambda number: False)
+
+
+def _mk_cleaner(deletechars):
+    """Return a function that replaces Unicode characters with their ASCII
+    counterpart and removes the deletechars. This uses a str.translate()
+    table and, for ASCII strings, a list of str.replace() arguments that do
+    the same. If the deletechars are bytes, a function that works on bytes
+    is returned which uses a bytes.translate() table that only covers the
+    ASCII characters."""
+    if isinstance(deletechars, bytes):
+        return _mk_byte_cleaner(deletechars)
+    table = dict((ord(x), None) for x in deletechars if x not in _char_map)
+    for x, replacement in _char_map.items():
+        table[ord(x)] = None if replacement in deletechars else replacement
+    replacements = [
+        (chr(x), replacement or '') for x, replacement in sorted(table.items())
+        if x < 128 and chr(x) != replacement]
+
+    def cleaner(number):
+        if type(number) is not str:
+            try:
+                number = ''.join(x for x in number)
+            except Exception:  # noqa: B902
+                raise InvalidFormat()
+        if _isascii(number):
+            for x, replacement in replacements:
+                if x in number:
+                    number = number.replace(x, replacement)
+            return number
+        return number.translate(table)
+
+    return cleaner
+
+
+def _mk_byte_cleaner(deletechars):
+    """Return a function that does the same as the function returned by
+    _mk_cleaner() for ASCII bytes. Non-ASCII bytes are left alone and
+    input that is not bytes-like raises InvalidFormat."""
+    deletechars = deletechars.decode('latin-1')
+    table = dict((ord(x), None) for x in deletechars if x not in _char_map)
+    for x, replacement in _char_map.items():
+        if ord(x) < 128:
+            table[ord(x)] = None if replacement in deletechars else replacement
+    byte_table = bytes(
+        ord(table[x]) if table.get(x) else x for x in range(256))
+    byte_deletechars = bytes(x for x in range(256) if x in table and table[x] is None)
+
+    def cleaner(number):
+        if not isinstance(number, (bytes, bytearray, memoryview)):
+            raise InvalidFormat()
+        return bytes(number).translate(byte_table, byte_deletechars)
+
+    return cleaner
 
 
 def clean(number, deletechars=''):
@@ -165,20 +221,187 @@ def clean(number, deletechars=''):
     '1-2-3-4'
     """
     try:
-        number = ''.join(x for x in number)
-    except Exception:  # noqa: B902
-        raise InvalidFormat()
-    number = _clean_chars(number)
-    return ''.join(x for x in number if x not in deletechars)
+        cleaner = _cleaners[deletechars]
+    except KeyError:
+        cleaner = _cleaners[deletechars] = _mk_cleaner(deletechars)
+    except TypeError:  # deletechars is not hashable
+        cleaner = _mk_cleaner(deletechars)
+    return cleaner(number)
+
+
+def normaliser(deletechars='', upper=False, prefix=None):
+    """Return a function that can be used to convert numbers to their
+    minimal representation. The function removes the deletechars (like
+    clean()) and surrounding whitespace, optionally converts the number to
+    upper case and removes the prefix (or one of a tuple of prefixes).
+
+    >>> compact = normaliser(' -', upper=True, prefix='HU')
+    >>> compact(' hu-1234 5678 ')
+    '12345678'
+    >>> compact('1234-5678')
+    '12345678'
+    """
+    if deletechars not in _cleaners:
+        _cleaners[deletechars] = _mk_cleaner(deletechars)
+    cleaner = _cleaners[deletechars]
+    prefixes = (prefix,) if isinstance(prefix, str) else tuple(prefix or ())
+
+    def normalise(number):
+        number = cleaner(number).strip()
+        if upper:
+            number = number.upper()
+        for prefix in prefixes:
+            if number.startswith(prefix):
+                return number[len(prefix):]
+        return number
+
+    return normalise
 
 
 def isdigits(number):
     """Check whether the provided string only consists of digits."""
     # This function is meant to replace str.isdigit() which will also return
     # True for all kind of unicode digits which is generally not what we want
+    if isinstance(number, (bytes, bytearray, memoryview)):
+        # bytes.isdigit() only considers ASCII digits
+        return bytes(number).isdigit()
     return bool(_digits_re.match(number))
 
 
+# cache of the tables that are used by byte_values() for each alphabet
+_byte_value_tables = {}
+
+
+def byte_values(number, alphabet='0123456789'):
+    """Return the positions in the alphabet of the bytes of the number (as
+    a bytes object of which the elements are the positions). ValueError is
+    raised if the number contains bytes that are not in the alphabet.
+
+    >>> list(byte_values(b'1907'))
+    [1, 9, 0, 7]
+    >>> list(byte_values(bytearray(b'1AZ'), '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'))
+    [1, 10, 35]
+    """
+    values = bytes(number).translate(_byte_value_table(alphabet))
+    if b'\xff' in values:
+        raise ValueError('invalid byte in number')
+    return values
+
+
+def _byte_value_table(alphabet):
+    """Return a translation table that maps bytes to their position in the
+    alphabet and bytes that are not in the alphabet to 255."""
+    try:
+        return _byte_value_tables[alphabet]
+    except KeyError:
+        positions = {}
+        for i, x in enumerate(alphabet.encode('ascii')):
+            positions.setdefault(x, i)
+        table = _byte_value_tables[alphabet] = bytes(
+            positions.get(x, 255) for x in range(256))
+        return table
+
+
+def digit_matrix(numbers, alphabet='0123456789'):
+    """Convert a NumPy array of numbers to a 2-D uint8 matrix of the
+    positions of the characters in the alphabet (one row per number).
+
+    The numbers can be a 1-D array of fixed-width strings or bytes or a 2-D
+    array of digit values. None is returned if numbers is not a NumPy array
+    so callers can fall back to handling the numbers one by one. ValueError
+    is raised if any of the numbers contains characters that are not in the
+    alphabet (this includes the padding of strings that are shorter than the
+    width of the array).
+    """
+    if type(numbers).__module__ != 'numpy':
+        return None
+    import numpy
+    numbers = numpy.asarray(numbers)
+    if numbers.dtype.kind in 'US' and numbers.ndim == 1:
+        # view the characters of the strings as a matrix of code points
+        width = numbers.dtype.itemsize // (4 if numbers.dtype.kind == 'U' else 1)
+        codes = numpy.ascontiguousarray(numbers).view(
+            numpy.uint32 if numbers.dtype.kind == 'U' else numpy.uint8)
+        codes = codes.reshape(len(numbers), width)
+        if codes.size and codes.max() > 255:
+            raise ValueError('invalid character in number')
+        table = numpy.frombuffer(_byte_value_table(alphabet), dtype=numpy.uint8)
+        values = table[codes]
+        if (values == 255).any():
+            raise ValueError('invalid character in number')
+        return values
+    if numbers.dtype.kind in 'iu' and numbers.ndim == 2:
+        if numbers.size and (numbers.min() < 0 or numbers.max() >= len(alphabet)):
+            raise ValueError('invalid digit in number')
+        return numbers.astype(numpy.uint8)
+    raise ValueError('unsupported array of numbers')
+
+
+def weighted_checksum(weights, modulus, alphabet='0123456789',
+                      check_digits=None, reverse=False, repeat=False):
+    """Return a function that calculates the sum of the values of the
+    characters of a number multiplied by the weights, modulo the modulus.
+
+    The value of a character is its position in the alphabet. The weights
+    are applied from the left (or from the right if reverse is set) and
+    characters without a weight are ignored unless repeat is set, in which
+    case the weights are repeated. If check_digits is set the remainder is
+    looked up in it (e.g. to convert it to a check digit). The function has
+    a many() attribute that calculates the checksums of a sequence of
+    numbers (NumPy arrays of numbers are handled in a vectorised manner).
+
+    >>> calc_check_digit = weighted_checksum(
+    ...     (3, 1), 10, check_digits='0987654321', reverse=True, repeat=True)
+    >>> calc_check_digit('400638133393')
+    '1'
+    >>> calc_check_digit.many(['400638133393', '9638507'])
+    ['1', '4']
+    """
+    weights = tuple(weights)
+    values = {}
+    for i, x in enumerate(alphabet):
+        values.setdefault(x, i)
+    values = values.__getitem__
+
+    def checksum(number):
+        if reverse:
+            number = number[::-1]
+        if isinstance(number, (bytes, bytearray, memoryview)):
+            digits = byte_values(number, alphabet)
+        else:
+            digits = map(values, number)
+        try:
+            total = sum(map(mul, itertools.cycle(weights) if repeat else weights, digits))
+        except KeyError:
+            if alphabet != '0123456789':
+                raise ValueError('invalid character in number')
+            # handle other characters that int() accepts (e.g. other digits)
+            total = sum(map(mul, itertools.cycle(weights) if repeat else weights, map(int, number)))
+        if check_digits is None:
+            return total % modulus
+        return check_digits[total % modulus]
+
+    def many(numbers):
+        matrix = digit_matrix(numbers, alphabet)
+        if matrix is None:
+            return [checksum(number) for number in numbers]
+        import numpy
+        if reverse:
+            matrix = matrix[:, ::-1]
+        if repeat:
+            factors = numpy.resize(numpy.array(weights, dtype=numpy.int64), matrix.shape[1])
+        else:
+            factors = numpy.array(weights[:matrix.shape[1]], dtype=numpy.int64)
+            matrix = matrix[:, :len(factors)]
+        remainders = matrix.astype(numpy.int64).dot(factors) % modulus
+        if check_digits is None:
+            return remainders
+        return numpy.array(list(check_digits))[remainders]
+
+    checksum.many = many
+    return checksum
+
+
 def to_unicode(text):
     """DEPRECATED: Will be removed in an upcoming release."""  # noqa: D40
     warnings.warn(
@@ -192,8 +415,19 @@ def to_unicode(text):
     return text
 
 
-def get_number_modules(base='stdnum'):
-    """Yield all the number validation modules under the specified module."""
+# information on a number module that is stored in the registry
+RegistryEntry = namedtuple(
+    'RegistryEntry', ['name', 'description', 'countries', 'capabilities'])
+
+
+# the (lazily loaded) registry of number modules
+_module_registry = None
+
+
+def _walk_number_modules(base):
+    """Import and yield all the number validation modules under the
+    specified module."""
+    import pkgutil
     __import__(base)
     module = sys.modules[base]
     # we ignore deprecation warnings from transitional modules
@@ -207,13 +441,305 @@ def get_number_modules(base='stdnum'):
                 yield module
 
 
+def _get_registry_entry(module):
+    """Return the registry entry for the number module."""
+    import inspect
+    parts = module.__name__.split('.')
+    return RegistryEntry(
+        module.__name__,
+        get_module_name(module),
+        (parts[1].rstrip('_'),) if len(parts) > 2 else (),
+        tuple(sorted(
+            name for name, value in vars(module).items()
+            if not name.startswith('_') and inspect.isfunction(value) and
+            value.__module__ != __name__)))
+
+
+def _build_module_registry():
+    """Build the registry of number modules by importing all modules."""
+    return tuple(
+        _get_registry_entry(module)
+        for module in _walk_number_modules('stdnum'))
+
+
+def get_module_registry():
+    """Return the registry of number modules without importing them.
+
+    The registry is a tuple of RegistryEntry tuples with the module name,
+    the short description, the country codes and the names of the functions
+    of each number module (e.g. 'format', 'info' or online checks such as
+    'check_vies'). It is read from the generated stdnum._registry module
+    and is only built by importing all number modules if that does not match
+    the version of stdnum.
+    """
+    global _module_registry
+    if _module_registry is None:
+        from stdnum import __version__, _registry
+        if _registry.version == __version__:
+            _module_registry = tuple(RegistryEntry(*entry) for entry in _registry.modules)
+        else:
+            _module_registry = _build_module_registry()
+    return _module_registry
+
+
+def get_number_modules(base='stdnum'):
+    """Yield all the number validation modules under the specified module."""
+    if base != 'stdnum':
+        yield from _walk_number_modules(base)
+        return
+    # the modules are listed in the registry
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=DeprecationWarning, module=r'stdnum\..*')
+        for entry in get_module_registry():
+            yield importlib.import_module(entry.name)
+
+
+# the format of the compact representation that a number module accepts: the
+# compact() function as arguments for clean(), the str methods that are
+# called and the prefixes that are removed, the possible lengths and prefixes
+# (None if not known) and the (start, end) parts that may only have digits
+ModuleFormat = namedtuple(
+    'ModuleFormat', ['name', 'deletechars', 'methods', 'strip_prefixes',
+                     'lengths', 'prefixes', 'digits'])
+
+
+# the longest compact number for which the lengths that modules accept are
+# determined (longer numbers are checked with all modules)
+_max_format_length = 256
+
+
+# the (lazily loaded) formats of number modules and the filter over them
+_module_formats = None
+_detect_filter = None
+
+
+def _get_module_formats():
+    """Return the formats of the number modules that are stored in the
+    generated stdnum._registry module. If the registry is outdated no
+    formats are returned so all modules are checked."""
+    global _module_formats
+    if _module_formats is None:
+        from stdnum import __version__, _registry
+        if _registry.version == __version__:
+            _module_formats = tuple(ModuleFormat(*format) for format in _registry.formats)
+        else:
+            _module_formats = ()
+    return _module_formats
+
+
+def _build_format_index(names):
+    """Return the index of the formats of the named modules that is used by
+    format_filter(). The modules are grouped by the arguments to clean() and
+    the str methods that compact() calls and then by the prefixes that
+    compact() removes. For each group the modules are listed by length with
+    the modules that accept any length separately. The modules of which the
+    format is not known are returned separately."""
+    formats = dict((entry.name, entry) for entry in _get_module_formats())
+    groups = {}
+    unknown = []
+    for order, name in enumerate(names):
+        module_format = formats.get(name)
+        if module_format is None:
+            unknown.append((order, name, None, ()))
+            continue
+        subgroups = groups.setdefault(module_format[1:3], {})
+        by_length, any_length = subgroups.setdefault(module_format.strip_prefixes, ({}, []))
+        entry = (order, name, module_format.prefixes, module_format.digits)
+        if module_format.lengths is None:
+            any_length.append(entry)
+        else:
+            for length in module_format.lengths:
+                by_length.setdefault(length, []).append(entry)
+    index = []
+    for (deletechars, methods), subgroups in sorted(groups.items()):
+        # if the number does not start with any of the prefixes that are
+        # removed the modules of all subgroups can be looked up at once
+        by_length = {}
+        for subgroup, _any_length in subgroups.values():
+            for length, entries in subgroup.items():
+                by_length.setdefault(length, []).extend(entries)
+        any_length = [entry for _by_length, entries in subgroups.values() for entry in entries]
+        strip_prefixes = tuple(sorted(set(prefix for prefixes in subgroups for prefix in prefixes)))
+        index.append((deletechars, methods, strip_prefixes, (by_length, any_length), sorted(subgroups.items())))
+    return index, unknown
+
+
+def _remove_prefix(value, prefixes):
+    """Remove the first of the prefixes that the value starts with."""
+    for prefix in prefixes:
+        if value.startswith(prefix):
+            return value[len(prefix):]
+    return value
+
+
+def _lookup_format_index(value, by_length, any_length):
+    """Return the entries of the modules that accept the length of the
+    value."""
+    if len(value) > _max_format_length:
+        # the lengths are only known up to a maximum
+        return list(set(any_length).union(*by_length.values()))
+    return by_length.get(len(value), []) + any_length
+
+
+def format_filter(names):
+    """Return a function that returns the names of the modules that could
+    accept a number, based on the formats of the compact numbers that the
+    modules accept (the lengths, prefixes and parts with only digits). The
+    names are returned in the order in which they were passed. Modules of
+    which the format is not known are always returned.
+
+    >>> candidates = format_filter(['stdnum.ean', 'stdnum.grid', 'stdnum.isin', 'stdnum.luhn'])
+    >>> candidates('4006381333931')
+    ['stdnum.ean', 'stdnum.luhn']
+    >>> candidates('GRID: A1-2425G-ABC1234002-M')
+    ['stdnum.grid', 'stdnum.luhn']
+    """
+    index, unknown = _build_format_index(names)
+    everything = sorted(unknown + [
+        entry for _deletechars, _methods, _strip_prefixes, (by_length, any_length), _subgroups in index
+        for entry in set(any_length).union(*by_length.values())])
+
+    def candidates(number):
+        if not isinstance(number, str):
+            # the formats are only known for strings
+            return [entry[1] for entry in everything]
+        result = list(unknown)
+        for deletechars, methods, strip_prefixes, merged, subgroups in index:
+            # do what compact() does for the modules in the group
+            value = clean(number, deletechars)
+            if 'strip' in methods:
+                value = value.strip()
+            if 'upper' in methods:
+                value = value.upper()
+            if strip_prefixes and value.startswith(strip_prefixes):
+                lookups = [
+                    (_remove_prefix(value, strip_prefixes), group)
+                    for strip_prefixes, group in subgroups]
+            else:
+                lookups = [(value, merged)]
+            for value, group in lookups:
+                for entry in _lookup_format_index(value, *group):
+                    prefixes, digits = entry[2:]
+                    if prefixes and not value.startswith(prefixes):
+                        continue
+                    if digits and not all(isdigits(value[start:end]) for start, end in digits):
+                        continue
+                    result.append(entry)
+        return [entry[1] for entry in sorted(result)]
+
+    return candidates
+
+
+def _get_format_rank(module_format):
+    """Return the sort key that ranks modules that accept fewer prefixes and
+    lengths first."""
+    if module_format is None:
+        return (3, 0)
+    if module_format.lengths is None:
+        return (1 if module_format.prefixes else 2, 0)
+    return (0 if module_format.prefixes else 1, len(module_format.lengths))
+
+
+def detect(number):
+    """Return the number modules that consider the number valid, with the
+    modules with the most specific formats first.
+
+    Not all modules are checked. The formats that the modules accept (the
+    lengths, prefixes and the parts that only have digits) are used to skip
+    the modules that could never accept the number.
+
+    >>> [module.__name__ for module in detect('NL91 ABNA 0417 1643 00')]
+    ['stdnum.iban']
+    """
+    global _detect_filter
+    if _detect_filter is None:
+        formats = dict((entry.name, entry) for entry in _get_module_formats())
+        _detect_filter = format_filter(sorted(
+            (entry.name for entry in get_module_registry()),
+            key=lambda name: _get_format_rank(formats.get(name))))
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=DeprecationWarning, module=r'stdnum\..*')
+        modules = (
+            sys.modules.get(name) or importlib.import_module(name)
+            for name in _detect_filter(number))
+        return [module for module in modules if module.is_valid(number)]
+
+
+def check_many(module, numbers, **kwargs):
+    """Check a sequence of numbers with the number module. This returns a
+    list with for each number the value that validate() would return or the
+    exception class (e.g. InvalidChecksum) that validate() would raise. Any
+    keyword arguments are passed to the module.
+
+    This uses the check_many() function of the module if it has one or
+    otherwise the check() or validate() function for each number.
+
+    >>> from stdnum import isbn
+    >>> check_many(isbn, ['978-9024538270', '978-9024538271', '12345'])
+    ['9789024538270', <class 'stdnum.exceptions.InvalidChecksum'>, <class 'stdnum.exceptions.InvalidLength'>]
+    """
+    if hasattr(module, 'check_many'):
+        return module.check_many(numbers, **kwargs)
+    check = getattr(module, 'check', None) or module.validate
+    results = []
+    for number in numbers:
+        try:
+            results.append(check(number, **kwargs))
+        except ValidationError as e:
+            results.append(type(e))
+    return results
+
+
+def validate_many(module, numbers, **kwargs):
+    """Validate a sequence of numbers with the number module. This returns
+    three lists of the same length as numbers: the values that validate()
+    returns (None for invalid numbers), whether the numbers are valid and
+    the exception classes of invalid numbers (None for valid numbers).
+
+    >>> from stdnum import ean
+    >>> values, valid, errors = validate_many(ean, ['4006381333931', '4006381333932'])
+    >>> values
+    ['4006381333931', None]
+    >>> valid
+    [True, False]
+    >>> errors
+    [None, <class 'stdnum.exceptions.InvalidChecksum'>]
+    """
+    values = []
+    valid = []
+    errors = []
+    for result in check_many(module, numbers, **kwargs):
+        if isinstance(result, type):
+            values.append(None)
+            valid.append(False)
+            errors.append(result)
+        else:
+            values.append(result)
+            valid.append(True)
+            errors.append(None)
+    return values, valid, errors
+
+
+def is_valid_many(module, numbers, **kwargs):
+    """Check whether each number in the sequence is valid according to the
+    number module. A list of booleans is returned.
+
+    >>> from stdnum import luhn
+    >>> is_valid_many(luhn, ['4111111111111111', '4111111111111112', ''])
+    [True, False, False]
+    """
+    return [not isinstance(result, type) for result in check_many(module, numbers, **kwargs)]
+
+
 def get_module_name(module):
     """Return the short description of the number."""
+    import pydoc
     return pydoc.splitdoc(pydoc.getdoc(module))[0].strip('.')
 
 
 def get_module_description(module):
     """Return a description of the number."""
+    import pydoc
     doc = pydoc.splitdoc(pydoc.getdoc(module))[1]
     # remove the doctests
     return _strip_doctest_re.sub('', doc).strip()
@@ -250,6 +776,7 @@ def _get_zeep_soap_client(wsdlurl, timeout, verify):  # pragma: no cover (not pa
 
 
 def _get_suds_soap_client(wsdlurl, timeout, verify):  # pragma: no cover (not part of normal test suite)
+    import ssl
     from urllib.request import HTTPSHandler, getproxies
 
     from suds.client import Client
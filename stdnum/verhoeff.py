@@ -46,6 +46,7 @@ InvalidChecksum: ...
 """
 
 from stdnum.exceptions import *
+from stdnum.util import byte_values, digit_matrix
 
 
 # These are the multiplication and permutation tables used in the
@@ -78,7 +79,10 @@ def checksum(number):
     """Calculate the Verhoeff checksum over the provided number. The checksum
     is returned as an int. Valid numbers should have a checksum of 0."""
     # transform number list
-    number = tuple(int(n) for n in reversed(str(number)))
+    if isinstance(number, (bytes, bytearray, memoryview)):
+        number = tuple(reversed(byte_values(number)))
+    else:
+        number = tuple(int(n) for n in reversed(str(number)))
     # calculate checksum
     check = 0
     for i, n in enumerate(number):
@@ -86,28 +90,59 @@ def checksum(number):
     return check
 
 
-def validate(number):
-    """Check if the number provided passes the Verhoeff checksum."""
+def checksum_many(numbers):
+    """Calculate the Verhoeff checksums of a sequence of numbers. If numbers
+    is a NumPy array of fixed-width strings or a 2-D matrix of digit values
+    the checksums of all numbers are calculated at once and returned as a
+    NumPy array, otherwise a list of checksums is returned."""
+    values = digit_matrix(numbers)
+    if values is None:
+        return [checksum(number) for number in numbers]
+    import numpy
+    multiplication_table = numpy.array(_multiplication_table, dtype=numpy.uint8)
+    permutation_table = numpy.array(_permutation_table, dtype=numpy.uint8)
+    # go over the columns from the right
+    check = numpy.zeros(len(values), dtype=numpy.uint8)
+    for i in range(values.shape[1]):
+        check = multiplication_table[
+            check, permutation_table[i % 8][values[:, -1 - i]]]
+    return check
+
+
+def check(number):
+    """Check if the number provided passes the Verhoeff checksum.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers."""
     if not bool(number):
-        raise InvalidFormat()
+        return InvalidFormat
     try:
         valid = checksum(number) == 0
     except Exception:  # noqa: B902
-        raise InvalidFormat()
+        return InvalidFormat
     if not valid:
-        raise InvalidChecksum()
+        return InvalidChecksum
     return number
 
 
+def validate(number):
+    """Check if the number provided passes the Verhoeff checksum."""
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
+
+
 def is_valid(number):
     """Check if the number provided passes the Verhoeff checksum."""
-    try:
-        return bool(validate(number))
-    except ValidationError:
-        return False
+    return not isinstance(check(number), type)
 
 
 def calc_check_digit(number):
     """Calculate the extra digit that should be appended to the number to
     make it a valid number."""
-    return str(_multiplication_table[checksum(str(number) + '0')].index(0))
+    if isinstance(number, (bytes, bytearray, memoryview)):
+        number = bytes(number) + b'0'
+    else:
+        number = str(number) + '0'
+    return str(_multiplication_table[checksum(number)].index(0))
@@ -104,25 +104,42 @@ def get_citizenship(number):
         raise InvalidComponent()
 
 
-def validate(number):
+def check(number):
     """Check if the number is a valid South African ID number.
 
     This checks the length, formatting and check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers.
     """
     number = compact(number)
     if not isdigits(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if len(number) != 13:
-        raise InvalidLength()
-    get_birth_date(number)
-    get_citizenship(number)
-    return luhn.validate(number)
+        return InvalidLength
+    try:
+        get_birth_date(number)
+        get_citizenship(number)
+    except ValidationError as e:
+        return type(e)
+    return luhn.check(number)
+
+
+def validate(number):
+    """Check if the number is a valid South African ID number.
+
+    This checks the length, formatting and check digit.
+    """
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
 
 
 def is_valid(number):
     """Check if the number is a valid South African ID number."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -57,25 +57,39 @@ def compact(number):
     return clean(number, ' -/').upper().strip()
 
 
-def validate(number):
+def check(number):
     """Check if the number is a valid South Africa Tax Reference Number.
 
     This checks the length, formatting and check digit.
+
+    Instead of raising an exception the exception class (e.g.
+    InvalidChecksum) is returned for invalid numbers.
     """
     number = compact(number)
     if len(number) != 10:
-        raise InvalidLength()
+        return InvalidLength
     if not isdigits(number):
-        raise InvalidFormat()
+        return InvalidFormat
     if number[0] not in '01239':
-        raise InvalidComponent()
-    return luhn.validate(number)
+        return InvalidComponent
+    return luhn.check(number)
+
+
+def validate(number):
+    """Check if the number is a valid South Africa Tax Reference Number.
+
+    This checks the length, formatting and check digit.
+    """
+    result = check(number)
+    if isinstance(result, type):
+        raise result()
+    return result
 
 
 def is_valid(number):
     """Check if the number is a valid South Africa Tax Reference Number."""
     try:
-        return bool(validate(number))
+        return not isinstance(check(number), type)
     except ValidationError:
         return False
 
@@ -24,6 +24,7 @@ Financial Telecommunication which is the official IBAN registrar) to get
 the data needed to correctly parse and validate IBANs."""
 
 import csv
+import datetime
 from collections import defaultdict
 
 import requests
@@ -48,6 +49,7 @@ if __name__ == '__main__':
     response.raise_for_status()
     print('# generated from swift_standards_infopaper_ibanregistry_1.txt,')
     print('# downloaded from %s' % download_url)
+    print('# on %s' % datetime.datetime.utcnow())
     values = defaultdict(dict)
     # the file is CSV but the data is in columns instead of rows
     for row in csv.reader(response.iter_lines(decode_unicode=True), delimiter='\t', quotechar='"'):
@@ -21,6 +21,7 @@
 
 """This extracts a IMSI country and operator code from Wikipedia."""
 
+import datetime
 import os
 import re
 import sys
@@ -213,6 +214,7 @@ if __name__ == '__main__':
     # print header
     print('# generated from various sources')
     print('# https://en.wikipedia.org/wiki/Mobile_country_code')
+    print('# on %s' % datetime.datetime.utcnow())
     # build an ordered list of mccs
     mcc_list = list(data.keys())
     mcc_list.sort()
@@ -25,6 +25,7 @@ and produces data files that can be use by python-stdnum to look up
 manufacturers by MAC address."""
 
 import csv
+import datetime
 from collections import defaultdict
 from itertools import chain
 
@@ -89,6 +90,7 @@ if __name__ == '__main__':
     print('# %s' % mal_url)
     print('# %s' % mam_url)
     print('# %s' % mas_url)
+    print('# on %s' % datetime.datetime.utcnow())
     # output full-length assignments
     for a, o in sorted((tuple(sorted(a)), o) for o, a in toplevel.items()):
         print('%s o="%s"' % (join_items(a), o))